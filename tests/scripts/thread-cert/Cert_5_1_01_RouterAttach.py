@@ -40,6 +40,9 @@ from pktverify.null_field import nullField
 LEADER = 1
 ROUTER = 2
 
+PARENT_REQUEST_TLVS = frozenset({CHALLENGE_TLV, MODE_TLV, SCAN_MASK_TLV, VERSION_TLV})
+ADVERTISEMENT_TLVS = frozenset({LEADER_DATA_TLV, ROUTE64_TLV, SOURCE_ADDRESS_TLV})
+
 # Test Purpose and Description:
 # -----------------------------
 # The purpose of this test case is to show that the Leader is able to form
@@ -114,7 +117,7 @@ class Cert_5_1_01_RouterAttach(thread_cert.TestCase):
                               LEADER_DATA_TLV,
                               ROUTE64_TLV,
                               SOURCE_ADDRESS_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.ipv6.hlim == 255).\
             must_next()
 
@@ -134,15 +137,10 @@ class Cert_5_1_01_RouterAttach(thread_cert.TestCase):
         pkts.filter_wpan_src64(ROUTER).\
             filter_LLARMA().\
             filter_mle_cmd(MLE_PARENT_REQUEST).\
-            filter(lambda p: {
-                              CHALLENGE_TLV,
-                              MODE_TLV,
-                              SCAN_MASK_TLV,
-                              VERSION_TLV
-                              } <= set(p.mle.tlv.type) and\
-                   p.ipv6.hlim == 255 and\
+            filter(lambda p: p.ipv6.hlim == 255 and\
                    p.mle.tlv.scan_mask.r == 1 and\
-                   p.mle.tlv.scan_mask.e == 0).\
+                   p.mle.tlv.scan_mask.e == 0 and\
+                   PARENT_REQUEST_TLVS <= p.mle_tlv_types).\
             must_next()
 
         # Step 3: Leader responds with a MLE Parent Response.
@@ -169,7 +167,7 @@ class Cert_5_1_01_RouterAttach(thread_cert.TestCase):
                               RESPONSE_TLV,
                               SOURCE_ADDRESS_TLV,
                               VERSION_TLV
-                               } <= set(p.mle.tlv.type)).\
+                               } <= p.mle_tlv_types).\
                    must_next()
 
         # Step 4: Router sends a MLE Child ID Request.
@@ -199,7 +197,7 @@ class Cert_5_1_01_RouterAttach(thread_cert.TestCase):
                               ADDRESS16_TLV,
                               NETWORK_DATA_TLV,
                               VERSION_TLV
-                    } <= set(p.mle.tlv.type) and\
+                    } <= p.mle_tlv_types and\
                    p.mle.tlv.addr16 is nullField and\
                    p.thread_nwd.tlv.type is nullField).\
                    must_next()
@@ -222,13 +220,13 @@ class Cert_5_1_01_RouterAttach(thread_cert.TestCase):
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV,
                               ROUTE64_TLV
-                              } <= set(p.mle.tlv.type) or\
+                              } <= p.mle_tlv_types or\
                              {
                               ADDRESS16_TLV,
                               LEADER_DATA_TLV,
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV
-                               } <= set(p.mle.tlv.type)).\
+                               } <= p.mle_tlv_types).\
                    must_next()
 
         # Step 6: Router sends an Address Solicit Request.
@@ -285,12 +283,7 @@ class Cert_5_1_01_RouterAttach(thread_cert.TestCase):
         pkts.filter_wpan_src64(LEADER).\
             filter_LLANMA().\
             filter_mle_cmd(MLE_ADVERTISEMENT).\
-            filter(lambda p: {
-                              LEADER_DATA_TLV,
-                              ROUTE64_TLV,
-                              SOURCE_ADDRESS_TLV
-                              } == set(p.mle.tlv.type) and\
-                   p.ipv6.hlim == 255).\
+            filter(lambda p: p.ipv6.hlim == 255 and ADVERTISEMENT_TLVS == p.mle_tlv_types).\
             must_next()
 
         # Step 11: DUT responds with ICMPv6 Echo Reply
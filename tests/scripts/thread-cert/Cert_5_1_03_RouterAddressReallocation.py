@@ -143,7 +143,7 @@ class Cert_5_1_03_RouterAddressReallocation(thread_cert.TestCase):
                                       MODE_TLV,
                                       SCAN_MASK_TLV,
                                       VERSION_TLV
-                                      } <= set(p.mle.tlv.type) and\
+                                      } <= p.mle_tlv_types and\
                            p.ipv6.hlim == 255 and\
                            p.mle.tlv.scan_mask.r == 1 and\
                            p.mle.tlv.scan_mask.e == 1).\
@@ -173,7 +173,7 @@ class Cert_5_1_03_RouterAddressReallocation(thread_cert.TestCase):
                               MODE_TLV,
                               SCAN_MASK_TLV,
                               VERSION_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.mle.tlv.scan_mask.r == 1 and\
                    p.mle.tlv.scan_mask.e == 0 and\
                    p.ipv6.hlim == 255).\
@@ -201,7 +201,7 @@ class Cert_5_1_03_RouterAddressReallocation(thread_cert.TestCase):
                               TIMEOUT_TLV,
                               TLV_REQUEST_TLV,
                               VERSION_TLV
-            } <= set(p.mle.tlv.type)).\
+            } <= p.mle_tlv_types).\
                    must_next()
         _pkt.must_not_verify(lambda p: (ADDRESS_REGISTRATION_TLV) in p.mle.tlv.type)
 
@@ -148,7 +148,7 @@ class Cert_5_1_04_RouterAddressReallocation(thread_cert.TestCase):
                                       MODE_TLV,
                                       SCAN_MASK_TLV,
                                       VERSION_TLV
-                                      } <= set(p.mle.tlv.type) and\
+                                      } <= p.mle_tlv_types and\
                            p.ipv6.hlim == 255 and\
                            p.mle.tlv.scan_mask.r == 1 and\
                            p.mle.tlv.scan_mask.e == 1
@@ -171,7 +171,7 @@ class Cert_5_1_04_RouterAddressReallocation(thread_cert.TestCase):
                                   MODE_TLV,
                                   SCAN_MASK_TLV,
                                   VERSION_TLV
-                                  } <= set(p.mle.tlv.type) and\
+                                  } <= p.mle_tlv_types and\
                        p.ipv6.hlim == 255 and\
                        p.mle.tlv.scan_mask.r == 1 and\
                        p.mle.tlv.scan_mask.e == 0
@@ -215,7 +215,7 @@ class Cert_5_1_04_RouterAddressReallocation(thread_cert.TestCase):
                               RESPONSE_TLV,
                               SOURCE_ADDRESS_TLV,
                               VERSION_TLV
-                             } <= set(p.mle.tlv.type) and\
+                             } <= p.mle_tlv_types and\
                    p.mle.tlv.conn.id_seq != _pkt_id.mle.tlv.conn.id_seq
                    ).\
             must_next()
@@ -229,13 +229,13 @@ class Cert_5_1_04_RouterAddressReallocation(thread_cert.TestCase):
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV,
                               ROUTE64_TLV
-                              } <= set(p.mle.tlv.type) or\
+                              } <= p.mle_tlv_types or\
                              {
                               ADDRESS16_TLV,
                               LEADER_DATA_TLV,
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV
-                             } <= set(p.mle.tlv.type)\
+                             } <= p.mle_tlv_types\
                    ).\
             must_next()
 
@@ -136,7 +136,7 @@ class Cert_5_1_05_RouterAddressTimeout(thread_cert.TestCase):
                               TLV_REQUEST_TLV,
                               ADDRESS16_TLV,
                               ROUTE64_TLV
-                              } <= set(p.mle.tlv.type)\
+                              } <= p.mle_tlv_types\
                    ).\
             must_next()
 
@@ -167,7 +167,7 @@ class Cert_5_1_05_RouterAddressTimeout(thread_cert.TestCase):
                               RESPONSE_TLV,
                               SOURCE_ADDRESS_TLV,
                               VERSION_TLV
-                             } <= set(p.mle.tlv.type)
+                             } <= p.mle_tlv_types
                    ).\
             must_next()
 
@@ -180,13 +180,13 @@ class Cert_5_1_05_RouterAddressTimeout(thread_cert.TestCase):
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV,
                               ROUTE64_TLV
-                              } <= set(p.mle.tlv.type) or\
+                              } <= p.mle_tlv_types or\
                              {
                               ADDRESS16_TLV,
                               LEADER_DATA_TLV,
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV
-                             } <= set(p.mle.tlv.type)\
+                             } <= p.mle_tlv_types\
                    ).\
             must_next()
 
@@ -230,7 +230,7 @@ class Cert_5_1_05_RouterAddressTimeout(thread_cert.TestCase):
                               TLV_REQUEST_TLV,
                               ADDRESS16_TLV,
                               ROUTE64_TLV
-                              } <= set(p.mle.tlv.type)\
+                              } <= p.mle_tlv_types\
                    ).\
             must_next()
 
@@ -259,7 +259,7 @@ class Cert_5_1_05_RouterAddressTimeout(thread_cert.TestCase):
                               RESPONSE_TLV,
                               SOURCE_ADDRESS_TLV,
                               VERSION_TLV
-                             } <= set(p.mle.tlv.type)
+                             } <= p.mle_tlv_types
                    ).\
             must_next()
 
@@ -272,13 +272,13 @@ class Cert_5_1_05_RouterAddressTimeout(thread_cert.TestCase):
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV,
                               ROUTE64_TLV
-                              } <= set(p.mle.tlv.type) or\
+                              } <= p.mle_tlv_types or\
                              {
                               ADDRESS16_TLV,
                               LEADER_DATA_TLV,
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV
-                             } <= set(p.mle.tlv.type)\
+                             } <= p.mle_tlv_types\
                    ).\
             must_next()
 
@@ -131,7 +131,7 @@ class Cert_5_1_06_RemoveRouterId(thread_cert.TestCase):
                               MODE_TLV,
                               SCAN_MASK_TLV,
                               VERSION_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.ipv6.hlim == 255 and\
                    p.mle.tlv.scan_mask.r == 1 and\
                    p.mle.tlv.scan_mask.e == 0).\
@@ -149,7 +149,7 @@ class Cert_5_1_06_RemoveRouterId(thread_cert.TestCase):
                               ADDRESS16_TLV,
                               NETWORK_DATA_TLV,
                               VERSION_TLV
-                    } <= set(p.mle.tlv.type) and\
+                    } <= p.mle_tlv_types and\
                    p.mle.tlv.addr16 is nullField and\
                    p.thread_nwd.tlv.type is nullField).\
                    must_next()
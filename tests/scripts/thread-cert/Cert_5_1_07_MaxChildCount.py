@@ -201,7 +201,7 @@ class Cert_5_1_07_MaxChildCount(thread_cert.TestCase):
                                   RESPONSE_TLV,
                                   SOURCE_ADDRESS_TLV,
                                   VERSION_TLV
-                                } <= set(p.mle.tlv.type)
+                                } <= p.mle_tlv_types
                        ).\
                 must_next()
             _pkts.filter_mle_cmd(MLE_CHILD_ID_RESPONSE).\
@@ -211,7 +211,7 @@ class Cert_5_1_07_MaxChildCount(thread_cert.TestCase):
                                   ADDRESS16_TLV,
                                   NETWORK_DATA_TLV,
                                   ADDRESS_REGISTRATION_TLV
-                        } <= set(p.mle.tlv.type) and\
+                        } <= p.mle_tlv_types and\
                        p.mle.tlv.addr16 is not nullField and\
                        p.thread_nwd.tlv.type is not None and\
                        p.thread_meshcop.tlv.type is not None
@@ -230,7 +230,7 @@ class Cert_5_1_07_MaxChildCount(thread_cert.TestCase):
                                   RESPONSE_TLV,
                                   SOURCE_ADDRESS_TLV,
                                   VERSION_TLV
-                                } <= set(p.mle.tlv.type)
+                                } <= p.mle_tlv_types
                        ).\
                 must_next()
 
@@ -241,7 +241,7 @@ class Cert_5_1_07_MaxChildCount(thread_cert.TestCase):
                                   ADDRESS16_TLV,
                                   NETWORK_DATA_TLV,
                                   ADDRESS_REGISTRATION_TLV
-                        } <= set(p.mle.tlv.type) and\
+                        } <= p.mle_tlv_types and\
                        p.mle.tlv.addr16 is not nullField and\
                        p.thread_meshcop.tlv.type is not None
                        ).\
@@ -150,7 +150,7 @@ class Cert_5_1_09_REEDAttachConnectivity(thread_cert.TestCase):
                               MODE_TLV,
                               SCAN_MASK_TLV,
                               VERSION_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.ipv6.hlim == 255 and\
                    p.mle.tlv.scan_mask.r == 1 and\
                    p.mle.tlv.scan_mask.e == 0
@@ -185,7 +185,7 @@ class Cert_5_1_09_REEDAttachConnectivity(thread_cert.TestCase):
                               MODE_TLV,
                               SCAN_MASK_TLV,
                               VERSION_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.ipv6.hlim == 255 and\
                    p.mle.tlv.scan_mask.r == 1 and\
                    p.mle.tlv.scan_mask.e == 1 and\
@@ -229,7 +229,7 @@ class Cert_5_1_09_REEDAttachConnectivity(thread_cert.TestCase):
                                       RESPONSE_TLV,
                                       SOURCE_ADDRESS_TLV,
                                       VERSION_TLV
-                                    } <= set(p.mle.tlv.type) and\
+                                    } <= p.mle_tlv_types and\
                            p.wpan.aux_sec.key_id_mode == 0x2
                            ).\
                     must_next()
@@ -261,7 +261,7 @@ class Cert_5_1_09_REEDAttachConnectivity(thread_cert.TestCase):
                               ADDRESS16_TLV,
                               NETWORK_DATA_TLV,
                               VERSION_TLV
-                    } <= set(p.mle.tlv.type) and\
+                    } <= p.mle_tlv_types and\
                    p.mle.tlv.addr16 is nullField and\
                    p.thread_nwd.tlv.type is nullField and\
                    p.wpan.aux_sec.key_id_mode == 0x2
@@ -137,7 +137,7 @@ class Cert_5_1_10_RouterAttachLinkQuality(thread_cert.TestCase):
                               MODE_TLV,
                               SCAN_MASK_TLV,
                               VERSION_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.ipv6.hlim == 255 and\
                    p.mle.tlv.scan_mask.r == 1 and\
                    p.mle.tlv.scan_mask.e == 0
@@ -170,7 +170,7 @@ class Cert_5_1_10_RouterAttachLinkQuality(thread_cert.TestCase):
                                       RESPONSE_TLV,
                                       SOURCE_ADDRESS_TLV,
                                       VERSION_TLV
-                                    } <= set(p.mle.tlv.type)
+                                    } <= p.mle_tlv_types
                            ).\
                     must_next()
 
@@ -202,7 +202,7 @@ class Cert_5_1_10_RouterAttachLinkQuality(thread_cert.TestCase):
                               ADDRESS16_TLV,
                               NETWORK_DATA_TLV,
                               VERSION_TLV
-                    } <= set(p.mle.tlv.type) and\
+                    } <= p.mle_tlv_types and\
                    p.mle.tlv.addr16 is nullField and\
                    p.thread_nwd.tlv.type is nullField
                    ).\
@@ -122,7 +122,7 @@ class Cert_5_1_12_NewRouterSync(thread_cert.TestCase):
                               LEADER_DATA_TLV,
                               ROUTE64_TLV,
                               SOURCE_ADDRESS_TLV
-                              } == set(p.mle.tlv.type) and\
+                              } == p.mle_tlv_types and\
                    p.ipv6.hlim == 255).\
             must_next()
 
@@ -134,7 +134,7 @@ class Cert_5_1_12_NewRouterSync(thread_cert.TestCase):
                               LEADER_DATA_TLV,
                               ROUTE64_TLV,
                               SOURCE_ADDRESS_TLV
-                              } == set(p.mle.tlv.type) and\
+                              } == p.mle_tlv_types and\
                    p.ipv6.hlim == 255).\
             must_next()
 
@@ -175,7 +175,7 @@ class Cert_5_1_12_NewRouterSync(thread_cert.TestCase):
                                   VERSION_TLV,
                                   TLV_REQUEST_TLV,
                                   LINK_MARGIN_TLV
-                                  } <= set(p.mle.tlv.type) and\
+                                  } <= p.mle_tlv_types and\
                        p.mle.tlv.link_margin is nullField and\
                        (p.wpan.src64 == ROUTER_1 or\
                         p.wpan.src64 == ROUTER_2)
@@ -196,12 +196,12 @@ class Cert_5_1_12_NewRouterSync(thread_cert.TestCase):
                                   RESPONSE_TLV,
                                   SOURCE_ADDRESS_TLV,
                                   VERSION_TLV
-                                  } <= set(p.mle.tlv.type) and\
+                                  } <= p.mle_tlv_types and\
                        p.mle.tlv.link_margin is not nullField
                        ).\
                        must_next()
         if _pkt.mle.cmd == MLE_LINK_ACCEPT_AND_REQUEST:
-            _pkt.must_verify(lambda p: {CHALLENGE_TLV, TLV_REQUEST_TLV} <= set(p.mle.tlv.type))
+            _pkt.must_verify(lambda p: {CHALLENGE_TLV, TLV_REQUEST_TLV} <= p.mle_tlv_types)
 
 
 if __name__ == '__main__':
@@ -122,7 +122,7 @@ class Cert_5_1_13_RouterReset(thread_cert.TestCase):
                               LEADER_DATA_TLV,
                               ROUTE64_TLV,
                               SOURCE_ADDRESS_TLV
-                              } == set(p.mle.tlv.type) and\
+                              } == p.mle_tlv_types and\
                    p.ipv6.hlim == 255
                    ).\
             must_next()
@@ -133,7 +133,7 @@ class Cert_5_1_13_RouterReset(thread_cert.TestCase):
                               LEADER_DATA_TLV,
                               ROUTE64_TLV,
                               SOURCE_ADDRESS_TLV
-                              } == set(p.mle.tlv.type) and\
+                              } == p.mle_tlv_types and\
                    p.ipv6.hlim == 255
                    ).\
             must_next()
@@ -157,7 +157,7 @@ class Cert_5_1_13_RouterReset(thread_cert.TestCase):
                                   TLV_REQUEST_TLV,
                                   ADDRESS16_TLV,
                                   ROUTE64_TLV
-                                  } <= set(p.mle.tlv.type) and\
+                                  } <= p.mle_tlv_types and\
                        p.mle.tlv.addr16 is nullField and \
                        p.mle.tlv.route64.id_mask is nullField
                        ).\
@@ -190,7 +190,7 @@ class Cert_5_1_13_RouterReset(thread_cert.TestCase):
                                   ROUTE64_TLV,
                                   SOURCE_ADDRESS_TLV,
                                   VERSION_TLV
-                                   } <= set(p.mle.tlv.type) and\
+                                   } <= p.mle_tlv_types and\
                        p.mle.tlv.addr16 is not nullField and \
                        p.mle.tlv.route64.id_mask is not nullField and\
                        p.mle.tlv.addr16 == ROUTER_RLOC16 and\
@@ -144,7 +144,7 @@ class Cert_5_2_01_REEDAttach(thread_cert.TestCase):
                               LEADER_DATA_TLV,
                               ROUTE64_TLV,
                               SOURCE_ADDRESS_TLV
-                              } == set(p.mle.tlv.type) and\
+                              } == p.mle_tlv_types and\
                    p.ipv6.hlim == 255
                    ).\
             must_next()
@@ -169,7 +169,7 @@ class Cert_5_2_01_REEDAttach(thread_cert.TestCase):
                               MODE_TLV,
                               SCAN_MASK_TLV,
                               VERSION_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.ipv6.hlim == 255 and\
                    p.mle.tlv.scan_mask.r == 1 and\
                    p.mle.tlv.scan_mask.e == 0).\
@@ -199,7 +199,7 @@ class Cert_5_2_01_REEDAttach(thread_cert.TestCase):
                               RESPONSE_TLV,
                               SOURCE_ADDRESS_TLV,
                               VERSION_TLV
-                               } <= set(p.mle.tlv.type)).\
+                               } <= p.mle_tlv_types).\
                    must_next()
 
         # Step 4: Router_1 must respond with a Child ID Response.
@@ -219,13 +219,13 @@ class Cert_5_2_01_REEDAttach(thread_cert.TestCase):
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV,
                               ROUTE64_TLV
-                              } <= set(p.mle.tlv.type) or\
+                              } <= p.mle_tlv_types or\
                              {
                               ADDRESS16_TLV,
                               LEADER_DATA_TLV,
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV
-                              } <= set(p.mle.tlv.type)
+                              } <= p.mle_tlv_types
                    ).\
                    must_next()
 
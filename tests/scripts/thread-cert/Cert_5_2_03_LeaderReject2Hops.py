@@ -387,7 +387,7 @@ class Cert_5_2_3_LeaderReject2Hops(thread_cert.TestCase):
                               LEADER_DATA_TLV,
                               ROUTE64_TLV,
                               SOURCE_ADDRESS_TLV
-                              } == set(p.mle.tlv.type) and\
+                              } == p.mle_tlv_types and\
                    len(p.mle.tlv.route64.cost) == 32 and\
                    p.ipv6.hlim == 255
                   ).\
@@ -268,7 +268,7 @@ class Cert_5_2_4_REEDUpgrade(thread_cert.TestCase):
                               MODE_TLV,
                               SCAN_MASK_TLV,
                               VERSION_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.ipv6.hlim == 255 and\
                    p.mle.tlv.scan_mask.r == 1 and\
                    p.mle.tlv.scan_mask.e == 0).\
@@ -281,7 +281,7 @@ class Cert_5_2_4_REEDUpgrade(thread_cert.TestCase):
                               MODE_TLV,
                               SCAN_MASK_TLV,
                               VERSION_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.ipv6.hlim == 255 and\
                    p.mle.tlv.scan_mask.r == 1 and\
                    p.mle.tlv.scan_mask.e == 1).\
@@ -301,7 +301,7 @@ class Cert_5_2_4_REEDUpgrade(thread_cert.TestCase):
                               RESPONSE_TLV,
                               SOURCE_ADDRESS_TLV,
                               VERSION_TLV
-                               } <= set(p.mle.tlv.type)).\
+                               } <= p.mle_tlv_types).\
                    must_next()
 
         # Step 8: MED sends MLE Child ID Request to REED
@@ -318,7 +318,7 @@ class Cert_5_2_4_REEDUpgrade(thread_cert.TestCase):
                               ADDRESS16_TLV,
                               NETWORK_DATA_TLV,
                               VERSION_TLV
-                    } <= set(p.mle.tlv.type) and\
+                    } <= p.mle_tlv_types and\
                    p.mle.tlv.addr16 is nullField and\
                    p.thread_nwd.tlv.type is nullField
                    ).\
@@ -360,13 +360,13 @@ class Cert_5_2_4_REEDUpgrade(thread_cert.TestCase):
                                  NETWORK_DATA_TLV,
                                  SOURCE_ADDRESS_TLV,
                                  ROUTE64_TLV
-                                 } <= set(p.mle.tlv.type) or\
+                                 } <= p.mle_tlv_types or\
                                  {
                                  ADDRESS16_TLV,
                                  LEADER_DATA_TLV,
                                  NETWORK_DATA_TLV,
                                  SOURCE_ADDRESS_TLV
-                                 } <= set(p.mle.tlv.type) and\
+                                 } <= p.mle_tlv_types and\
                        p.mle.tlv.source_addr != REED_RLOC16 and\
                        p.mle.tlv.addr16 != MED_RLOC16
                        ).\
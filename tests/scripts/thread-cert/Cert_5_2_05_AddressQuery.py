@@ -43,6 +43,8 @@ BR = 3
 MED = 17
 DUT_REED = 18
 ROUTER_SELECTION_JITTER = 1
+GUA_2001_PREFIX = Bytes('2001')
+GUA_2002_PREFIX = Bytes('2002')
 
 # Test Purpose and Description:
 # -----------------------------
@@ -256,15 +258,15 @@ class Cert_5_2_5_AddressQuery(thread_cert.TestCase):
         MED2002 = ''
 
         for addr in pv.vars['REED_IPADDRS']:
-            if addr.startswith(Bytes('2001')):
+            if addr.startswith(GUA_2001_PREFIX):
                 REED2001 = addr
-            if addr.startswith(Bytes('2002')):
+            if addr.startswith(GUA_2002_PREFIX):
                 REED2002 = addr
 
         for addr in pv.vars['MED_IPADDRS']:
-            if addr.startswith(Bytes('2001')):
+            if addr.startswith(GUA_2001_PREFIX):
                 MED2001 = addr
-            if addr.startswith(Bytes('2002')):
+            if addr.startswith(GUA_2002_PREFIX):
                 MED2002 = addr
 
         # Step 3: Verify topology is formed correctly except REED.
@@ -219,7 +219,7 @@ class Cert_5_2_7_REEDSynchronization_Base(thread_cert.TestCase):
                                       LEADER_DATA_TLV,
                                       SOURCE_ADDRESS_TLV,
                                       VERSION_TLV
-                                      } <= set(p.mle.tlv.type)
+                                      } <= p.mle_tlv_types
                            ).\
                     must_next()
 
@@ -243,7 +243,7 @@ class Cert_5_2_7_REEDSynchronization_Base(thread_cert.TestCase):
                                   RESPONSE_TLV,
                                   SOURCE_ADDRESS_TLV,
                                   VERSION_TLV
-                                   } <= set(p.mle.tlv.type)
+                                   } <= p.mle_tlv_types
                        ).\
                 must_next()
             pkts.filter_wpan_src64(REED).\
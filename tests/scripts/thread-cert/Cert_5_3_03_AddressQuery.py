@@ -203,7 +203,7 @@ class Cert_5_3_3_AddressQuery(thread_cert.TestCase):
         pkts.filter_wpan_src64(ROUTER_2).\
             filter_RLARMA().\
             filter_coap_request(ADDR_QRY_URI, port=MM).\
-            filter(lambda p: p.thread_address.tlv.target_eid == ROUTER_3_MLEID).\
+            filter_fields(thread_address_tlv_target_eid=ROUTER_3_MLEID).\
             must_next()
         _pkt1 = pkts.filter_wpan_src64(ROUTER_3).\
             filter_ipv6_dst(ROUTER_2_RLOC).\
@@ -245,7 +245,7 @@ class Cert_5_3_3_AddressQuery(thread_cert.TestCase):
         pkts.filter_wpan_src64(ROUTER_1).\
             filter_RLARMA().\
             filter_coap_request(ADDR_QRY_URI, port=MM).\
-            filter(lambda p: p.thread_address.tlv.target_eid == MED_MLEID).\
+            filter_fields(thread_address_tlv_target_eid=MED_MLEID).\
             must_next()
         pkts.filter_ipv6_src_dst(ROUTER_2_RLOC, ROUTER_1_RLOC).\
             filter_coap_request(ADDR_NTF_URI, port=MM).\
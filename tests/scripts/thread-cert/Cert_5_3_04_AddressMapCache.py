@@ -190,14 +190,15 @@ class Cert_5_3_4_AddressMapCache(thread_cert.TestCase):
 
         # Step 3: Leader sends Address Notification Messages with RLOC of MED_1, MED_2, MED_3, MED_4
         for i in range(1, 5):
+            MED_MLEID = pv.vars['MED_%d_MLEID' % i]
             _pkt = pkts.filter_ping_request().\
                 filter_wpan_src64(SED).\
-                filter_ipv6_dst(pv.vars['MED_%d_MLEID' %i]).\
+                filter_ipv6_dst(MED_MLEID).\
                 must_next()
             pkts.filter_wpan_src64(ROUTER).\
                 filter_RLARMA().\
                 filter_coap_request(ADDR_QRY_URI, port=MM).\
-                filter(lambda p: p.thread_address.tlv.target_eid == pv.vars['MED_%d_MLEID' %i]).\
+                filter_fields(thread_address_tlv_target_eid=MED_MLEID).\
                 must_next()
             pkts.filter_wpan_src64(LEADER).\
                 filter_ipv6_dst(ROUTER_RLOC).\
@@ -207,14 +208,14 @@ class Cert_5_3_4_AddressMapCache(thread_cert.TestCase):
                                   NL_RLOC16_TLV,
                                   NL_TARGET_EID_TLV
                                   } <= set(p.coap.tlv.type) and\
-                       p.thread_address.tlv.target_eid == pv.vars['MED_%d_MLEID' %i] and\
+                       p.thread_address.tlv.target_eid == MED_MLEID and\
                        p.thread_address.tlv.rloc16 == LEADER_RLOC16 and\
                        p.coap.code == COAP_CODE_POST
                        ).\
                must_next()
             pkts.filter_ping_request(identifier=_pkt.icmpv6.echo.identifier).\
                 filter_wpan_src64(ROUTER).\
-                filter_ipv6_dst(pv.vars['MED_%d_MLEID' %i]).\
+                filter_ipv6_dst(MED_MLEID).\
                 must_next()
             pkts.filter_ping_reply(identifier=_pkt.icmpv6.echo.identifier).\
                 filter_wpan_src64(pv.vars['MED_%d' %i]).\
@@ -230,9 +231,10 @@ class Cert_5_3_4_AddressMapCache(thread_cert.TestCase):
         #         message is sent, the test fails
         #         An ICMPv6 Echo Reply MUST be sent for each ICMPv6 Echo Request from SED
         for i in range(1, 5):
+            MED_MLEID = pv.vars['MED_%d_MLEID' % i]
             _pkt = pkts.filter_ping_request().\
                 filter_wpan_src64(SED).\
-                filter_ipv6_dst(pv.vars['MED_%d_MLEID' %i]).\
+                filter_ipv6_dst(MED_MLEID).\
                 must_next()
             pkts.filter_wpan_src64(ROUTER).\
                 filter_RLARMA().\
@@ -240,7 +242,7 @@ class Cert_5_3_4_AddressMapCache(thread_cert.TestCase):
                 must_not_next()
             pkts.filter_ping_request(identifier=_pkt.icmpv6.echo.identifier).\
                 filter_wpan_src64(ROUTER).\
-                filter_ipv6_dst(pv.vars['MED_%d_MLEID' %i]).\
+                filter_ipv6_dst(MED_MLEID).\
                 must_next()
             pkts.filter_ping_reply(identifier=_pkt.icmpv6.echo.identifier).\
                 filter_wpan_src64(pv.vars['MED_%d' %i]).\
@@ -173,7 +173,7 @@ class Cert_5_3_7_DuplicateAddress(thread_cert.TestCase):
         pkts.filter_wpan_src64(LEADER).\
             filter_RLARMA().\
             filter_coap_request(ADDR_QRY_URI, port=MM).\
-            filter(lambda p: p.thread_address.tlv.target_eid == IPV6_ADDR).\
+            filter_fields(thread_address_tlv_target_eid=IPV6_ADDR).\
             must_next()
 
         # Step 6: Router_1 & Router_2 respond with Address Notification message
@@ -46,6 +46,7 @@ ROUTER3 = 4
 SED1 = 5
 PREFIX_1 = '2001::/64'
 GUA_1_START = '2001'
+GUA_1_PREFIX = Bytes(GUA_1_START)
 PREFIX_2 = '2002::/64'
 
 # Test Purpose and Description:
@@ -192,7 +193,7 @@ class Cert_5_3_09_AddressQuery(thread_cert.TestCase):
 
         for node in ('ROUTER_1', 'ROUTER_3', 'SED'):
             for addr in pv.vars['%s_IPADDRS' % node]:
-                if addr.startswith(Bytes(GUA_1_START)):
+                if addr.startswith(GUA_1_PREFIX):
                     GUA1[node] = addr
 
         # Step 1: Build the topology as described
@@ -221,7 +222,7 @@ class Cert_5_3_09_AddressQuery(thread_cert.TestCase):
         pkts.filter_wpan_src64(ROUTER_2).\
             filter_RLARMA().\
             filter_coap_request(ADDR_QRY_URI, port=MM).\
-            filter(lambda p: p.thread_address.tlv.target_eid == GUA1['ROUTER_3']).\
+            filter_fields(thread_address_tlv_target_eid=GUA1['ROUTER_3']).\
             must_next()
         pkts.filter_ping_reply(identifier=_pkt.icmpv6.echo.identifier).\
             filter_wpan_src64(ROUTER_3).\
@@ -248,7 +249,7 @@ class Cert_5_3_09_AddressQuery(thread_cert.TestCase):
         pkts.filter_wpan_src64(ROUTER_1).\
             filter_RLARMA().\
             filter_coap_request(ADDR_QRY_URI, port=MM).\
-            filter(lambda p: p.thread_address.tlv.target_eid == GUA1['SED']).\
+            filter_fields(thread_address_tlv_target_eid=GUA1['SED']).\
             must_next()
         pkts.filter_ipv6_src_dst(ROUTER_2_RLOC, ROUTER_1_RLOC).\
             filter_coap_request(ADDR_NTF_URI, port=MM).\
@@ -307,7 +308,7 @@ class Cert_5_3_09_AddressQuery(thread_cert.TestCase):
         pkts.filter_wpan_src64(ROUTER_2).\
             filter_RLARMA().\
             filter_coap_request(ADDR_QRY_URI, port=MM).\
-            filter(lambda p: p.thread_address.tlv.target_eid == GUA1['ROUTER_3']).\
+            filter_fields(thread_address_tlv_target_eid=GUA1['ROUTER_3']).\
             must_next()
 
         # Step 7: Router_1 sends two ICMPv6 Echo Requests to SED using GUA 2001::
@@ -48,6 +48,7 @@ MED1 = 5
 
 PREFIX_1 = '2003::/64'
 GUA_1_START = '2003'
+GUA_1_PREFIX = Bytes(GUA_1_START)
 PREFIX_2 = '2004::/64'
 
 # Test Purpose and Description:
@@ -193,7 +194,7 @@ class Cert_5_3_10_AddressQuery(thread_cert.TestCase):
 
         for node in ('ROUTER_1', 'BR', 'MED'):
             for addr in pv.vars['%s_IPADDRS' % node]:
-                if addr.startswith(Bytes(GUA_1_START)):
+                if addr.startswith(GUA_1_PREFIX):
                     GUA1[node] = addr
 
         # Step 2: Build the topology as described
@@ -223,7 +224,7 @@ class Cert_5_3_10_AddressQuery(thread_cert.TestCase):
         pkts.filter_wpan_src64(ROUTER_2).\
             filter_RLARMA().\
             filter_coap_request(ADDR_QRY_URI, port=MM).\
-            filter(lambda p: p.thread_address.tlv.target_eid == GUA1['ROUTER_1']).\
+            filter_fields(thread_address_tlv_target_eid=GUA1['ROUTER_1']).\
             must_next()
         pkts.filter_ping_request(identifier=_pkt.icmpv6.echo.identifier).\
             filter_wpan_src64(ROUTER_2).\
@@ -254,7 +255,7 @@ class Cert_5_3_10_AddressQuery(thread_cert.TestCase):
         pkts.filter_wpan_src64(BR).\
             filter_RLARMA().\
             filter_coap_request(ADDR_QRY_URI, port=MM).\
-            filter(lambda p: p.thread_address.tlv.target_eid == GUA1['MED']).\
+            filter_fields(thread_address_tlv_target_eid=GUA1['MED']).\
             must_next()
         pkts.filter_ipv6_src_dst(ROUTER_2_RLOC, BR_RLOC).\
             filter_coap_request(ADDR_NTF_URI, port=MM).\
@@ -314,7 +315,7 @@ class Cert_5_3_10_AddressQuery(thread_cert.TestCase):
         pkts.filter_wpan_src64(ROUTER_2).\
             filter_RLARMA().\
             filter_coap_request(ADDR_QRY_URI, port=MM).\
-            filter(lambda p: p.thread_address.tlv.target_eid == GUA1['ROUTER_1']).\
+            filter_fields(thread_address_tlv_target_eid=GUA1['ROUTER_1']).\
             must_next()
 
         # Step 7: Border Router sends two ICMPv6 Echo Requests to MED using GUA 2003::
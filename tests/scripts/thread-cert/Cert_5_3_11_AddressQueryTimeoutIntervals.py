@@ -41,6 +41,7 @@ LEADER = 1
 DUT_ROUTER1 = 2
 MED1 = 3
 X = 'fd00:db8:0000:0000:aa55:aa55:aa55:aa55'
+X_ADDR = Ipv6Addr(X)
 
 # Test Purpose and Description:
 # -----------------------------
@@ -143,14 +144,14 @@ class Cert_5_3_11_AddressQueryTimeoutIntervals(thread_cert.TestCase):
 
         _pkt = pkts.filter_ping_request().\
             filter_wpan_src64(MED).\
-            filter_ipv6_dst(Ipv6Addr(X)).\
+            filter_ipv6_dst(X_ADDR).\
             must_next()
         step2_start = pkts.index
 
         pkts.filter_wpan_src64(ROUTER).\
             filter_RLARMA().\
             filter_coap_request(ADDR_QRY_URI, port=MM).\
-            filter(lambda p: p.thread_address.tlv.target_eid == Ipv6Addr(X)).\
+            filter_fields(thread_address_tlv_target_eid=X_ADDR).\
             must_next()
 
         # Step 3: MED sends an ICMPv6 Echo Request to a nonexistent mesh-local
@@ -160,7 +161,7 @@ class Cert_5_3_11_AddressQueryTimeoutIntervals(thread_cert.TestCase):
 
         pkts.filter_ping_request().\
             filter_wpan_src64(MED).\
-            filter_ipv6_dst(Ipv6Addr(X)).\
+            filter_ipv6_dst(X_ADDR).\
             must_next()
         step2_end = pkts.index
 
@@ -181,7 +182,7 @@ class Cert_5_3_11_AddressQueryTimeoutIntervals(thread_cert.TestCase):
 
         pkts.filter_ping_request().\
             filter_wpan_src64(MED).\
-            filter_ipv6_dst(Ipv6Addr(X)).\
+            filter_ipv6_dst(X_ADDR).\
             must_next()
         step3_end = pkts.index
         pkts.range(step2_end, step3_end).filter_wpan_src64(ROUTER).\
@@ -191,7 +192,7 @@ class Cert_5_3_11_AddressQueryTimeoutIntervals(thread_cert.TestCase):
         pkts.filter_wpan_src64(ROUTER).\
             filter_RLARMA().\
             filter_coap_request(ADDR_QRY_URI, port=MM).\
-            filter(lambda p: p.thread_address.tlv.target_eid == Ipv6Addr(X)).\
+            filter_fields(thread_address_tlv_target_eid=X_ADDR).\
             must_next()
 
 
@@ -148,7 +148,7 @@ class Cert_5_5_1_LeaderReboot(thread_cert.TestCase):
                               TLV_REQUEST_TLV,
                               ADDRESS16_TLV,
                               ROUTE64_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.mle.tlv.addr16 is nullField and\
                    p.mle.tlv.route64.id_mask is nullField
                    ).\
@@ -186,13 +186,13 @@ class Cert_5_5_1_LeaderReboot(thread_cert.TestCase):
                                   ADDRESS16_TLV,
                                   ROUTE64_TLV,
                                   VERSION_TLV
-                                   } <= set(p.mle.tlv.type) and\
+                                   } <= p.mle_tlv_types and\
                        p.mle.tlv.addr16 is not nullField and\
                        p.mle.tlv.route64.id_mask is not nullField
                        ).\
                        must_next()
         if _pkt.mle.cmd == MLE_LINK_ACCEPT_AND_REQUEST:
-            _pkt.must_verify(lambda p: {CHALLENGE_TLV} <= set(p.mle.tlv.type))
+            _pkt.must_verify(lambda p: {CHALLENGE_TLV} <= p.mle_tlv_types)
 
         # Step 7: Router_1 MUST respond with an ICMPv6 Echo Reply
         _pkt = pkts.filter_ping_request().\
@@ -129,17 +129,17 @@ class Cert_5_6_1_NetworkDataLeaderAsBr(thread_cert.TestCase):
             lambda p: {
                 RESPONSE_TLV, LINK_LAYER_FRAME_COUNTER_TLV, MODE_TLV, TIMEOUT_TLV, VERSION_TLV, TLV_REQUEST_TLV,
                 ADDRESS16_TLV, NETWORK_DATA_TLV, ROUTE64_TLV
-            } < set(p.mle.tlv.type))
+            } < p.mle_tlv_types)
         _rpkts_med = _rpkts.copy()
         _rpkts_sed = _rpkts.copy()
 
         # Step 6: The DUT MUST send an MLE Child ID Response to SED_1,
         # containing only stable Network Data
         _rpkts_sed.filter_mle_cmd(MLE_CHILD_ID_RESPONSE).filter_wpan_dst64(SED).must_next().must_verify(
-            lambda p: {MODE_TLV, TIMEOUT_TLV, CHALLENGE_TLV} == set(p.thread_nwd.tlv.type) and
-            {Ipv6Addr('2001:2:0:1::')} == set(p.thread_nwd.tlv.prefix) and p.thread_nwd.tlv.border_router.flag.p ==
-            [1] and p.thread_nwd.tlv.border_router.flag.s == [1] and p.thread_nwd.tlv.border_router.flag.r == [1] and p
-            .thread_nwd.tlv.border_router.flag.o == [1] and p.thread_nwd.tlv.stable == [1, 1, 1])
+            lambda p: {MODE_TLV, TIMEOUT_TLV, CHALLENGE_TLV} == p.thread_nwd_tlv_types and {Ipv6Addr(
+                '2001:2:0:1::')} == set(p.thread_nwd.tlv.prefix) and p.thread_nwd.tlv.border_router.flag.p == [1] and p
+            .thread_nwd.tlv.border_router.flag.s == [1] and p.thread_nwd.tlv.border_router.flag.r == [1] and p.
+            thread_nwd.tlv.border_router.flag.o == [1] and p.thread_nwd.tlv.stable == [1, 1, 1])
 
         # Step 8: The DUT MUST send a MLE Child ID Response to MED_1,
         # containing the full Network Data
@@ -153,10 +153,10 @@ class Cert_5_6_1_NetworkDataLeaderAsBr(thread_cert.TestCase):
         # Response to each of MED_1 and SED_1
         _rpkts_med.filter_mle_cmd(MLE_CHILD_UPDATE_RESPONSE).must_next().must_verify(
             lambda p: p.wpan.dst64 == MED and
-            {SOURCE_ADDRESS_TLV, MODE_TLV, LEADER_DATA_TLV, ADDRESS_REGISTRATION_TLV} < set(p.mle.tlv.type))
+            {SOURCE_ADDRESS_TLV, MODE_TLV, LEADER_DATA_TLV, ADDRESS_REGISTRATION_TLV} < p.mle_tlv_types)
         _rpkts_sed.filter_mle_cmd(MLE_CHILD_UPDATE_RESPONSE).must_next().must_verify(
             lambda p: p.wpan.dst64 == SED and
-            {SOURCE_ADDRESS_TLV, MODE_TLV, LEADER_DATA_TLV, ADDRESS_REGISTRATION_TLV} < set(p.mle.tlv.type))
+            {SOURCE_ADDRESS_TLV, MODE_TLV, LEADER_DATA_TLV, ADDRESS_REGISTRATION_TLV} < p.mle_tlv_types)
 
         # Step 11: MED_1 and SED_1 MUST respond to each ICMPv6 Echo Request
         # with an ICMPv6 Echo Reply
@@ -165,12 +165,12 @@ class Cert_5_6_7_NetworkDataRequestREED(thread_cert.TestCase):
         # Step 4: Leader multicasts a MLE Data Response with the new information
         _pkt = pkts.filter_mle_cmd(MLE_CHILD_ID_RESPONSE).filter_wpan_dst64(REED).must_next()
         pkts.filter_wpan_src64(LEADER).filter_mle_cmd(MLE_DATA_RESPONSE).must_next().must_verify(
-            lambda p: {NWD_PREFIX_TLV, NWD_BORDER_ROUTER_TLV, NWD_6LOWPAN_ID_TLV} <= set(p.thread_nwd.tlv.type))
+            lambda p: {NWD_PREFIX_TLV, NWD_BORDER_ROUTER_TLV, NWD_6LOWPAN_ID_TLV} <= p.thread_nwd_tlv_types)
 
         # Step 8: REED1 MUST send a MLE Data Request to its parent to get the new Network Dataset.
         # MLE Data Request includes a TLV Request TLV for Network Data TLV
         pkts.filter_wpan_src64(REED).filter_mle_cmd(MLE_DATA_REQUEST).must_next().must_verify(
-            lambda p: {TLV_REQUEST_TLV, NETWORK_DATA_TLV} <= set(p.mle.tlv.type))
+            lambda p: {TLV_REQUEST_TLV, NETWORK_DATA_TLV} <= p.mle_tlv_types)
 
         # Step 10: REED1 send MLE Advertisement
         pkts.filter_wpan_src64(REED).filter_mle_cmd(MLE_ADVERTISEMENT).must_next().must_verify(
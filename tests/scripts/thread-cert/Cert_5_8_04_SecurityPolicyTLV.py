@@ -191,6 +191,16 @@ class Cert_5_8_04_SecurityPolicyTLV(thread_cert.TestCase):
         COMMISSIONER_1_RLOC = pv.vars['COMMISSIONER_1_RLOC']
         COMMISSIONER_2 = pv.vars['COMMISSIONER_2']
 
+        # The MGMT_ACTIVE_SET.req of Steps 5, 9, 13 and 17 and the MGMT_ACTIVE_SET.rsp (Accept) of Steps 6, 10, 14
+        # and 18 are each found as a request/response pair
+        _active_set_req_pkts = pkts.filter_wpan_src64(COMMISSIONER_1).\
+            filter_ipv6_2dsts(LEADER_RLOC, LEADER_ALOC).\
+            filter_coap_request(MGMT_ACTIVE_SET_URI)
+        _active_set_rsp_pkts = pkts.filter_wpan_src64(LEADER).\
+            filter_ipv6_dst(COMMISSIONER_1_RLOC).\
+            filter_coap_ack(MGMT_ACTIVE_SET_URI).\
+            filter(lambda p: p.thread_meshcop.tlv.state == 1)
+
         # Step 1: Ensure the topology is formed correctly
         pv.verify_attached('COMMISSIONER_1', 'LEADER')
 
@@ -229,29 +239,22 @@ class Cert_5_8_04_SecurityPolicyTLV(thread_cert.TestCase):
         #             Commissioner Session ID TLV
         #             Active Timestamp TLV > stored value in step 4
         #             Security Policy TLV with “O” bit disabled
-        pkts.filter_wpan_src64(COMMISSIONER_1). \
-            filter_ipv6_2dsts(LEADER_RLOC, LEADER_ALOC). \
-            filter_coap_request(MGMT_ACTIVE_SET_URI). \
+        _step5_pkts = _active_set_req_pkts.\
             filter(lambda p: {
                               NM_COMMISSIONER_SESSION_ID_TLV,
                               NM_ACTIVE_TIMESTAMP_TLV,
                               NM_SECURITY_POLICY_TLV
-                             }  == set(p.thread_meshcop.tlv.type) and\
+                             }  == p.thread_meshcop_tlv_types and\
                    p.thread_meshcop.tlv.active_tstamp == 15 and\
                    (p.thread_meshcop.tlv.sec_policy_o == 0 or
-                    p.thread_meshcop.tlv.unknown == '0e1077')).\
-            must_next()
+                    p.thread_meshcop.tlv.unknown == '0e1077'))
 
         # Step 6: Leader MUST send MGMT_ACTIVE_SET.rsp to the Commissioner_1
         #         CoAP Response Code
         #             2.04 Changed
         #         CoAP Payload
         #             State TLV (value = Accept (0x01))
-        pkts.filter_wpan_src64(LEADER).\
-            filter_ipv6_dst(COMMISSIONER_1_RLOC).\
-            filter_coap_ack(MGMT_ACTIVE_SET_URI).\
-            filter(lambda p: p.thread_meshcop.tlv.state == 1).\
-            must_next()
+        pkts.must_find_pair(_step5_pkts, _active_set_rsp_pkts)
 
         # Step 7: Commissioner_1 sends MGMT_ACTIVE_GET.req to Leader
         #         CoAP Request URI
@@ -282,29 +285,22 @@ class Cert_5_8_04_SecurityPolicyTLV(thread_cert.TestCase):
         #             Commissioner Session ID TLV
         #             Active Timestamp TLV > stored value in step 5
         #             Security Policy TLV with “N” bit disabled
-        pkts.filter_wpan_src64(COMMISSIONER_1). \
-            filter_ipv6_2dsts(LEADER_RLOC, LEADER_ALOC). \
-            filter_coap_request(MGMT_ACTIVE_SET_URI). \
+        _step9_pkts = _active_set_req_pkts.\
             filter(lambda p: {
                               NM_COMMISSIONER_SESSION_ID_TLV,
                               NM_ACTIVE_TIMESTAMP_TLV,
                               NM_SECURITY_POLICY_TLV
-                             }  == set(p.thread_meshcop.tlv.type) and\
+                             }  == p.thread_meshcop_tlv_types and\
                    p.thread_meshcop.tlv.active_tstamp == 20 and\
                    (p.thread_meshcop.tlv.sec_policy_n == 0 or
-                    p.thread_meshcop.tlv.unknown == '0e10b7')).\
-            must_next()
+                    p.thread_meshcop.tlv.unknown == '0e10b7'))
 
         # Step 10: Leader MUST send MGMT_ACTIVE_SET.rsp to the Commissioner_1
         #          CoAP Response Code
         #              2.04 Changed
         #          CoAP Payload
         #              State TLV (value = Accept (0x01))
-        pkts.filter_wpan_src64(LEADER).\
-            filter_ipv6_dst(COMMISSIONER_1_RLOC).\
-            filter_coap_ack(MGMT_ACTIVE_SET_URI).\
-            filter(lambda p: p.thread_meshcop.tlv.state == 1).\
-            must_next()
+        pkts.must_find_pair(_step9_pkts, _active_set_rsp_pkts)
 
         # Step 12: Leader MUST send a Discovery Response with Native Commissioning
         #          bit set to “Not Allowed”
@@ -320,29 +316,22 @@ class Cert_5_8_04_SecurityPolicyTLV(thread_cert.TestCase):
         #              Commissioner Session ID TLV
         #              Active Timestamp TLV > stored value in step 9
         #              Security Policy TLV with “B” bit disabled
-        pkts.filter_wpan_src64(COMMISSIONER_1). \
-            filter_ipv6_2dsts(LEADER_RLOC, LEADER_ALOC). \
-            filter_coap_request(MGMT_ACTIVE_SET_URI). \
+        _step13_pkts = _active_set_req_pkts.\
             filter(lambda p: {
                               NM_COMMISSIONER_SESSION_ID_TLV,
                               NM_ACTIVE_TIMESTAMP_TLV,
                               NM_SECURITY_POLICY_TLV
-                             }  == set(p.thread_meshcop.tlv.type) and\
+                             }  == p.thread_meshcop_tlv_types and\
                    p.thread_meshcop.tlv.active_tstamp == 25 and\
                    (p.thread_meshcop.tlv.sec_policy_b == 0 or
-                    p.thread_meshcop.tlv.unknown == '0e10f7')).\
-            must_next()
+                    p.thread_meshcop.tlv.unknown == '0e10f7'))
 
         # Step 14: Leader MUST send MGMT_ACTIVE_SET.rsp to the Commissioner_1
         #          CoAP Response Code
         #              2.04 Changed
         #          CoAP Payload
         #              State TLV (value = Accept (0x01))
-        pkts.filter_wpan_src64(LEADER).\
-            filter_ipv6_dst(COMMISSIONER_1_RLOC).\
-            filter_coap_ack(MGMT_ACTIVE_SET_URI).\
-            filter(lambda p: p.thread_meshcop.tlv.state == 1).\
-            must_next()
+        pkts.must_find_pair(_step13_pkts, _active_set_rsp_pkts)
 
         # Step 16: The DUT MUST send beacon response frames.The beacon payload MUST
         #          either be empty OR the payload format MUST be different from the
@@ -366,18 +355,15 @@ class Cert_5_8_04_SecurityPolicyTLV(thread_cert.TestCase):
         #              Commissioner Session ID TLV
         #              Active Timestamp TLV > stored value in step 9
         #              Security Policy TLV with “R” bit disabled
-        pkts.filter_wpan_src64(COMMISSIONER_1). \
-            filter_ipv6_2dsts(LEADER_RLOC, LEADER_ALOC). \
-            filter_coap_request(MGMT_ACTIVE_SET_URI). \
+        _step17_pkts = _active_set_req_pkts.\
             filter(lambda p: {
                               NM_COMMISSIONER_SESSION_ID_TLV,
                               NM_ACTIVE_TIMESTAMP_TLV,
                               NM_SECURITY_POLICY_TLV
-                             }  == set(p.thread_meshcop.tlv.type) and\
+                             }  == p.thread_meshcop_tlv_types and\
                    p.thread_meshcop.tlv.active_tstamp == 30 and\
                    (p.thread_meshcop.tlv.sec_policy_r == 0 or
-                    p.thread_meshcop.tlv.unknown == '0e10d7')).\
-            must_next()
+                    p.thread_meshcop.tlv.unknown == '0e10d7'))
 
         # Step 18: Leader MUST send MGMT_ACTIVE_SET.rsp to the Commissioner_1
         #          CoAP Response Code
@@ -387,11 +373,7 @@ class Cert_5_8_04_SecurityPolicyTLV(thread_cert.TestCase):
         #          Leader MUST multicast MLE Data Response to the Link-Local All Nodes
         #          multicast address (FF02::1) with active timestamp value as set in
         #          Step 17.
-        pkts.filter_wpan_src64(LEADER).\
-            filter_ipv6_dst(COMMISSIONER_1_RLOC).\
-            filter_coap_ack(MGMT_ACTIVE_SET_URI).\
-            filter(lambda p: p.thread_meshcop.tlv.state == 1).\
-            must_next()
+        pkts.must_find_pair(_step17_pkts, _active_set_rsp_pkts)
         pkts.filter_wpan_src64(LEADER).\
             filter_LLANMA().\
             filter_mle_cmd(MLE_DATA_RESPONSE).\
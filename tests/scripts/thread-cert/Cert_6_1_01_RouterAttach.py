@@ -132,7 +132,7 @@ class Cert_6_1_1_RouterAttach_Base(thread_cert.TestCase):
                               MODE_TLV,
                               SCAN_MASK_TLV,
                               VERSION_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.ipv6.hlim == 255 and\
                    p.mle.tlv.scan_mask.r == 1 and\
                    p.mle.tlv.scan_mask.e == 0 and\
@@ -164,7 +164,7 @@ class Cert_6_1_1_RouterAttach_Base(thread_cert.TestCase):
                               RESPONSE_TLV,
                               SOURCE_ADDRESS_TLV,
                               VERSION_TLV
-                               } <= set(p.mle.tlv.type)).\
+                               } <= p.mle_tlv_types).\
                    must_next()
 
         # Step 4: Router sends a MLE Child ID Request.
@@ -189,7 +189,7 @@ class Cert_6_1_1_RouterAttach_Base(thread_cert.TestCase):
                               TIMEOUT_TLV,
                               TLV_REQUEST_TLV,
                               VERSION_TLV
-                             } <= set(p.mle.tlv.type) and\
+                             } <= p.mle_tlv_types and\
                    p.wpan.aux_sec.key_id_mode == 0x2
                    ).\
                    must_next()
@@ -204,7 +204,7 @@ class Cert_6_1_1_RouterAttach_Base(thread_cert.TestCase):
                               LEADER_DATA_TLV,
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV
-                              } <= set(p.mle.tlv.type)
+                              } <= p.mle_tlv_types
                    ).\
                    must_next()
 
@@ -108,8 +108,8 @@ class Cert_6_1_3_RouterAttachConnectivity(thread_cert.TestCase):
         # All-Routers multicast address
         _ed_pkts.filter_mle_cmd(MLE_PARENT_REQUEST).filter_ipv6_dst(
             LINK_LOCAL_ALL_ROUTERS_MULTICAST_ADDRESS).must_next().must_verify(
-                lambda p: {MODE_TLV, CHALLENGE_TLV, SCAN_MASK_TLV, VERSION_TLV} == set(p.mle.tlv.type
-                                                                                      ) and p.mle.tlv.scan_mask.r == 1)
+                lambda p: {MODE_TLV, CHALLENGE_TLV, SCAN_MASK_TLV, VERSION_TLV
+                          } == p.mle_tlv_types and p.mle.tlv.scan_mask.r == 1)
 
         # Step 3: Router_2, Router_3 Respond with MLE Parent Response
         # Step 4: DUT Send a Child ID Request to Router_3 due to better connectivity
@@ -117,7 +117,7 @@ class Cert_6_1_3_RouterAttachConnectivity(thread_cert.TestCase):
             lambda p: {
                 RESPONSE_TLV, LINK_LAYER_FRAME_COUNTER_TLV, MLE_FRAME_COUNTER_TLV, MODE_TLV, TIMEOUT_TLV, VERSION_TLV,
                 ADDRESS_REGISTRATION_TLV, TLV_REQUEST_TLV
-            } <= set(p.mle.tlv.type))
+            } <= p.mle_tlv_types)
 
         # Step 5: The DUT MUST respond with ICMPv6 Echo Reply
         ed_mleid = pv.vars['ED_MLEID']
@@ -165,7 +165,7 @@ class Cert_6_1_4_REEDAttachConnectivity_Base(thread_cert.TestCase):
                               MODE_TLV,
                               SCAN_MASK_TLV,
                               VERSION_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.ipv6.hlim == 255 and\
                    p.mle.tlv.scan_mask.r == 1 and\
                    p.mle.tlv.scan_mask.e == 0 and\
@@ -192,7 +192,7 @@ class Cert_6_1_4_REEDAttachConnectivity_Base(thread_cert.TestCase):
                               MODE_TLV,
                               SCAN_MASK_TLV,
                               VERSION_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.ipv6.hlim == 255 and\
                    p.mle.tlv.scan_mask.r == 1 and\
                    p.mle.tlv.scan_mask.e == 1 and\
@@ -225,7 +225,7 @@ class Cert_6_1_4_REEDAttachConnectivity_Base(thread_cert.TestCase):
                                       RESPONSE_TLV,
                                       SOURCE_ADDRESS_TLV,
                                       VERSION_TLV
-                                       } <= set(p.mle.tlv.type)).\
+                                       } <= p.mle_tlv_types).\
                      must_next()
 
         # Step 6: DUT sends a MLE Child ID Request to REED_1
@@ -250,7 +250,7 @@ class Cert_6_1_4_REEDAttachConnectivity_Base(thread_cert.TestCase):
                               TIMEOUT_TLV,
                               TLV_REQUEST_TLV,
                               VERSION_TLV
-                             } <= set(p.mle.tlv.type) and\
+                             } <= p.mle_tlv_types and\
                    p.wpan.aux_sec.key_id_mode == 0x2
                    ).\
              must_next()
@@ -289,7 +289,7 @@ class Cert_6_1_4_REEDAttachConnectivity_Base(thread_cert.TestCase):
                               LEADER_DATA_TLV,
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.mle.tlv.source_addr != REED_1_RLOC16
                    ).\
             must_next()
@@ -117,21 +117,21 @@ class Cert_6_1_5_REEDAttachConnectivity(thread_cert.TestCase):
         for num in range(self.num_parent_requests):
             _ed_pkts.filter_mle_cmd(MLE_PARENT_REQUEST).filter_ipv6_dst(
                 LINK_LOCAL_ALL_ROUTERS_MULTICAST_ADDRESS).must_next().must_verify(
-                    lambda p: {MODE_TLV, CHALLENGE_TLV, SCAN_MASK_TLV, VERSION_TLV} == set(
-                        p.mle.tlv.type) and p.mle.tlv.scan_mask.r == 1)
+                    lambda p: {MODE_TLV, CHALLENGE_TLV, SCAN_MASK_TLV, VERSION_TLV
+                              } == p.mle_tlv_types and p.mle.tlv.scan_mask.r == 1)
 
         # Step 3: REED_1 and REED_2 No response to Parent Request
         # Step 4: DUT Send MLE Parent Request with Scan Mask set to Routers AND REEDs
         _ed_pkts.filter_mle_cmd(MLE_PARENT_REQUEST).must_next().must_verify(
-            lambda p: {MODE_TLV, CHALLENGE_TLV, SCAN_MASK_TLV, VERSION_TLV} == set(
-                p.mle.tlv.type) and p.mle.tlv.scan_mask.r == 1 and p.mle.tlv.scan_mask.e == 1)
+            lambda p: {MODE_TLV, CHALLENGE_TLV, SCAN_MASK_TLV, VERSION_TLV
+                      } == p.mle_tlv_types and p.mle.tlv.scan_mask.r == 1 and p.mle.tlv.scan_mask.e == 1)
 
         # Step 5: The DUT MUST send a MLE Child ID Request
         _ed_pkts.filter_wpan_dst64(REED_1).filter_mle_cmd(MLE_CHILD_ID_REQUEST).must_next().must_verify(
             lambda p: {
                 RESPONSE_TLV, LINK_LAYER_FRAME_COUNTER_TLV, MLE_FRAME_COUNTER_TLV, MODE_TLV, TIMEOUT_TLV, VERSION_TLV,
                 ADDRESS_REGISTRATION_TLV, TLV_REQUEST_TLV
-            } <= set(p.mle.tlv.type))
+            } <= p.mle_tlv_types)
 
         # Step 8: The DUT MUST respond with ICMPv6 Echo Reply
         ed_mleid = pv.vars['ED_MLEID']
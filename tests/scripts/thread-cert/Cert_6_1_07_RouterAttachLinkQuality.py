@@ -99,15 +99,15 @@ class Cert_6_1_7_RouterAttachLinkQuality(thread_cert.TestCase):
         # All-Routers multicast address
         _ed_pkts.filter_mle_cmd(MLE_PARENT_REQUEST).filter_ipv6_dst(
             LINK_LOCAL_ALL_ROUTERS_MULTICAST_ADDRESS).must_next().must_verify(
-                lambda p: {MODE_TLV, CHALLENGE_TLV, SCAN_MASK_TLV, VERSION_TLV} == set(
-                    p.mle.tlv.type) and p.mle.tlv.scan_mask.r == 1 and p.mle.tlv.scan_mask.e == 0)
+                lambda p: {MODE_TLV, CHALLENGE_TLV, SCAN_MASK_TLV, VERSION_TLV
+                          } == p.mle_tlv_types and p.mle.tlv.scan_mask.r == 1 and p.mle.tlv.scan_mask.e == 0)
 
         # Step 5: The DUT MUST send a MLE Child ID Request to Router_1
         _ed_pkts.filter_wpan_dst64(ROUTER_1).filter_mle_cmd(MLE_CHILD_ID_REQUEST).must_next().must_verify(
             lambda p: {
                 RESPONSE_TLV, LINK_LAYER_FRAME_COUNTER_TLV, MLE_FRAME_COUNTER_TLV, MODE_TLV, TIMEOUT_TLV, VERSION_TLV,
                 ADDRESS_REGISTRATION_TLV, TLV_REQUEST_TLV
-            } <= set(p.mle.tlv.type))
+            } <= p.mle_tlv_types)
 
         # Step 6: The DUT MUST respond with ICMPv6 Echo Reply
         ed_mleid = pv.vars['ED_MLEID']
@@ -97,14 +97,14 @@ class Cert_6_5_1_ChildResetReattach(thread_cert.TestCase):
         # Step 3: Send MLE Child Update Request to Leader
         _ed_pkts.filter_mle_cmd(MLE_CHILD_ID_REQUEST).must_next()
         _ed_pkts.filter_mle_cmd(MLE_CHILD_UPDATE_REQUEST).must_next().must_verify(
-            lambda p: {MODE_TLV} < set(p.mle.tlv.type))
+            lambda p: {MODE_TLV} < p.mle_tlv_types)
 
         # Step 5: DUT reattaches to Leader
         _ed_pkts.filter_mle_cmd(MLE_CHILD_ID_REQUEST).must_next().must_verify(
             lambda p: {
                 RESPONSE_TLV, LINK_LAYER_FRAME_COUNTER_TLV, MLE_FRAME_COUNTER_TLV, MODE_TLV, TIMEOUT_TLV, VERSION_TLV,
                 ADDRESS_REGISTRATION_TLV, TLV_REQUEST_TLV
-            } <= set(p.mle.tlv.type))
+            } <= p.mle_tlv_types)
 
         # Step 6: The DUT MUST respond with ICMPv6 Echo Reply
         _ed_pkts.filter_ping_reply().filter(lambda p: p.wpan.src64 == ED and p.wpan.dst64 == LEADER).must_next()
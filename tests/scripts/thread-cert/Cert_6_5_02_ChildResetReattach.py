@@ -150,7 +150,7 @@ class Cert_6_5_2_ChildResetReattach_Base(thread_cert.TestCase):
             filter_mle_cmd(MLE_CHILD_UPDATE_REQUEST).\
             filter(lambda p: {
                               MODE_TLV
-                             } < set(p.mle.tlv.type)
+                             } < p.mle_tlv_types
                    ).\
             must_next()
         if self.TOPOLOGY[MTD]['mode'] == '-':
@@ -177,7 +177,7 @@ class Cert_6_5_2_ChildResetReattach_Base(thread_cert.TestCase):
                               MODE_TLV,
                               SCAN_MASK_TLV,
                               VERSION_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.ipv6.hlim == 255 and\
                    p.mle.tlv.scan_mask.r == 1 and\
                    p.mle.tlv.scan_mask.e == 0 and\
@@ -204,7 +204,7 @@ class Cert_6_5_2_ChildResetReattach_Base(thread_cert.TestCase):
                               RESPONSE_TLV,
                               SOURCE_ADDRESS_TLV,
                               VERSION_TLV
-                               } <= set(p.mle.tlv.type)).\
+                               } <= p.mle_tlv_types).\
                    must_next()
 
         pkts.filter_wpan_src64(DUT).\
@@ -218,7 +218,7 @@ class Cert_6_5_2_ChildResetReattach_Base(thread_cert.TestCase):
                               TIMEOUT_TLV,
                               TLV_REQUEST_TLV,
                               VERSION_TLV
-                             } <= set(p.mle.tlv.type) and\
+                             } <= p.mle_tlv_types and\
                    p.wpan.aux_sec.key_id_mode == 0x2
                    ).\
              must_next()
@@ -231,7 +231,7 @@ class Cert_6_5_2_ChildResetReattach_Base(thread_cert.TestCase):
                               LEADER_DATA_TLV,
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV
-                              } <= set(p.mle.tlv.type)
+                              } <= p.mle_tlv_types
                    ).\
             must_next()
 
@@ -80,6 +80,7 @@ class Cert_6_6_1_KeyIncrement(thread_cert.TestCase):
 
         LEADER = pv.vars['LEADER']
         ED = pv.vars['ED']
+        ED_RLOC16 = pv.vars['ED_RLOC16']
         _leader_pkts = pkts.filter_wpan_src64(LEADER)
         _ed_pkts = pkts.filter_wpan_src64(ED)
 
@@ -98,9 +99,8 @@ class Cert_6_6_1_KeyIncrement(thread_cert.TestCase):
         # Step 3: Leader send an ICMPv6 Echo Request to DUT.
         # The MAC Auxiliary security header must contain
         # KeyIndex = 1, KeyID Mode = 1
-        lp = _leader_pkts.filter_ping_request().filter(
-            lambda p: p.wpan.aux_sec.key_index == 1 and p.wpan.aux_sec.key_id_mode == 1 and p.wpan.dst16 == pv.vars[
-                'ED_RLOC16']).must_next()
+        lp = _leader_pkts.filter_ping_request().filter_wpan_dst16(ED_RLOC16).filter(
+            lambda p: p.wpan.aux_sec.key_index == 1 and p.wpan.aux_sec.key_id_mode == 1).must_next()
 
         # Step 4: DUT send an ICMPv6 Echo Reply to Leader.
         # The MAC Auxiliary security header must contain
@@ -112,9 +112,8 @@ class Cert_6_6_1_KeyIncrement(thread_cert.TestCase):
         # Step 6: Leader Send an ICMPv6 Echo Request to DUT.
         # The MAC Auxiliary security header must contain
         # KeyIndex = 2, KeyID Mode = 1
-        lp = _leader_pkts.filter_ping_request().filter(
-            lambda p: p.wpan.aux_sec.key_index == 2 and p.wpan.aux_sec.key_id_mode == 1 and p.wpan.dst16 == pv.vars[
-                'ED_RLOC16']).must_next()
+        lp = _leader_pkts.filter_ping_request().filter_wpan_dst16(ED_RLOC16).filter(
+            lambda p: p.wpan.aux_sec.key_index == 2 and p.wpan.aux_sec.key_id_mode == 1).must_next()
 
         # Step 7: DUT send an ICMPv6 Echo Reply to Leader.
         # The MAC Auxiliary security header must contain
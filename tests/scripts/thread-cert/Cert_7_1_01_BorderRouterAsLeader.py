@@ -44,6 +44,8 @@ MED1 = 4
 MTDS = [SED1, MED1]
 PREFIX_2001 = '2001::/64'
 PREFIX_2002 = '2002::/64'
+PREFIX_2001_ADDR = Ipv6Addr(PREFIX_2001[:-3])
+PREFIX_2002_ADDR = Ipv6Addr(PREFIX_2002[:-3])
 
 # Test Purpose and Description:
 # -----------------------------
@@ -146,7 +148,7 @@ class Cert_7_1_1_BorderRouterAsLeader(thread_cert.TestCase):
                               ADDRESS16_TLV,
                               NETWORK_DATA_TLV,
                               ROUTE64_TLV
-                             } < set(p.mle.tlv.type) and\
+                             } < p.mle_tlv_types and\
                    p.mle.tlv.mode.network_data == 1
                    ).\
             must_next()
@@ -162,8 +164,8 @@ class Cert_7_1_1_BorderRouterAsLeader(thread_cert.TestCase):
             filter_wpan_dst64(ROUTER).\
             filter_mle_cmd(MLE_CHILD_ID_RESPONSE).\
             filter(lambda p: {
-                              Ipv6Addr(PREFIX_2001[:-3]),
-                              Ipv6Addr(PREFIX_2002[:-3])
+                              PREFIX_2001_ADDR,
+                              PREFIX_2002_ADDR
                              } == set(p.thread_nwd.tlv.prefix) and\
                    p.thread_nwd.tlv.border_router.flag.p == [1, 1] and\
                    p.thread_nwd.tlv.border_router.flag.s == [1, 1] and\
@@ -188,7 +190,7 @@ class Cert_7_1_1_BorderRouterAsLeader(thread_cert.TestCase):
                               ADDRESS16_TLV,
                               NETWORK_DATA_TLV,
                               ADDRESS_REGISTRATION_TLV
-                             } <= set(p.mle.tlv.type) and\
+                             } <= p.mle_tlv_types and\
                    p.mle.tlv.mode.network_data == 0
                    ).\
             must_next()
@@ -208,8 +210,8 @@ class Cert_7_1_1_BorderRouterAsLeader(thread_cert.TestCase):
                               MODE_TLV,
                               TIMEOUT_TLV,
                               CHALLENGE_TLV
-                             } == set(p.thread_nwd.tlv.type) and\
-                   [Ipv6Addr(PREFIX_2001[:-3])] == p.thread_nwd.tlv.prefix and\
+                             } == p.thread_nwd_tlv_types and\
+                   [PREFIX_2001_ADDR] == p.thread_nwd.tlv.prefix and\
                    p.thread_nwd.tlv.border_router.flag.p == [1] and\
                    p.thread_nwd.tlv.border_router.flag.s == [1] and\
                    p.thread_nwd.tlv.border_router.flag.r == [1] and\
@@ -235,7 +237,7 @@ class Cert_7_1_1_BorderRouterAsLeader(thread_cert.TestCase):
                               ADDRESS16_TLV,
                               NETWORK_DATA_TLV,
                               ADDRESS_REGISTRATION_TLV
-                             } < set(p.mle.tlv.type) and\
+                             } < p.mle_tlv_types and\
                    p.mle.tlv.mode.network_data == 1
                    ).\
             must_next()
@@ -251,8 +253,8 @@ class Cert_7_1_1_BorderRouterAsLeader(thread_cert.TestCase):
             filter_wpan_dst64(MED).\
             filter_mle_cmd(MLE_CHILD_ID_RESPONSE).\
             filter(lambda p: {
-                              Ipv6Addr(PREFIX_2001[:-3]),
-                              Ipv6Addr(PREFIX_2002[:-3])
+                              PREFIX_2001_ADDR,
+                              PREFIX_2002_ADDR
                              } == set(p.thread_nwd.tlv.prefix) and\
                    p.thread_nwd.tlv.border_router.flag.p == [1, 1] and\
                    p.thread_nwd.tlv.border_router.flag.s == [1, 1] and\
@@ -286,7 +288,7 @@ class Cert_7_1_1_BorderRouterAsLeader(thread_cert.TestCase):
                                   SOURCE_ADDRESS_TLV,
                                   MODE_TLV,
                                   ADDRESS_REGISTRATION_TLV
-                                 } < set(p.mle.tlv.type) and\
+                                 } < p.mle_tlv_types and\
                        set(p.mle.tlv.addr_reg_iid) < set(_pkt.mle.tlv.addr_reg_iid)
                        ).\
                 must_next()
@@ -118,6 +118,7 @@ class Cert_7_1_2_BorderRouterAsRouter(thread_cert.TestCase):
         ROUTER = pv.vars['ROUTER']
         MED = pv.vars['MED']
         SED = pv.vars['SED']
+        LEADER_RLOC16 = pv.vars['LEADER_RLOC16']
         _rpkts = pkts.filter_wpan_src64(ROUTER)
 
         # Step 2: The DUT MUST send properly formatted MLE Advertisements
@@ -125,9 +126,9 @@ class Cert_7_1_2_BorderRouterAsRouter(thread_cert.TestCase):
         # with the server’s information (Prefix, Border Router) to the Leader
         _rpkts.filter_mle_cmd(MLE_CHILD_ID_REQUEST).must_next()
         _rpkts.filter_mle_cmd(MLE_ADVERTISEMENT).must_next().must_verify(
-            lambda p: {SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, ROUTE64_TLV} == set(p.mle.tlv.type))
+            lambda p: {SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, ROUTE64_TLV} == p.mle_tlv_types)
         _rpkts.filter_coap_request(SVR_DATA_URI).must_next().must_verify(
-            lambda p: p.wpan.dst16 == pv.vars['LEADER_RLOC16'] and {
+            lambda p: p.wpan.dst16 == LEADER_RLOC16 and {
                 Ipv6Addr('2001:2:0:1::'), Ipv6Addr('2001:2:0:2::')
             } == set(p.thread_nwd.tlv.prefix) and p.thread_nwd.tlv.border_router.flag.p == [1, 1] and p.thread_nwd.tlv.
             border_router.flag.s == [1, 1] and p.thread_nwd.tlv.border_router.flag.r == [1, 1] and p.thread_nwd.tlv.
@@ -160,10 +161,10 @@ class Cert_7_1_2_BorderRouterAsRouter(thread_cert.TestCase):
         _sed_pkt = pkts.range(
             _rpkts_sed.index).filter_wpan_src64(SED).filter_mle_cmd(MLE_CHILD_UPDATE_REQUEST).must_next()
         _rpkts_med.filter_wpan_dst64(MED).filter_mle_cmd(MLE_CHILD_UPDATE_RESPONSE).must_next().must_verify(
-            lambda p: {SOURCE_ADDRESS_TLV, MODE_TLV, ADDRESS_REGISTRATION_TLV} <= set(p.mle.tlv.type) and p.wpan.dst64
-            == MED and set(p.mle.tlv.addr_reg_iid) < set(_med_pkt.mle.tlv.addr_reg_iid))
+            lambda p: {SOURCE_ADDRESS_TLV, MODE_TLV, ADDRESS_REGISTRATION_TLV} <= p.mle_tlv_types and p.wpan.dst64 ==
+            MED and set(p.mle.tlv.addr_reg_iid) < set(_med_pkt.mle.tlv.addr_reg_iid))
         _rpkts_sed.filter_wpan_dst64(SED).filter_mle_cmd(MLE_CHILD_UPDATE_RESPONSE).must_next().must_verify(
-            lambda p: {SOURCE_ADDRESS_TLV, MODE_TLV, ADDRESS_REGISTRATION_TLV} <= set(p.mle.tlv.type) and set(
+            lambda p: {SOURCE_ADDRESS_TLV, MODE_TLV, ADDRESS_REGISTRATION_TLV} <= p.mle_tlv_types and set(
                 p.mle.tlv.addr_reg_iid) < set(_sed_pkt.mle.tlv.addr_reg_iid))
 
 
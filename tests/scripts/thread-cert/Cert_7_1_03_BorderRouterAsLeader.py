@@ -45,6 +45,8 @@ MED1 = 4
 MTDS = [SED1, MED1]
 PREFIX_2001 = '2001::/64'
 PREFIX_2002 = '2002::/64'
+PREFIX_2001_ADDR = Ipv6Addr(PREFIX_2001[:-3])
+PREFIX_2002_ADDR = Ipv6Addr(PREFIX_2002[:-3])
 
 # Test Purpose and Description:
 # -----------------------------
@@ -144,8 +146,8 @@ class Cert_7_1_3_BorderRouterAsLeader(thread_cert.TestCase):
             filter_LLANMA().\
             filter_mle_cmd(MLE_DATA_RESPONSE).\
             filter(lambda p: {
-                              Ipv6Addr(PREFIX_2001[:-3]),
-                              Ipv6Addr(PREFIX_2002[:-3])
+                              PREFIX_2001_ADDR,
+                              PREFIX_2002_ADDR
                              } == set(p.thread_nwd.tlv.prefix) and\
                    p.thread_nwd.tlv.border_router.flag.p == [1, 1] and\
                    p.thread_nwd.tlv.border_router.flag.s == [1, 1] and\
@@ -177,7 +179,7 @@ class Cert_7_1_3_BorderRouterAsLeader(thread_cert.TestCase):
                                   SOURCE_ADDRESS_TLV,
                                   MODE_TLV,
                                   ADDRESS_REGISTRATION_TLV
-                                 } < set(p.mle.tlv.type) and\
+                                 } < p.mle_tlv_types and\
                        p.mle.tlv.addr_reg_iid is not nullField and\
                        set(_pkt.mle.tlv.addr_reg_iid) > set(p.mle.tlv.addr_reg_iid)
                        ).\
@@ -197,8 +199,8 @@ class Cert_7_1_3_BorderRouterAsLeader(thread_cert.TestCase):
                               SOURCE_ADDRESS_TLV,
                               LEADER_DATA_TLV,
                               ACTIVE_TIMESTAMP_TLV
-                             } == set(p.mle.tlv.type) and\
-                   [Ipv6Addr(PREFIX_2001[:-3])] == p.thread_nwd.tlv.prefix and\
+                             } == p.mle_tlv_types and\
+                   [PREFIX_2001_ADDR] == p.thread_nwd.tlv.prefix and\
                    p.thread_nwd.tlv.border_router.flag.p == [1] and\
                    p.thread_nwd.tlv.border_router.flag.s == [1] and\
                    p.thread_nwd.tlv.border_router.flag.r == [1] and\
@@ -228,7 +230,7 @@ class Cert_7_1_3_BorderRouterAsLeader(thread_cert.TestCase):
                               SOURCE_ADDRESS_TLV,
                               MODE_TLV,
                               ADDRESS_REGISTRATION_TLV
-                             } < set(p.mle.tlv.type) and\
+                             } < p.mle_tlv_types and\
                    p.mle.tlv.addr_reg_iid is not nullField and\
                    set(_pkt.mle.tlv.addr_reg_iid) > set(p.mle.tlv.addr_reg_iid)
                    ).\
@@ -118,6 +118,7 @@ class Cert_7_1_4_BorderRouterAsRouter(thread_cert.TestCase):
         ROUTER = pv.vars['ROUTER']
         MED = pv.vars['MED']
         SED = pv.vars['SED']
+        LEADER_RLOC16 = pv.vars['LEADER_RLOC16']
         _rpkts = pkts.filter_wpan_src64(ROUTER)
 
         # Step 3: The DUT MUST send properly formatted MLE Advertisements
@@ -125,9 +126,9 @@ class Cert_7_1_4_BorderRouterAsRouter(thread_cert.TestCase):
         # with the server’s information (Prefix, Border Router) to the Leader
         _rpkts.filter_mle_cmd(MLE_CHILD_ID_REQUEST).must_next()
         _rpkts.filter_mle_cmd(MLE_ADVERTISEMENT).must_next().must_verify(
-            lambda p: {SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, ROUTE64_TLV} == set(p.mle.tlv.type))
+            lambda p: {SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, ROUTE64_TLV} == p.mle_tlv_types)
         _pkt = _rpkts.filter_coap_request(SVR_DATA_URI).must_next()
-        _pkt.must_verify(lambda p: p.wpan.dst16 == pv.vars['LEADER_RLOC16'] and {
+        _pkt.must_verify(lambda p: p.wpan.dst16 == LEADER_RLOC16 and {
             Ipv6Addr('2001:2:0:1::'), Ipv6Addr('2001:2:0:2::')
         } == set(p.thread_nwd.tlv.prefix) and p.thread_nwd.tlv.border_router.flag.p == [1, 1] and p.thread_nwd.tlv.
                          border_router.flag.s == [1, 1] and p.thread_nwd.tlv.border_router.flag.r == [1, 1] and p.
@@ -138,15 +139,15 @@ class Cert_7_1_4_BorderRouterAsRouter(thread_cert.TestCase):
         # Step 4: Automatically transmits a 2.04 Changed CoAP response to the DUT
         # Step 5: The DUT MUST send a multicast MLE Data Response
         _rpkts.filter_mle_cmd(MLE_DATA_RESPONSE).must_next().must_verify(
-            lambda p: {SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV} == set(
-                p.mle.tlv.type) and {Ipv6Addr('2001:2:0:1::'), Ipv6Addr('2001:2:0:2::')} == set(
-                    p.thread_nwd.tlv.prefix) and p.thread_nwd.tlv.border_router.flag.p == [1, 1] and p.thread_nwd.tlv.
+            lambda p: {SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV} == p.mle_tlv_types
+            and {Ipv6Addr('2001:2:0:1::'), Ipv6Addr('2001:2:0:2::')} == set(
+                p.thread_nwd.tlv.prefix) and p.thread_nwd.tlv.border_router.flag.p == [1, 1] and p.thread_nwd.tlv.
             border_router.flag.s == [1, 1] and p.thread_nwd.tlv.border_router.flag.r == [1, 1] and p.thread_nwd.tlv.
             border_router.flag.o == [1, 1] and p.thread_nwd.tlv.stable == [0, 1, 1, 1, 0, 0, 0])
 
         # Step 6: The DUT MUST send a Child Update Response to MED_1
         _rpkts_med.filter_wpan_dst64(MED).filter_mle_cmd(MLE_CHILD_UPDATE_RESPONSE).must_next().must_verify(
-            lambda p: {SOURCE_ADDRESS_TLV, MODE_TLV, ADDRESS_REGISTRATION_TLV} <= set(p.mle.tlv.type))
+            lambda p: {SOURCE_ADDRESS_TLV, MODE_TLV, ADDRESS_REGISTRATION_TLV} <= p.mle_tlv_types)
 
         # Step 7: The DUT MUST send an MLE Child Update Request to SED_1
         _rpkts_sed.filter_wpan_dst64(SED).filter_mle_cmd(MLE_CHILD_UPDATE_REQUEST).must_next().must_verify(
@@ -158,7 +159,7 @@ class Cert_7_1_4_BorderRouterAsRouter(thread_cert.TestCase):
         _sed_pkt = pkts.range(
             _rpkts_sed.index).filter_wpan_src64(SED).filter_mle_cmd(MLE_CHILD_UPDATE_REQUEST).must_next()
         _rpkts_sed.filter_wpan_dst64(SED).filter_mle_cmd(MLE_CHILD_UPDATE_RESPONSE).must_next().must_verify(
-            lambda p: {SOURCE_ADDRESS_TLV, MODE_TLV, ADDRESS_REGISTRATION_TLV} <= set(p.mle.tlv.type) and set(
+            lambda p: {SOURCE_ADDRESS_TLV, MODE_TLV, ADDRESS_REGISTRATION_TLV} <= p.mle_tlv_types and set(
                 p.mle.tlv.addr_reg_iid) < set(_sed_pkt.mle.tlv.addr_reg_iid))
 
 
@@ -44,6 +44,9 @@ MTDS = [MED, SED]
 PREFIX_2001 = '2001::/64'
 PREFIX_2002 = '2002::/64'
 PREFIX_2003 = '2003::/64'
+PREFIX_2001_ADDR = Ipv6Addr(PREFIX_2001[:-3])
+PREFIX_2002_ADDR = Ipv6Addr(PREFIX_2002[:-3])
+PREFIX_2003_ADDR = Ipv6Addr(PREFIX_2003[:-3])
 
 # Test Purpose and Description:
 # -----------------------------
@@ -143,9 +146,9 @@ class Cert_7_1_5_BorderRouterAsRouter(thread_cert.TestCase):
         pkts.filter_wpan_src64(ROUTER).\
             filter_coap_request(SVR_DATA_URI).\
             filter(lambda p: {
-                              Ipv6Addr(PREFIX_2001[:-3]),
-                              Ipv6Addr(PREFIX_2002[:-3]),
-                              Ipv6Addr(PREFIX_2003[:-3])
+                              PREFIX_2001_ADDR,
+                              PREFIX_2002_ADDR,
+                              PREFIX_2003_ADDR
                              } == set(p.thread_nwd.tlv.prefix)
                    ).\
             must_next()
@@ -159,9 +162,9 @@ class Cert_7_1_5_BorderRouterAsRouter(thread_cert.TestCase):
                 filter_LLANMA().\
                 filter_mle_cmd(MLE_DATA_RESPONSE).\
                 filter(lambda p: {
-                                  Ipv6Addr(PREFIX_2001[:-3]),
-                                  Ipv6Addr(PREFIX_2002[:-3]),
-                                  Ipv6Addr(PREFIX_2003[:-3])
+                                  PREFIX_2001_ADDR,
+                                  PREFIX_2002_ADDR,
+                                  PREFIX_2003_ADDR
                                  } <= set(p.thread_nwd.tlv.prefix)
                        ).\
                 must_next()
@@ -188,7 +191,7 @@ class Cert_7_1_5_BorderRouterAsRouter(thread_cert.TestCase):
                               SOURCE_ADDRESS_TLV,
                               MODE_TLV,
                               ADDRESS_REGISTRATION_TLV
-                             } < set(p.mle.tlv.type) and\
+                             } < p.mle_tlv_types and\
                    len(p.mle.tlv.addr_reg_iid) >= 3 and\
                    set(p.mle.tlv.addr_reg_iid) < set(_pkt.mle.tlv.addr_reg_iid)
                    ).\
@@ -214,10 +217,10 @@ class Cert_7_1_5_BorderRouterAsRouter(thread_cert.TestCase):
                               SOURCE_ADDRESS_TLV,
                               LEADER_DATA_TLV,
                               ACTIVE_TIMESTAMP_TLV
-                             } == set(p.mle.tlv.type) and\
+                             } == p.mle_tlv_types and\
                              {
-                              Ipv6Addr(PREFIX_2001[:-3]),
-                              Ipv6Addr(PREFIX_2003[:-3])
+                              PREFIX_2001_ADDR,
+                              PREFIX_2003_ADDR
                              } == set(p.thread_nwd.tlv.prefix) and\
                    p.mle.tlv.leader_data.data_version  ==
                    _dv_pkt.mle.tlv.leader_data.data_version and\
@@ -246,7 +249,7 @@ class Cert_7_1_5_BorderRouterAsRouter(thread_cert.TestCase):
                               SOURCE_ADDRESS_TLV,
                               MODE_TLV,
                               ADDRESS_REGISTRATION_TLV
-                             } < set(p.mle.tlv.type) and\
+                             } < p.mle_tlv_types and\
                    len(p.mle.tlv.addr_reg_iid) >= 2 and\
                    set(p.mle.tlv.addr_reg_iid) < set(_pkt.mle.tlv.addr_reg_iid)
                    ).\
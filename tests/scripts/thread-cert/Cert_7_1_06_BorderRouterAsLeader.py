@@ -46,6 +46,7 @@ SED = 5
 
 MTDS = [MED, SED]
 PREFIX_2001 = '2001:0db8:0001::/64'
+PREFIX_2001_ADDR = Ipv6Addr(PREFIX_2001[:-3])
 
 # Test Purpose and Description:
 # -----------------------------
@@ -195,14 +196,15 @@ class Cert_7_1_6_BorderRouterAsLeader(thread_cert.TestCase):
         # Step 4: Leader sends a CoAP ACK frame to each of Router_1 and
         #         Router_2
         for i in (1, 2):
+            _rloc16 = pv.vars['ROUTER_%d_RLOC16' % i]
             with pkts.save_index():
                 pkts.filter_wpan_src64(pv.vars['ROUTER_%d' %i]).\
                     filter_wpan_dst16(LEADER_RLOC16).\
                     filter_coap_request(SVR_DATA_URI).\
                     filter(lambda p:
-                           [Ipv6Addr(PREFIX_2001[:-3])] ==
+                           [PREFIX_2001_ADDR] ==
                            p.thread_nwd.tlv.prefix and\
-                           [pv.vars['ROUTER_%d_RLOC16' %i]] ==
+                           [_rloc16] ==
                            p.thread_nwd.tlv.border_router_16
                            ).\
                     must_next()
@@ -229,12 +231,12 @@ class Cert_7_1_6_BorderRouterAsLeader(thread_cert.TestCase):
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV,
                               LEADER_DATA_TLV
-                             } <= set(p.mle.tlv.type) and\
+                             } <= p.mle_tlv_types and\
                    p.thread_nwd.tlv.border_router.flag.p == [1] and\
                    p.thread_nwd.tlv.border_router.flag.s == [1] and\
                    p.thread_nwd.tlv.border_router.flag.r == [1] and\
                    p.thread_nwd.tlv.border_router.flag.o == [1] and\
-                   [Ipv6Addr(PREFIX_2001[:-3])] ==
+                   [PREFIX_2001_ADDR] ==
                    p.thread_nwd.tlv.prefix
                    ).\
             must_next()
@@ -246,12 +248,12 @@ class Cert_7_1_6_BorderRouterAsLeader(thread_cert.TestCase):
                                   NETWORK_DATA_TLV,
                                   SOURCE_ADDRESS_TLV,
                                   LEADER_DATA_TLV
-                                 } <= set(p.mle.tlv.type) and\
+                                 } <= p.mle_tlv_types and\
                                  {
                                   NWD_BORDER_ROUTER_TLV,
                                   NWD_BORDER_ROUTER_TLV,
                                   NWD_6LOWPAN_ID_TLV
-                                 } <= set(p.thread_nwd.tlv.type) and\
+                                 } <= p.thread_nwd_tlv_types and\
                        p.thread_nwd.tlv.border_router.flag.p == [1, 1] and\
                        p.thread_nwd.tlv.border_router.flag.s == [1, 1] and\
                        p.thread_nwd.tlv.border_router.flag.r == [1, 1] and\
@@ -262,7 +264,7 @@ class Cert_7_1_6_BorderRouterAsLeader(thread_cert.TestCase):
                         (_dr_pkt.mle.tlv.leader_data.stable_data_version + 1) % 256 or\
                        p.mle.tlv.leader_data.stable_data_version ==
                         (_pkt.mle.tlv.leader_data.stable_data_version + 1) % 256) and\
-                       [Ipv6Addr(PREFIX_2001[:-3])] ==
+                       [PREFIX_2001_ADDR] ==
                        p.thread_nwd.tlv.prefix
                        ).\
                 must_next()
@@ -287,8 +289,8 @@ class Cert_7_1_6_BorderRouterAsLeader(thread_cert.TestCase):
                               SOURCE_ADDRESS_TLV,
                               LEADER_DATA_TLV,
                               ACTIVE_TIMESTAMP_TLV
-                             } == set(p.mle.tlv.type) and\
-                   [Ipv6Addr(PREFIX_2001[:-3])] ==
+                             } == p.mle_tlv_types and\
+                   [PREFIX_2001_ADDR] ==
                    p.thread_nwd.tlv.prefix and\
                    p.thread_nwd.tlv.stable == [1, 1, 1] and\
                    p.mle.tlv.leader_data.data_version  ==
@@ -319,8 +321,8 @@ class Cert_7_1_6_BorderRouterAsLeader(thread_cert.TestCase):
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV,
                               LEADER_DATA_TLV,
-                             } <= set(p.mle.tlv.type) and\
-                   [Ipv6Addr(PREFIX_2001[:-3])] ==
+                             } <= p.mle_tlv_types and\
+                   [PREFIX_2001_ADDR] ==
                    p.thread_nwd.tlv.prefix and\
                    [ROUTER_2_RLOC16] == p.thread_nwd.tlv.border_router_16 and\
                    p.mle.tlv.leader_data.data_version ==
@@ -342,8 +344,8 @@ class Cert_7_1_6_BorderRouterAsLeader(thread_cert.TestCase):
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV,
                               LEADER_DATA_TLV,
-                             } <= set(p.mle.tlv.type) and\
-                   [Ipv6Addr(PREFIX_2001[:-3])] ==
+                             } <= p.mle_tlv_types and\
+                   [PREFIX_2001_ADDR] ==
                    p.thread_nwd.tlv.prefix and\
                    p.thread_nwd.tlv.border_router_16 is nullField and\
                    p.mle.tlv.leader_data.data_version ==
@@ -373,12 +375,12 @@ class Cert_7_1_6_BorderRouterAsLeader(thread_cert.TestCase):
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV,
                               ROUTE64_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                              {
                               NWD_BORDER_ROUTER_TLV,
                               NWD_6LOWPAN_ID_TLV
-                             } <= set(p.thread_nwd.tlv.type) and\
-                   [Ipv6Addr(PREFIX_2001[:-3])] ==
+                             } <= p.thread_nwd_tlv_types and\
+                   [PREFIX_2001_ADDR] ==
                    p.thread_nwd.tlv.prefix and\
                    [ROUTER_2_RLOC16] == p.thread_nwd.tlv.border_router_16
                    ).\
@@ -397,7 +399,7 @@ class Cert_7_1_6_BorderRouterAsLeader(thread_cert.TestCase):
                 filter_wpan_dst16(LEADER_RLOC16).\
                 filter_coap_request(SVR_DATA_URI).\
                 filter(lambda p:
-                       [Ipv6Addr(PREFIX_2001[:-3])] ==
+                       [PREFIX_2001_ADDR] ==
                        p.thread_nwd.tlv.prefix and\
                        [ROUTER_1_RLOC16] ==
                        p.thread_nwd.tlv.border_router_16
@@ -427,10 +429,10 @@ class Cert_7_1_6_BorderRouterAsLeader(thread_cert.TestCase):
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV,
                               LEADER_DATA_TLV
-                             } <= set(p.mle.tlv.type) and\
+                             } <= p.mle_tlv_types and\
                    {ROUTER_1_RLOC16, ROUTER_2_RLOC16} ==
                    set(p.thread_nwd.tlv.border_router_16) and\
-                   [Ipv6Addr(PREFIX_2001[:-3])] ==
+                   [PREFIX_2001_ADDR] ==
                    p.thread_nwd.tlv.prefix and\
                    p.mle.tlv.leader_data.data_version ==
                    (_pkt.mle.tlv.leader_data.data_version + 1) % 256 and\
@@ -459,8 +461,8 @@ class Cert_7_1_6_BorderRouterAsLeader(thread_cert.TestCase):
                               SOURCE_ADDRESS_TLV,
                               LEADER_DATA_TLV,
                               ACTIVE_TIMESTAMP_TLV
-                             } == set(p.mle.tlv.type) and\
-                   [Ipv6Addr(PREFIX_2001[:-3])] ==
+                             } == p.mle_tlv_types and\
+                   [PREFIX_2001_ADDR] ==
                    p.thread_nwd.tlv.prefix and\
                    p.mle.tlv.leader_data.data_version  ==
                    _dr_pkt2.mle.tlv.leader_data.data_version and\
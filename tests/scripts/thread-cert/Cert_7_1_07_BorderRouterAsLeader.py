@@ -48,6 +48,8 @@ SED = 5
 MTDS = [MED, SED]
 PREFIX_1 = '2001:0db8:0001::/64'
 PREFIX_2 = '2001:0db8:0002::/64'
+PREFIX_1_ADDR = Ipv6Addr(PREFIX_1[:-3])
+PREFIX_2_ADDR = Ipv6Addr(PREFIX_2[:-3])
 
 # Test Purpose and Description:
 # -----------------------------
@@ -220,13 +222,14 @@ class Cert_7_1_7_BorderRouterAsLeader(thread_cert.TestCase):
         #         Router_2
         with pkts.save_index():
             for node in ('ROUTER_1', 'ROUTER_2'):
+                _rloc16 = pv.vars['%s_RLOC16' % node]
                 _dn_pkt = pkts.filter_wpan_src64(pv.vars['%s' %node]).\
                     filter_wpan_dst16(LEADER_RLOC16).\
                     filter_coap_request(SVR_DATA_URI).\
                     filter(lambda p:
-                           [Ipv6Addr(PREFIX_1[:-3])] ==
+                           [PREFIX_1_ADDR] ==
                            p.thread_nwd.tlv.prefix and\
-                           [pv.vars['%s_RLOC16' %node]] ==
+                           [_rloc16] ==
                            p.thread_nwd.tlv.border_router_16
                            ).\
                     must_next()
@@ -258,8 +261,8 @@ class Cert_7_1_7_BorderRouterAsLeader(thread_cert.TestCase):
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV,
                               LEADER_DATA_TLV
-                             } <= set(p.mle.tlv.type) and\
-                   [Ipv6Addr(PREFIX_1[:-3])] ==
+                             } <= p.mle_tlv_types and\
+                   [PREFIX_1_ADDR] ==
                    p.thread_nwd.tlv.prefix and\
                    p.mle.tlv.leader_data.data_version ==
                    (_pkt.mle.tlv.leader_data.data_version + 1) % 256 and\
@@ -275,11 +278,11 @@ class Cert_7_1_7_BorderRouterAsLeader(thread_cert.TestCase):
                                   NETWORK_DATA_TLV,
                                   SOURCE_ADDRESS_TLV,
                                   LEADER_DATA_TLV
-                                 } <= set(p.mle.tlv.type) and\
+                                 } <= p.mle_tlv_types and\
                                  {
                                   NWD_BORDER_ROUTER_TLV,
                                   NWD_6LOWPAN_ID_TLV
-                                 } <= set(p.thread_nwd.tlv.type) and\
+                                 } <= p.thread_nwd_tlv_types and\
                        p.mle.tlv.leader_data.data_version ==
                        (_dr_pkt.mle.tlv.leader_data.data_version + 1) % 256 and\
                        p.mle.tlv.leader_data.stable_data_version ==
@@ -288,7 +291,7 @@ class Cert_7_1_7_BorderRouterAsLeader(thread_cert.TestCase):
                                p.thread_nwd.tlv.border_router_16) and\
                        is_sublist([0, 1, 1, 1, 0], p.thread_nwd.tlv.stable) and\
                        is_sublist([1], getattr(p.thread_nwd.tlv, '6co').flag.c) and\
-                       is_sublist([Ipv6Addr(PREFIX_1[:-3])], p.thread_nwd.tlv.prefix)
+                       is_sublist([PREFIX_1_ADDR], p.thread_nwd.tlv.prefix)
                        ).\
                 must_next()
 
@@ -313,8 +316,8 @@ class Cert_7_1_7_BorderRouterAsLeader(thread_cert.TestCase):
                               SOURCE_ADDRESS_TLV,
                               LEADER_DATA_TLV,
                               ACTIVE_TIMESTAMP_TLV
-                             } == set(p.mle.tlv.type) and\
-                   is_sublist([Ipv6Addr(PREFIX_1[:-3])], p.thread_nwd.tlv.prefix) and\
+                             } == p.mle_tlv_types and\
+                   is_sublist([PREFIX_1_ADDR], p.thread_nwd.tlv.prefix) and\
                    is_sublist([1, 1, 1], p.thread_nwd.tlv.stable) and\
                    is_sublist([1], getattr(p.thread_nwd.tlv, '6co').flag.c) and\
                    is_sublist([0xFFFE], p.thread_nwd.tlv.border_router_16)
@@ -336,7 +339,7 @@ class Cert_7_1_7_BorderRouterAsLeader(thread_cert.TestCase):
                   filter_wpan_dst16(LEADER_RLOC16).\
                   filter_coap_request(SVR_DATA_URI).\
                   filter(lambda p:
-                         [Ipv6Addr(PREFIX_2[:-3])] ==
+                         [PREFIX_2_ADDR] ==
                          p.thread_nwd.tlv.prefix and\
                          [ROUTER_2_RLOC16] ==
                          p.thread_nwd.tlv.border_router_16
@@ -377,17 +380,17 @@ class Cert_7_1_7_BorderRouterAsLeader(thread_cert.TestCase):
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV,
                               LEADER_DATA_TLV
-                             } <= set(p.mle.tlv.type) and\
+                             } <= p.mle_tlv_types and\
                              {
                               NWD_BORDER_ROUTER_TLV,
                               NWD_6LOWPAN_ID_TLV
-                             } <= set(p.thread_nwd.tlv.type) and\
+                             } <= p.thread_nwd_tlv_types and\
                    is_sublist([ROUTER_1_RLOC16, ROUTER_2_RLOC16],
                            p.thread_nwd.tlv.border_router_16) and\
                    is_sublist([0, 1, 1, 1, 1, 1, 1],
                            p.thread_nwd.tlv.stable) and\
                    is_sublist([1, 1], getattr(p.thread_nwd.tlv, '6co').flag.c) and\
-                   is_sublist([Ipv6Addr(PREFIX_1[:-3]), Ipv6Addr(PREFIX_2[:-3])],
+                   is_sublist([PREFIX_1_ADDR, PREFIX_2_ADDR],
                            p.thread_nwd.tlv.prefix) and\
                    p.mle.tlv.leader_data.data_version ==
                    (_dr_pkt1.mle.tlv.leader_data.data_version + 1) % 256 and\
@@ -429,11 +432,11 @@ class Cert_7_1_7_BorderRouterAsLeader(thread_cert.TestCase):
                                   SOURCE_ADDRESS_TLV,
                                   LEADER_DATA_TLV,
                                   ACTIVE_TIMESTAMP_TLV
-                                 } == set(p.mle.tlv.type) and\
+                                 } == p.mle_tlv_types and\
                        is_sublist([1, 1, 1, 1, 1, 1],
                                p.thread_nwd.tlv.stable) and\
                        is_sublist([1, 1], getattr(p.thread_nwd.tlv, '6co').flag.c) and\
-                       is_sublist([Ipv6Addr(PREFIX_1[:-3]), Ipv6Addr(PREFIX_2[:-3])],
+                       is_sublist([PREFIX_1_ADDR, PREFIX_2_ADDR],
                                p.thread_nwd.tlv.prefix) and\
                        is_sublist([0xFFFE, 0xFFFE], p.thread_nwd.tlv.border_router_16)
                        ).\
@@ -504,16 +507,16 @@ class Cert_7_1_7_BorderRouterAsLeader(thread_cert.TestCase):
                               NETWORK_DATA_TLV,
                               SOURCE_ADDRESS_TLV,
                               LEADER_DATA_TLV
-                             } <= set(p.mle.tlv.type) and\
+                             } <= p.mle_tlv_types and\
                              {
                               NWD_BORDER_ROUTER_TLV,
                               NWD_6LOWPAN_ID_TLV
-                             } <= set(p.thread_nwd.tlv.type) and\
+                             } <= p.thread_nwd_tlv_types and\
                    p.mle.tlv.leader_data.data_version ==
                    (_dr_pkt2.mle.tlv.leader_data.data_version + 1) % 256 and\
                    p.mle.tlv.leader_data.stable_data_version ==
                    (_dr_pkt2.mle.tlv.leader_data.stable_data_version + 1) % 256 and\
-                   is_sublist([Ipv6Addr(PREFIX_1[:-3]), Ipv6Addr(PREFIX_2[:-3])],
+                   is_sublist([PREFIX_1_ADDR, PREFIX_2_ADDR],
                            p.thread_nwd.tlv.prefix) and\
                    is_sublist([1,0], getattr(p.thread_nwd.tlv, '6co').flag.c)
                    ).\
@@ -548,8 +551,8 @@ class Cert_7_1_7_BorderRouterAsLeader(thread_cert.TestCase):
                               SOURCE_ADDRESS_TLV,
                               LEADER_DATA_TLV,
                               ACTIVE_TIMESTAMP_TLV
-                             } == set(p.mle.tlv.type) and\
-                   is_sublist([Ipv6Addr(PREFIX_1[:-3]), Ipv6Addr(PREFIX_2[:-3])],
+                             } == p.mle_tlv_types and\
+                   is_sublist([PREFIX_1_ADDR, PREFIX_2_ADDR],
                            p.thread_nwd.tlv.prefix) and\
                    is_sublist([1, 1, 1, 1, 1], p.thread_nwd.tlv.stable) and\
                    is_sublist([0xFFFE], p.thread_nwd.tlv.border_router_16) and\
@@ -43,6 +43,8 @@ FED = 3
 
 PREFIX_2001 = '2001::/64'
 PREFIX_2002 = '2002::/64'
+PREFIX_2001_ADDR = Ipv6Addr(PREFIX_2001[:-3])
+PREFIX_2002_ADDR = Ipv6Addr(PREFIX_2002[:-3])
 
 # Test Purpose and Description:
 # -----------------------------
@@ -140,8 +142,8 @@ class Cert_7_1_8_BorderRouterAsFED(thread_cert.TestCase):
             filter_ipv6_dst(LEADER_ALOC).\
             filter_coap_request(SVR_DATA_URI).\
             filter(lambda p: {
-                              Ipv6Addr(PREFIX_2001[:-3]),
-                              Ipv6Addr(PREFIX_2002[:-3])
+                              PREFIX_2001_ADDR,
+                              PREFIX_2002_ADDR
                              } == set(p.thread_nwd.tlv.prefix) and\
                    p.thread_nwd.tlv.border_router_16 == [FED_RLOC16, FED_RLOC16]
                    ).\
@@ -160,8 +162,8 @@ class Cert_7_1_8_BorderRouterAsFED(thread_cert.TestCase):
                 filter_LLANMA().\
                 filter_mle_cmd(MLE_DATA_RESPONSE).\
                 filter(lambda p: {
-                                  Ipv6Addr(PREFIX_2001[:-3]),
-                                  Ipv6Addr(PREFIX_2002[:-3])
+                                  PREFIX_2001_ADDR,
+                                  PREFIX_2002_ADDR
                                  } == set(p.thread_nwd.tlv.prefix) and\
                        NWD_6LOWPAN_ID_TLV in p.thread_nwd.tlv.type and\
                        p.thread_nwd.tlv.border_router.flag.p == [1, 1] and\
@@ -178,8 +180,8 @@ class Cert_7_1_8_BorderRouterAsFED(thread_cert.TestCase):
             filter_LLANMA().\
             filter_mle_cmd(MLE_DATA_RESPONSE).\
             filter(lambda p: {
-                              Ipv6Addr(PREFIX_2001[:-3]),
-                              Ipv6Addr(PREFIX_2002[:-3])
+                              PREFIX_2001_ADDR,
+                              PREFIX_2002_ADDR
                              } == set(p.thread_nwd.tlv.prefix) and\
                    NWD_6LOWPAN_ID_TLV in p.thread_nwd.tlv.type and\
                    p.thread_nwd.tlv.border_router.flag.p == [1, 1] and\
@@ -156,10 +156,11 @@ class Cert_8_1_01_Commissioning(thread_cert.TestCase):
                               NM_STEERING_DATA_TLV,
                               NM_JOINER_UDP_PORT_TLV,
                               NM_DISCOVERY_RESPONSE_TLV
-                            } <= set(p.thread_meshcop.tlv.type) and\
+                            } <= p.thread_meshcop_tlv_types and\
                    p.thread_meshcop.tlv.discovery_rsp_ver == COMMISSIONER_VERSION
                   ).\
             must_next()
+        _rs_udp_ports = frozenset(_rs_pkt.thread_meshcop.tlv.udp_port)
 
         # Step 5: Verify the following details occur in the exchange between
         #         Joiner and the Commissioner
@@ -172,8 +173,8 @@ class Cert_8_1_01_Commissioning(thread_cert.TestCase):
         pkts.filter_wpan_dst64(COMMISSIONER).\
             filter(lambda p:
                    p.dtls.handshake.type == [HANDSHAKE_CLIENT_HELLO] and\
-                   p.udp.srcport in _rs_pkt.thread_meshcop.tlv.udp_port and\
-                   p.udp.dstport in _rs_pkt.thread_meshcop.tlv.udp_port
+                   p.udp.srcport in _rs_udp_ports and\
+                   p.udp.dstport in _rs_udp_ports
                    ).\
             must_next()
 
@@ -82,33 +82,36 @@ class Cert_8_1_02_Commissioning(thread_cert.TestCase):
             lambda p: {
                 NM_EXTENDED_PAN_ID_TLV, NM_NETWORK_NAME_TLV, NM_STEERING_DATA_TLV, NM_COMMISSIONER_UDP_PORT_TLV,
                 NM_JOINER_UDP_PORT_TLV, NM_DISCOVERY_RESPONSE_TLV
-            } == set(p.thread_meshcop.tlv.type))
+            } == p.thread_meshcop_tlv_types)
 
         # 2. Joiner_1 sends an initial DTLS-ClientHello handshake record to the Commissioner
-        _cpkts2.range(_cpkts.index).filter(lambda p: p.dtls.handshake.type == [HANDSHAKE_CLIENT_HELLO]).must_next()
+        _cpkts2.range(_cpkts.index).filter_dfilter('dtls').filter(
+            lambda p: p.dtls.handshake.type == [HANDSHAKE_CLIENT_HELLO]).must_next()
 
         # 3. The Commissioner must correctly receive the initial DTLS-ClientHello handshake record and send a DTLS-HelloVerifyRequest handshake record to Joiner_1
-        _pkt = _cpkts.range(
-            _cpkts2.index).filter(lambda p: p.dtls.handshake.type == [HANDSHAKE_HELLO_VERIFY_REQUEST]).must_next()
+        _pkt = _cpkts.range(_cpkts2.index).filter_dfilter('dtls').filter(
+            lambda p: p.dtls.handshake.type == [HANDSHAKE_HELLO_VERIFY_REQUEST]).must_next()
         _pkt.must_verify(lambda p: p.dtls.handshake.cookie is not None)
 
         # 4. Joiner_1 receives the DTLS-HelloVerifyRequest handshake record and sends a subsequent DTLS-ClientHello handshake record in one UDP datagram to the Commissioner
         # 5. Verify that both DTLS-HelloVerifyRequest and subsequent DTLS-ClientHello contain the same cookie
-        _cpkts2.filter(lambda p: p.dtls.handshake.type == [HANDSHAKE_CLIENT_HELLO]).must_next().must_verify(
-            lambda p: p.dtls.handshake.cookie == _pkt.dtls.handshake.cookie)
+        _ch_pkt = _cpkts2.filter_dfilter('dtls').filter(
+            lambda p: p.dtls.handshake.type == [HANDSHAKE_CLIENT_HELLO]).must_next()
+        _ch_pkt.must_verify(lambda p: p.dtls.handshake.cookie == _pkt.dtls.handshake.cookie)
 
         # 6. The Commissioner must correctly receive the subsequent DTLSClientHello handshake record and then send, in order, DTLSServerHello, DTLS-ServerKeyExchange and DTLSServerHelloDone handshake records to Joiner_1
-        _cpkts.filter(
+        _cpkts.filter_dfilter('dtls').filter(
             lambda p: p.dtls.handshake.type ==
             [HANDSHAKE_SERVER_HELLO, HANDSHAKE_SERVER_KEY_EXCHANGE, HANDSHAKE_SERVER_HELLO_DONE]).must_next()
 
         # 7. Joiner_1 receives the DTLS-ServerHello, DTLSServerKeyExchange and DTLS-ServerHelloDone handshake records and sends, in order, a DTLS-ClientKeyExchange handshake record, a DTLS-ChangeCipherSpec record and an encrypted DTLS-Finished handshake record to the Commissioner.
-        _cpkts2.filter(lambda p: p.dtls.handshake.type == [HANDSHAKE_CLIENT_KEY_EXCHANGE]).must_next().must_verify(
-            lambda p: p.dtls.handshake.type == [HANDSHAKE_CLIENT_KEY_EXCHANGE] and set(
-                p.dtls.record.content_type) == {CONTENT_CHANGE_CIPHER_SPEC, CONTENT_HANDSHAKE})
+        _cke_pkt = _cpkts2.filter_dfilter('dtls').filter(
+            lambda p: p.dtls.handshake.type == [HANDSHAKE_CLIENT_KEY_EXCHANGE]).must_next()
+        _cke_pkt.must_verify(lambda p: p.dtls.handshake.type == [HANDSHAKE_CLIENT_KEY_EXCHANGE] and set(
+            p.dtls.record.content_type) == {CONTENT_CHANGE_CIPHER_SPEC, CONTENT_HANDSHAKE})
 
         # 8. The Commissioner must receive the DTLS-ClientKeyExchange handshake record, the DTLS-ChangeCipherSpec and the encrypted DTLS-Finished handshake record, and then send a DTLS-Alert record with error code 20 (bad record MAC) - in one UDP datagram - to Joiner_1
-        _cpkts.filter(
+        _cpkts.filter_dfilter('dtls').filter(
             lambda p: p.dtls.record.content_type == [CONTENT_ALERT] and p.dtls.alert_message.desc == 20).must_next()
 
 
@@ -161,9 +161,10 @@ class Cert_8_2_05_JoinerRouter(thread_cert.TestCase):
                               NM_COMMISSIONER_UDP_PORT_TLV,
                               NM_JOINER_UDP_PORT_TLV,
                               NM_DISCOVERY_RESPONSE_TLV
-                            } == set(p.thread_meshcop.tlv.type)
+                            } == p.thread_meshcop_tlv_types
                   ).\
             must_next()
+        _rs_udp_ports = frozenset(_rs_pkt.thread_meshcop.tlv.udp_port)
 
         # Step 3: Verify that the following details occur in the exchange between the
         #         Joiner, the Joiner_Router and the Commissioner
@@ -176,8 +177,8 @@ class Cert_8_2_05_JoinerRouter(thread_cert.TestCase):
         _ch_pkt = pkts.filter_ipv6_dst(JOINER_ROUTER_LLA).\
             filter(lambda p:
                    p.dtls.handshake.type == [HANDSHAKE_CLIENT_HELLO] and\
-                   p.udp.srcport in _rs_pkt.thread_meshcop.tlv.udp_port and\
-                   p.udp.dstport in _rs_pkt.thread_meshcop.tlv.udp_port
+                   p.udp.srcport in _rs_udp_ports and\
+                   p.udp.dstport in _rs_udp_ports
                    ).\
             must_next()
 
@@ -198,7 +199,7 @@ class Cert_8_2_05_JoinerRouter(thread_cert.TestCase):
                               NM_JOINER_UDP_PORT_TLV,
                               NM_JOINER_IID_TLV,
                               NM_JOINER_ROUTER_LOCATOR_TLV
-                             } == set(p.thread_meshcop.tlv.type) and\
+                             } == p.thread_meshcop_tlv_types and\
                    p.thread_meshcop.tlv.udp_port == [_ch_pkt.udp.dstport] and\
                    p.thread_meshcop.tlv.jr_locator == JOINER_ROUTER_RLOC16
                    ).\
@@ -223,7 +224,7 @@ class Cert_8_2_05_JoinerRouter(thread_cert.TestCase):
                               NM_JOINER_IID_TLV,
                               NM_JOINER_ROUTER_LOCATOR_TLV,
                               NM_JOINER_ROUTER_KEK_TLV
-                             } == set(p.thread_meshcop.tlv.type) and\
+                             } == p.thread_meshcop_tlv_types and\
                    p.thread_meshcop.tlv.udp_port == [_ch_pkt.udp.dstport] and\
                    p.thread_meshcop.tlv.jr_locator == JOINER_ROUTER_RLOC16
                    ).\
@@ -159,15 +159,15 @@ class Cert_8_3_01_CommissionerPetition(thread_cert.TestCase):
                               SOURCE_ADDRESS_TLV,
                               ACTIVE_TIMESTAMP_TLV,
                               LEADER_DATA_TLV
-                             } == set(p.mle.tlv.type) and\
+                             } == p.mle_tlv_types and\
                              {
                               NWD_COMMISSIONING_DATA_TLV
-                             } == set(p.thread_nwd.tlv.type) and\
+                             } == p.thread_nwd_tlv_types and\
                              {
                               NM_BORDER_AGENT_LOCATOR_TLV,
                               NM_COMMISSIONER_SESSION_ID_TLV,
                               NM_STEERING_DATA_TLV
-                             } == set(p.thread_meshcop.tlv.type) and\
+                             } == p.thread_meshcop_tlv_types and\
                    p.mle.tlv.leader_data.data_version ==
                    (_pkt.mle.tlv.leader_data.data_version + 1) % 256 and\
                    p.thread_nwd.tlv.stable == [0]
@@ -252,15 +252,15 @@ class Cert_8_3_01_CommissionerPetition(thread_cert.TestCase):
                               SOURCE_ADDRESS_TLV,
                               ACTIVE_TIMESTAMP_TLV,
                               LEADER_DATA_TLV
-                             } == set(p.mle.tlv.type) and\
+                             } == p.mle_tlv_types and\
                              {
                               NWD_COMMISSIONING_DATA_TLV
-                             } == set(p.thread_nwd.tlv.type) and\
+                             } == p.thread_nwd_tlv_types and\
                              {
                               NM_BORDER_AGENT_LOCATOR_TLV,
                               NM_COMMISSIONER_SESSION_ID_TLV,
                               NM_STEERING_DATA_TLV
-                             } == set(p.thread_meshcop.tlv.type) and\
+                             } == p.thread_meshcop_tlv_types and\
                    p.mle.tlv.leader_data.data_version ==
                    (_dr_pkt.mle.tlv.leader_data.data_version + 1) % 256 and\
                    p.thread_nwd.tlv.stable == [0]
@@ -314,13 +314,13 @@ class Cert_8_3_01_CommissionerPetition(thread_cert.TestCase):
                               SOURCE_ADDRESS_TLV,
                               ACTIVE_TIMESTAMP_TLV,
                               LEADER_DATA_TLV
-                             } == set(p.mle.tlv.type) and\
+                             } == p.mle_tlv_types and\
                              {
                               NWD_COMMISSIONING_DATA_TLV
-                             } == set(p.thread_nwd.tlv.type) and\
+                             } == p.thread_nwd_tlv_types and\
                              {
                               NM_COMMISSIONER_SESSION_ID_TLV
-                             } == set(p.thread_meshcop.tlv.type) and\
+                             } == p.thread_meshcop_tlv_types and\
                    (p.mle.tlv.leader_data.data_version -
                    _dr_pkt2.mle.tlv.leader_data.data_version) % 256 <= 127 and\
                    p.thread_nwd.tlv.stable == [0]
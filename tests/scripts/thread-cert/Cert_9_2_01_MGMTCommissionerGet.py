@@ -34,10 +34,15 @@ import thread_cert
 from pktverify.consts import MLE_DATA_RESPONSE, MGMT_COMMISSIONER_GET_URI, NM_CHANNEL_TLV, NM_COMMISSIONER_ID_TLV, NM_COMMISSIONER_SESSION_ID_TLV, NM_STEERING_DATA_TLV, NM_BORDER_AGENT_LOCATOR_TLV, LEADER_DATA_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV, SOURCE_ADDRESS_TLV, NWD_COMMISSIONING_DATA_TLV, NM_PAN_ID_TLV, NM_NETWORK_NAME_TLV
 from pktverify.packet_verifier import PacketVerifier
 from pktverify.null_field import nullField
+from pktverify.utils import tlv_mask
 
 COMMISSIONER = 1
 LEADER = 2
 
+SESSION_ID_STEERING_DATA_TLVS = tlv_mask({NM_COMMISSIONER_SESSION_ID_TLV, NM_STEERING_DATA_TLV})
+SESSION_ID_PAN_ID_TLVS = tlv_mask({NM_COMMISSIONER_SESSION_ID_TLV, NM_PAN_ID_TLV})
+BORDER_AGENT_NETWORK_NAME_TLVS = tlv_mask({NM_BORDER_AGENT_LOCATOR_TLV, NM_NETWORK_NAME_TLV})
+
 # Test Purpose and Description:
 # -----------------------------
 # The purpose of this test case is to verify Leader's and active Commissioner's behavior via
@@ -146,7 +151,7 @@ class Cert_9_2_01_MGMTCommissionerGet(thread_cert.TestCase):
                               NM_COMMISSIONER_SESSION_ID_TLV,
                               NM_BORDER_AGENT_LOCATOR_TLV,
                               NM_STEERING_DATA_TLV
-                             } == set(p.thread_meshcop.tlv.type) and\
+                             } == p.thread_meshcop_tlv_types and\
                    p.thread_meshcop.tlv.ba_locator is not nullField and\
                    p.thread_meshcop.tlv.commissioner_sess_id is not nullField and\
                    p.thread_meshcop.tlv.steering_data is not nullField
@@ -163,11 +168,7 @@ class Cert_9_2_01_MGMTCommissionerGet(thread_cert.TestCase):
         _mgmt_get_pkt = pkts.filter_wpan_src64(COMMISSIONER).\
             filter_ipv6_2dsts(LEADER_ALOC, LEADER_RLOC).\
             filter_coap_request(MGMT_COMMISSIONER_GET_URI).\
-            filter(lambda p: {
-                              NM_COMMISSIONER_SESSION_ID_TLV,
-                              NM_STEERING_DATA_TLV
-                             } <= set(p.thread_meshcop.tlv.type)
-                   ).\
+            filter_tlvs(thread_meshcop_tlv_type=SESSION_ID_STEERING_DATA_TLVS).\
            must_next()
 
         # Step 5: Leader sends a MGMT_COMMISSIONER_GET.rsp to Commissioner with
@@ -183,7 +184,7 @@ class Cert_9_2_01_MGMTCommissionerGet(thread_cert.TestCase):
             filter(lambda p: {
                               NM_COMMISSIONER_SESSION_ID_TLV,
                               NM_STEERING_DATA_TLV
-                             } == set(p.thread_meshcop.tlv.type) and\
+                             } == p.thread_meshcop_tlv_types and\
                    p.thread_meshcop.tlv.commissioner_sess_id is not nullField and\
                    p.thread_meshcop.tlv.steering_data is not nullField
                    ).\
@@ -199,11 +200,7 @@ class Cert_9_2_01_MGMTCommissionerGet(thread_cert.TestCase):
         _mgmt_get_pkt = pkts.filter_wpan_src64(COMMISSIONER).\
             filter_ipv6_2dsts(LEADER_ALOC, LEADER_RLOC).\
             filter_coap_request(MGMT_COMMISSIONER_GET_URI).\
-            filter(lambda p: {
-                              NM_COMMISSIONER_SESSION_ID_TLV,
-                              NM_PAN_ID_TLV
-                             } <= set(p.thread_meshcop.tlv.type)
-                   ).\
+            filter_tlvs(thread_meshcop_tlv_type=SESSION_ID_PAN_ID_TLVS).\
            must_next()
 
         # Step 7: Leader sends a MGMT_COMMISSIONER_GET.rsp to Commissioner with
@@ -218,7 +215,7 @@ class Cert_9_2_01_MGMTCommissionerGet(thread_cert.TestCase):
             filter_coap_ack(MGMT_COMMISSIONER_GET_URI).\
             filter(lambda p: {
                               NM_COMMISSIONER_SESSION_ID_TLV
-                             } == set(p.thread_meshcop.tlv.type) and\
+                             } == p.thread_meshcop_tlv_types and\
                    p.thread_meshcop.tlv.commissioner_sess_id is not nullField and\
                    p.thread_meshcop.tlv.pan_id is nullField
                    ).\
@@ -234,11 +231,7 @@ class Cert_9_2_01_MGMTCommissionerGet(thread_cert.TestCase):
         _mgmt_get_pkt = pkts.filter_wpan_src64(COMMISSIONER).\
             filter_ipv6_2dsts(LEADER_ALOC, LEADER_RLOC).\
             filter_coap_request(MGMT_COMMISSIONER_GET_URI).\
-            filter(lambda p: {
-                              NM_BORDER_AGENT_LOCATOR_TLV,
-                              NM_NETWORK_NAME_TLV
-                             } <= set(p.thread_meshcop.tlv.type)
-                   ).\
+            filter_tlvs(thread_meshcop_tlv_type=BORDER_AGENT_NETWORK_NAME_TLVS).\
            must_next()
 
         # Step 9: Leader sends a MGMT_COMMISSIONER_GET.rsp to Commissioner with
@@ -253,7 +246,7 @@ class Cert_9_2_01_MGMTCommissionerGet(thread_cert.TestCase):
             filter_coap_ack(MGMT_COMMISSIONER_GET_URI).\
             filter(lambda p: {
                               NM_BORDER_AGENT_LOCATOR_TLV
-                             } == set(p.thread_meshcop.tlv.type) and\
+                             } == p.thread_meshcop_tlv_types and\
                    p.thread_meshcop.tlv.ba_locator is not nullField and\
                    p.thread_meshcop.tlv.net_name is nullField
                    ).\
@@ -35,10 +35,15 @@ import thread_cert
 from pktverify.consts import MLE_DATA_RESPONSE, MGMT_ACTIVE_GET_URI, NM_CHANNEL_TLV, NM_COMMISSIONER_ID_TLV, NM_COMMISSIONER_SESSION_ID_TLV, NM_STEERING_DATA_TLV, NM_BORDER_AGENT_LOCATOR_TLV, NM_PAN_ID_TLV, NM_NETWORK_NAME_TLV, NM_NETWORK_MESH_LOCAL_PREFIX_TLV, NM_PSKC_TLV, NM_SCAN_DURATION, NM_ENERGY_LIST_TLV, NM_ACTIVE_TIMESTAMP_TLV, NM_CHANNEL_MASK_TLV, NM_EXTENDED_PAN_ID_TLV, NM_NETWORK_KEY_TLV, NM_SECURITY_POLICY_TLV, LEADER_ALOC
 from pktverify.packet_verifier import PacketVerifier
 from pktverify.null_field import nullField
+from pktverify.utils import tlv_mask
 
 COMMISSIONER = 1
 LEADER = 2
 
+ACTIVE_GET_TLVS = tlv_mask({NM_CHANNEL_MASK_TLV, NM_NETWORK_MESH_LOCAL_PREFIX_TLV, NM_NETWORK_NAME_TLV})
+ACTIVE_GET_NOT_ALLOWED_TLVS = tlv_mask(
+    {NM_CHANNEL_TLV, NM_NETWORK_MESH_LOCAL_PREFIX_TLV, NM_NETWORK_NAME_TLV, NM_SCAN_DURATION, NM_ENERGY_LIST_TLV})
+
 # Test Purpose and Description:
 # -----------------------------
 # The purpose of this test case is to verify Leader's and active Commissioner's behavior via
@@ -162,7 +167,7 @@ class Cert_9_2_03_ActiveDatasetGet(thread_cert.TestCase):
                               NM_PAN_ID_TLV,
                               NM_PSKC_TLV,
                               NM_SECURITY_POLICY_TLV
-                             } == set(p.thread_meshcop.tlv.type)
+                             } == p.thread_meshcop_tlv_types
                    ).\
            must_next()
 
@@ -177,12 +182,7 @@ class Cert_9_2_03_ActiveDatasetGet(thread_cert.TestCase):
         pkts.filter_wpan_src64(COMMISSIONER).\
             filter_ipv6_2dsts(LEADER_ALOC, LEADER_RLOC).\
             filter_coap_request(MGMT_ACTIVE_GET_URI).\
-            filter(lambda p: {
-                              NM_CHANNEL_MASK_TLV,
-                              NM_NETWORK_MESH_LOCAL_PREFIX_TLV,
-                              NM_NETWORK_NAME_TLV
-                             } <= set(p.thread_meshcop.tlv.type)
-                   ).\
+            filter_tlvs(thread_meshcop_tlv_type=ACTIVE_GET_TLVS).\
            must_next()
 
         # Step 5: Leader sends a MGMT_ACTIVE_GET.rsp to Commissioner with
@@ -199,7 +199,7 @@ class Cert_9_2_03_ActiveDatasetGet(thread_cert.TestCase):
                               NM_CHANNEL_MASK_TLV,
                               NM_NETWORK_MESH_LOCAL_PREFIX_TLV,
                               NM_NETWORK_NAME_TLV
-                             } == set(p.thread_meshcop.tlv.type)
+                             } == p.thread_meshcop_tlv_types
                    ).\
            must_next()
 
@@ -216,14 +216,7 @@ class Cert_9_2_03_ActiveDatasetGet(thread_cert.TestCase):
         pkts.filter_wpan_src64(COMMISSIONER).\
             filter_ipv6_2dsts(LEADER_ALOC, LEADER_RLOC).\
             filter_coap_request(MGMT_ACTIVE_GET_URI).\
-            filter(lambda p: {
-                              NM_CHANNEL_TLV,
-                              NM_NETWORK_MESH_LOCAL_PREFIX_TLV,
-                              NM_NETWORK_NAME_TLV,
-                              NM_SCAN_DURATION,
-                              NM_ENERGY_LIST_TLV
-                             } <= set(p.thread_meshcop.tlv.type)
-                   ).\
+            filter_tlvs(thread_meshcop_tlv_type=ACTIVE_GET_NOT_ALLOWED_TLVS).\
            must_next()
 
         # Step 7: Leader sends a MGMT_ACTIVE_GET.rsp to Commissioner with
@@ -240,7 +233,7 @@ class Cert_9_2_03_ActiveDatasetGet(thread_cert.TestCase):
                               NM_CHANNEL_TLV,
                               NM_NETWORK_MESH_LOCAL_PREFIX_TLV,
                               NM_NETWORK_NAME_TLV,
-                             } == set(p.thread_meshcop.tlv.type)
+                             } == p.thread_meshcop_tlv_types
                    ).\
            must_next()
 
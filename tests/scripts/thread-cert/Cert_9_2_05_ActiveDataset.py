@@ -198,7 +198,7 @@ class Cert_9_2_05_ActiveDataset(thread_cert.TestCase):
                               SOURCE_ADDRESS_TLV,
                               LEADER_DATA_TLV,
                               ACTIVE_TIMESTAMP_TLV
-                             } <= set(p.mle.tlv.type) and\
+                             } <= p.mle_tlv_types and\
                    p.mle.tlv.active_tstamp == 100 and\
                    (p.mle.tlv.leader_data.data_version -
                    _pkt.mle.tlv.leader_data.data_version) % 256 <= 127 and\
@@ -231,7 +231,7 @@ class Cert_9_2_05_ActiveDataset(thread_cert.TestCase):
                               LEADER_DATA_TLV,
                               ACTIVE_OPERATION_DATASET_TLV,
                               ACTIVE_TIMESTAMP_TLV
-                             } <= set(p.mle.tlv.type) and\
+                             } <= p.mle_tlv_types and\
                              {
                               NM_CHANNEL_TLV,
                               NM_CHANNEL_MASK_TLV,
@@ -242,7 +242,7 @@ class Cert_9_2_05_ActiveDataset(thread_cert.TestCase):
                               NM_PAN_ID_TLV,
                               NM_PSKC_TLV,
                               NM_SECURITY_POLICY_TLV
-                             } <= set(p.thread_meshcop.tlv.type) and\
+                             } <= p.thread_meshcop_tlv_types and\
                    p.mle.tlv.active_tstamp == 100 and\
                    p.thread_meshcop.tlv.chan_mask_mask == '001fffc0' and\
                    p.thread_meshcop.tlv.xpan_id == '000db80000000001' and\
@@ -291,7 +291,7 @@ class Cert_9_2_05_ActiveDataset(thread_cert.TestCase):
                               SOURCE_ADDRESS_TLV,
                               LEADER_DATA_TLV,
                               ACTIVE_TIMESTAMP_TLV
-                             } <= set(p.mle.tlv.type) and\
+                             } <= p.mle_tlv_types and\
                    p.mle.tlv.active_tstamp == 101 and\
                    (p.mle.tlv.leader_data.data_version -
                    _dr_pkt.mle.tlv.leader_data.data_version) % 256 <= 127 and\
@@ -324,7 +324,7 @@ class Cert_9_2_05_ActiveDataset(thread_cert.TestCase):
                               LEADER_DATA_TLV,
                               ACTIVE_OPERATION_DATASET_TLV,
                               ACTIVE_TIMESTAMP_TLV
-                             } <= set(p.mle.tlv.type) and\
+                             } <= p.mle_tlv_types and\
                              {
                               NM_CHANNEL_TLV,
                               NM_CHANNEL_MASK_TLV,
@@ -335,7 +335,7 @@ class Cert_9_2_05_ActiveDataset(thread_cert.TestCase):
                               NM_PAN_ID_TLV,
                               NM_PSKC_TLV,
                               NM_SECURITY_POLICY_TLV
-                             } <= set(p.thread_meshcop.tlv.type) and\
+                             } <= p.thread_meshcop_tlv_types and\
                    p.mle.tlv.active_tstamp == 101 and\
                    p.thread_meshcop.tlv.chan_mask_mask == '001fff00' and\
                    p.thread_meshcop.tlv.xpan_id == '000db80000000003' and\
@@ -355,7 +355,7 @@ class Cert_9_2_06_DatasetDissemination(thread_cert.TestCase):
                               TLV_REQUEST_TLV,
                               NETWORK_DATA_TLV,
                               ACTIVE_TIMESTAMP_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.thread_meshcop.tlv.type is nullField
                    ).\
             must_next()
@@ -387,12 +387,12 @@ class Cert_9_2_06_DatasetDissemination(thread_cert.TestCase):
                                  LEADER_DATA_TLV,
                                  ACTIVE_TIMESTAMP_TLV,
                                  ACTIVE_OPERATION_DATASET_TLV
-                             } <= set(p.mle.tlv.type) and \
+                             } <= p.mle_tlv_types and \
                              {
                                  NM_COMMISSIONER_SESSION_ID_TLV,
                                  NM_BORDER_AGENT_LOCATOR_TLV,
                                  NM_STEERING_DATA_TLV
-                             } <= set(p.thread_meshcop.tlv.type) and \
+                             } <= p.thread_meshcop_tlv_types and \
                              p.mle.tlv.leader_data.data_version ==
                              _pkt9.mle.tlv.leader_data.data_version and \
                              p.mle.tlv.leader_data.stable_data_version ==
@@ -472,7 +472,7 @@ class Cert_9_2_06_DatasetDissemination(thread_cert.TestCase):
                                      TLV_REQUEST_TLV,
                                      NETWORK_DATA_TLV,
                                      ACTIVE_TIMESTAMP_TLV
-                                 } <= set(p.mle.tlv.type) and \
+                                 } <= p.mle_tlv_types and \
                                  p.thread_meshcop.tlv.type is nullField
                        ). \
                 must_next()
@@ -485,12 +485,12 @@ class Cert_9_2_06_DatasetDissemination(thread_cert.TestCase):
                                      LEADER_DATA_TLV,
                                      ACTIVE_TIMESTAMP_TLV,
                                      ACTIVE_OPERATION_DATASET_TLV
-                                 } <= set(p.mle.tlv.type) and \
+                                 } <= p.mle_tlv_types and \
                                  {
                                      NM_COMMISSIONER_SESSION_ID_TLV,
                                      NM_BORDER_AGENT_LOCATOR_TLV,
                                      NM_STEERING_DATA_TLV
-                                 } <= set(p.thread_meshcop.tlv.type) and \
+                                 } <= p.thread_meshcop_tlv_types and \
                                  p.mle.tlv.leader_data.data_version ==
                                  _pkt9.mle.tlv.leader_data.data_version and \
                                  p.mle.tlv.leader_data.stable_data_version ==
@@ -540,7 +540,7 @@ class Cert_9_2_06_DatasetDissemination(thread_cert.TestCase):
                                  TLV_REQUEST_TLV,
                                  NETWORK_DATA_TLV,
                                  ACTIVE_TIMESTAMP_TLV
-                             } <= set(p.mle.tlv.type) and \
+                             } <= p.mle_tlv_types and \
                              p.thread_meshcop.tlv.type is nullField
                    ). \
             must_next()
@@ -566,7 +566,7 @@ class Cert_9_2_06_DatasetDissemination(thread_cert.TestCase):
                                  LEADER_DATA_TLV,
                                  ACTIVE_TIMESTAMP_TLV,
                                  ACTIVE_OPERATION_DATASET_TLV
-                             } <= set(p.mle.tlv.type) and \
+                             } <= p.mle_tlv_types and \
                              p.mle.tlv.leader_data.data_version ==
                              _pkt9.mle.tlv.leader_data.data_version and \
                              p.mle.tlv.leader_data.stable_data_version ==
@@ -614,12 +614,12 @@ class Cert_9_2_06_DatasetDissemination(thread_cert.TestCase):
                                  LEADER_DATA_TLV,
                                  ACTIVE_TIMESTAMP_TLV,
                                  PENDING_TIMESTAMP_TLV
-                             } <= set(p.mle.tlv.type) and \
+                             } <= p.mle_tlv_types and \
                              {
                                  NM_COMMISSIONER_SESSION_ID_TLV,
                                  NM_BORDER_AGENT_LOCATOR_TLV,
                                  NM_STEERING_DATA_TLV
-                             } <= set(p.thread_meshcop.tlv.type) and \
+                             } <= p.thread_meshcop_tlv_types and \
                              (p.mle.tlv.leader_data.data_version -
                               _pkt9.mle.tlv.leader_data.data_version) % 256 <= 127 and \
                              (p.mle.tlv.leader_data.stable_data_version -
@@ -641,7 +641,7 @@ class Cert_9_2_06_DatasetDissemination(thread_cert.TestCase):
                                  TLV_REQUEST_TLV,
                                  NETWORK_DATA_TLV,
                                  ACTIVE_TIMESTAMP_TLV
-                             } <= set(p.mle.tlv.type) and \
+                             } <= p.mle_tlv_types and \
                              p.thread_meshcop.tlv.type is nullField
                    ). \
             must_next()
@@ -668,12 +668,12 @@ class Cert_9_2_06_DatasetDissemination(thread_cert.TestCase):
                                  ACTIVE_TIMESTAMP_TLV,
                                  PENDING_TIMESTAMP_TLV,
                                  PENDING_OPERATION_DATASET_TLV
-                             } <= set(p.mle.tlv.type) and \
+                             } <= p.mle_tlv_types and \
                              {
                                  NM_COMMISSIONER_SESSION_ID_TLV,
                                  NM_BORDER_AGENT_LOCATOR_TLV,
                                  NM_STEERING_DATA_TLV
-                             } <= set(p.thread_meshcop.tlv.type) and \
+                             } <= p.thread_meshcop_tlv_types and \
                              p.thread_nwd.tlv.stable == [0] and \
                              NWD_COMMISSIONING_DATA_TLV in p.thread_nwd.tlv.type and \
                              p.mle.tlv.active_tstamp == COMM_ACTIVE_TIMESTAMP and \
@@ -709,7 +709,7 @@ class Cert_9_2_06_DatasetDissemination(thread_cert.TestCase):
                                      NM_COMMISSIONER_SESSION_ID_TLV,
                                      NM_BORDER_AGENT_LOCATOR_TLV,
                                      NM_STEERING_DATA_TLV
-                                 } <= set(p.thread_meshcop.tlv.type) and \
+                                 } <= p.thread_meshcop_tlv_types and \
                                  p.mle.tlv.active_tstamp == COMM_ACTIVE_TIMESTAMP and \
                                  p.mle.tlv.pending_tstamp == COMM_PENDING_TIMESTAMP and \
                                  p.mle.tlv.leader_data.data_version ==
@@ -756,7 +756,7 @@ class Cert_9_2_06_DatasetDissemination(thread_cert.TestCase):
                                      TLV_REQUEST_TLV,
                                      NETWORK_DATA_TLV,
                                      ACTIVE_TIMESTAMP_TLV
-                                 } <= set(p.mle.tlv.type) and \
+                                 } <= p.mle_tlv_types and \
                                  p.thread_meshcop.tlv.type is nullField
                        ). \
                 must_next()
@@ -770,12 +770,12 @@ class Cert_9_2_06_DatasetDissemination(thread_cert.TestCase):
                                      ACTIVE_TIMESTAMP_TLV,
                                      PENDING_TIMESTAMP_TLV,
                                      PENDING_OPERATION_DATASET_TLV
-                                 } <= set(p.mle.tlv.type) and \
+                                 } <= p.mle_tlv_types and \
                                  {
                                      NM_COMMISSIONER_SESSION_ID_TLV,
                                      NM_BORDER_AGENT_LOCATOR_TLV,
                                      NM_STEERING_DATA_TLV
-                                 } <= set(p.thread_meshcop.tlv.type) and \
+                                 } <= p.thread_meshcop_tlv_types and \
                                  p.mle.tlv.leader_data.data_version ==
                                  _pkt20.mle.tlv.leader_data.data_version and \
                                  p.mle.tlv.leader_data.stable_data_version ==
@@ -821,7 +821,7 @@ class Cert_9_2_06_DatasetDissemination(thread_cert.TestCase):
                                  TLV_REQUEST_TLV,
                                  NETWORK_DATA_TLV,
                                  ACTIVE_TIMESTAMP_TLV
-                             } <= set(p.mle.tlv.type) and \
+                             } <= p.mle_tlv_types and \
                              p.thread_meshcop.tlv.type is nullField
                    ). \
             must_next()
@@ -848,7 +848,7 @@ class Cert_9_2_06_DatasetDissemination(thread_cert.TestCase):
                                  ACTIVE_TIMESTAMP_TLV,
                                  PENDING_TIMESTAMP_TLV,
                                  PENDING_OPERATION_DATASET_TLV
-                             } <= set(p.mle.tlv.type) and \
+                             } <= p.mle_tlv_types and \
                              p.mle.tlv.leader_data.data_version ==
                              _pkt20.mle.tlv.leader_data.data_version and \
                              p.mle.tlv.leader_data.stable_data_version ==
@@ -289,7 +289,7 @@ class Cert_9_2_09_PendingPartition(thread_cert.TestCase):
                               TLV_REQUEST_TLV,
                               NETWORK_DATA_TLV,
                               ACTIVE_TIMESTAMP_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.mle.tlv.active_tstamp == TIMESTAMP_INIT and\
                    p.thread_meshcop.tlv.type is nullField
                    ).\
@@ -319,7 +319,7 @@ class Cert_9_2_09_PendingPartition(thread_cert.TestCase):
                               ACTIVE_TIMESTAMP_TLV,
                               PENDING_TIMESTAMP_TLV,
                               PENDING_OPERATION_DATASET_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.thread_nwd.tlv.stable == [0] and\
                    NWD_COMMISSIONING_DATA_TLV in p.thread_nwd.tlv.type and\
                    NM_COMMISSIONER_SESSION_ID_TLV in p.thread_meshcop.tlv.type and\
@@ -387,7 +387,7 @@ class Cert_9_2_09_PendingPartition(thread_cert.TestCase):
                               ACTIVE_TIMESTAMP_TLV,
                               PENDING_TIMESTAMP_TLV,
                               PENDING_OPERATION_DATASET_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.thread_nwd.tlv.stable == [0] and\
                    NWD_COMMISSIONING_DATA_TLV in p.thread_nwd.tlv.type and\
                    NM_COMMISSIONER_SESSION_ID_TLV in p.thread_meshcop.tlv.type and\
@@ -419,7 +419,7 @@ class Cert_9_2_09_PendingPartition(thread_cert.TestCase):
                                   TLV_REQUEST_TLV,
                                   NETWORK_DATA_TLV,
                                   ACTIVE_TIMESTAMP_TLV
-                                  } <= set(p.mle.tlv.type) and\
+                                  } <= p.mle_tlv_types and\
                        p.mle.tlv.active_tstamp == TIMESTAMP_INIT and\
                        p.mle.tlv.pending_tstamp == COMM_PENDING_TIMESTAMP and\
                        p.thread_meshcop.tlv.type is nullField
@@ -468,7 +468,7 @@ class Cert_9_2_09_PendingPartition(thread_cert.TestCase):
                               TLV_REQUEST_TLV,
                               NETWORK_DATA_TLV,
                               ACTIVE_TIMESTAMP_TLV
-                              } <= set(p.mle.tlv.type) and\
+                              } <= p.mle_tlv_types and\
                    p.mle.tlv.active_tstamp == ROUTER2_ACTIVE_TIMESTAMP and\
                    p.mle.tlv.pending_tstamp == COMM_PENDING_TIMESTAMP and\
                    p.thread_meshcop.tlv.type is nullField
@@ -547,7 +547,7 @@ class Cert_9_2_09_PendingPartition(thread_cert.TestCase):
                                   NM_CHANNEL_TLV,
                                   NM_NETWORK_NAME_TLV,
                                   NM_PAN_ID_TLV,
-                                 } <= set(p.thread_meshcop.tlv.type) and\
+                                 } <= p.thread_meshcop_tlv_types and\
                        p.thread_meshcop.tlv.active_tstamp == ROUTER2_ACTIVE_TIMESTAMP and\
                        p.thread_meshcop.tlv.net_name == [ROUTER2_NET_NAME]
                        ).\
@@ -33,6 +33,7 @@ import config
 import thread_cert
 from pktverify.consts import MLE_ADVERTISEMENT, MLE_PARENT_REQUEST, MLE_DATA_REQUEST, MLE_DATA_RESPONSE, MLE_CHILD_UPDATE_REQUEST, MLE_CHILD_UPDATE_RESPONSE, MLE_CHILD_ID_REQUEST, MLE_CHILD_ID_RESPONSE, ADDR_SOL_URI, VERSION_TLV, TLV_REQUEST_TLV, SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, CHALLENGE_TLV, LINK_MARGIN_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV, PENDING_TIMESTAMP_TLV, ACTIVE_OPERATION_DATASET_TLV, PENDING_OPERATION_DATASET_TLV, LINK_LOCAL_ALL_NODES_MULTICAST_ADDRESS, LINK_LOCAL_ALL_ROUTERS_MULTICAST_ADDRESS, NM_COMMISSIONER_SESSION_ID_TLV, NM_BORDER_AGENT_LOCATOR_TLV, NM_CHANNEL_TLV, NM_NETWORK_MESH_LOCAL_PREFIX_TLV, NM_PAN_ID_TLV, NM_DELAY_TIMER_TLV, NM_ACTIVE_TIMESTAMP_TLV
 from pktverify.packet_verifier import PacketVerifier
+from pktverify.utils import tlv_mask
 
 CHANNEL_INIT = 19
 PANID_INIT = 0xface
@@ -48,6 +49,15 @@ SED1 = 5
 
 MTDS = [ED1, SED1]
 
+DATA_REQUEST_TLVS = tlv_mask({TLV_REQUEST_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV})
+PENDING_TIMESTAMP_TLVS = tlv_mask(
+    {SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV, PENDING_TIMESTAMP_TLV})
+PENDING_DATASET_TLVS = tlv_mask(
+    {SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV, PENDING_OPERATION_DATASET_TLV})
+COMMISSIONER_MESHCOP_TLVS = tlv_mask({NM_COMMISSIONER_SESSION_ID_TLV, NM_BORDER_AGENT_LOCATOR_TLV})
+PENDING_DATASET_MESHCOP_TLVS = tlv_mask(
+    {NM_CHANNEL_TLV, NM_NETWORK_MESH_LOCAL_PREFIX_TLV, NM_PAN_ID_TLV, NM_DELAY_TIMER_TLV, NM_ACTIVE_TIMESTAMP_TLV})
+
 
 class Cert_9_2_10_PendingPartition(thread_cert.TestCase):
     SUPPORT_NCP = False
@@ -172,66 +182,61 @@ class Cert_9_2_10_PendingPartition(thread_cert.TestCase):
         MED = pv.vars['MED']
         SED = pv.vars['SED']
         COMMISSIONER = pv.vars['COMMISSIONER']
-        _rpkts = pkts.filter_wpan_src64(ROUTER, cascade=False)
+        _rpkts = pkts.filter_fields(wpan_src64=ROUTER, cascade=False)
 
         # Step 1: Ensure the topology is formed correctly
-        _rpkts.filter_wpan_dst64(SED).filter_mle_cmd(MLE_CHILD_ID_RESPONSE).must_next()
+        _rpkts.filter_fields(wpan_dst64=SED, mle_cmd=MLE_CHILD_ID_RESPONSE).must_next()
 
         # Step 5: Router MUST send a unicast MLE Data Request to the Leader
-        _rpkts.filter_wpan_dst64(LEADER).filter_mle_cmd(MLE_DATA_REQUEST).must_next().must_verify(
-            lambda p: {TLV_REQUEST_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV} <= set(p.mle.tlv.type))
+        _rpkts.filter_fields(wpan_dst64=LEADER, mle_cmd=MLE_DATA_REQUEST).must_next().must_verify(
+            lambda p: (p.mle_tlv_mask & DATA_REQUEST_TLVS) == DATA_REQUEST_TLVS)
         _rpkts_med = _rpkts.copy()
 
         # Step 7: Router MUST multicast a MLE Data Response
-        _rpkts.filter_ipv6_dst(LINK_LOCAL_ALL_NODES_MULTICAST_ADDRESS).filter_mle_cmd(
-            MLE_DATA_RESPONSE).must_next().must_verify(lambda p: {
-                SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV, PENDING_TIMESTAMP_TLV
-            } <= set(p.mle.tlv.type) and {NM_COMMISSIONER_SESSION_ID_TLV, NM_BORDER_AGENT_LOCATOR_TLV} <= set(
-                p.thread_meshcop.tlv.type) and p.thread_nwd.tlv.stable == [0])
+        _pkt = _rpkts.filter_fields(ipv6_dst=LINK_LOCAL_ALL_NODES_MULTICAST_ADDRESS,
+                                    mle_cmd=MLE_DATA_RESPONSE).must_next()
+        _pkt.must_verify(lambda p: (p.mle_tlv_mask & PENDING_TIMESTAMP_TLVS) == PENDING_TIMESTAMP_TLVS)
+        _pkt.must_verify(lambda p: (p.thread_meshcop_tlv_mask & COMMISSIONER_MESHCOP_TLVS) == COMMISSIONER_MESHCOP_TLVS
+                         and p.thread_nwd.tlv.stable == [0])
 
         # Step 8: MED MUST send a unicast MLE Data Request to Router_1,
-        with pkts.save_index():
-            pkts.filter_wpan_src64(MED).filter_wpan_dst64(ROUTER).filter_mle_cmd(MLE_DATA_REQUEST).must_next(
-            ).must_verify(lambda p: {TLV_REQUEST_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV} <= set(p.mle.tlv.type))
+        pkts.filter_fields(
+            wpan_src64=MED, wpan_dst64=ROUTER, mle_cmd=MLE_DATA_REQUEST,
+            cascade=False).must_next().must_verify(lambda p: (p.mle_tlv_mask & DATA_REQUEST_TLVS) == DATA_REQUEST_TLVS)
 
         # Step 9: Router MUST send a unicast MLE Data Response to MED_1
-        _rpkts_med.filter_wpan_dst64(MED).filter_mle_cmd(MLE_DATA_RESPONSE).must_next().must_verify(lambda p: {
-            SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV, PENDING_OPERATION_DATASET_TLV
-        } <= set(p.mle.tlv.type) and {
-            NM_CHANNEL_TLV, NM_NETWORK_MESH_LOCAL_PREFIX_TLV, NM_PAN_ID_TLV, NM_DELAY_TIMER_TLV,
-            NM_ACTIVE_TIMESTAMP_TLV
-        } <= set(p.thread_meshcop.tlv.type) and p.thread_nwd.tlv.stable == [0])
+        _pkt = _rpkts_med.filter_fields(wpan_dst64=MED, mle_cmd=MLE_DATA_RESPONSE).must_next()
+        _pkt.must_verify(lambda p: (p.mle_tlv_mask & PENDING_DATASET_TLVS) == PENDING_DATASET_TLVS)
+        _pkt.must_verify(lambda p: (p.thread_meshcop_tlv_mask & PENDING_DATASET_MESHCOP_TLVS) ==
+                         PENDING_DATASET_MESHCOP_TLVS and p.thread_nwd.tlv.stable == [0])
 
         # Step 10: Router MUST send MLE Child Update Request to SED_1
-        _rpkts.range(pkts.index).filter_wpan_dst64(SED).filter_mle_cmd(
-            MLE_CHILD_UPDATE_REQUEST).must_next().must_verify(lambda p: {
-                SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV, PENDING_TIMESTAMP_TLV
-            } <= set(p.mle.tlv.type))
+        _rpkts.range(pkts.index).filter_fields(
+            wpan_dst64=SED, mle_cmd=MLE_CHILD_UPDATE_REQUEST).must_next().must_verify(
+                lambda p: (p.mle_tlv_mask & PENDING_TIMESTAMP_TLVS) == PENDING_TIMESTAMP_TLVS)
 
         # Step 11: SED MUST send a unicast MLE Data Request to Router_1
-        pkts.filter_wpan_src64(SED).filter_wpan_dst64(ROUTER).filter_mle_cmd(MLE_DATA_REQUEST).must_next().must_verify(
-            lambda p: {TLV_REQUEST_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV} <= set(p.mle.tlv.type))
+        pkts.filter_fields(wpan_src64=SED, wpan_dst64=ROUTER, mle_cmd=MLE_DATA_REQUEST).must_next().must_verify(
+            lambda p: (p.mle_tlv_mask & DATA_REQUEST_TLVS) == DATA_REQUEST_TLVS)
 
         # Step 12: Router MUST send a unicast MLE Data Response to SED_1
-        _pkt = _rpkts.filter_wpan_dst64(SED).filter_mle_cmd(MLE_DATA_RESPONSE).must_next()
-        _pkt.must_verify(lambda p: {
-            SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV, PENDING_OPERATION_DATASET_TLV
-        } <= set(p.mle.tlv.type) and {
-            NM_CHANNEL_TLV, NM_NETWORK_MESH_LOCAL_PREFIX_TLV, NM_PAN_ID_TLV, NM_DELAY_TIMER_TLV,
-            NM_ACTIVE_TIMESTAMP_TLV
-        } <= set(p.thread_meshcop.tlv.type))
+        _pkt = _rpkts.filter_fields(wpan_dst64=SED, mle_cmd=MLE_DATA_RESPONSE).must_next()
+        _pkt.must_verify(lambda p: (p.mle_tlv_mask & PENDING_DATASET_TLVS) == PENDING_DATASET_TLVS)
+        _pkt.must_verify(lambda p:
+                         (p.thread_meshcop_tlv_mask & PENDING_DATASET_MESHCOP_TLVS) == PENDING_DATASET_MESHCOP_TLVS)
 
         # Step 14: After NETWORK_ID_TIMEOUT, Router MUST start a new partition
-        _rpkts.filter_ipv6_dst(LINK_LOCAL_ALL_ROUTERS_MULTICAST_ADDRESS).filter_mle_cmd(
-            MLE_PARENT_REQUEST).must_next().must_verify(lambda p: p.sniff_timestamp - _pkt.sniff_timestamp > 300)
-        _rpkts.filter_mle_cmd(MLE_DATA_RESPONSE).filter(lambda p: p.wpan.dst_pan == PANID_FINAL).must_next()
-
         # Step 16: After the Delay Timer expires, Router MUST move to the Secondary channel
-        _rpkts.filter_mle_cmd(MLE_ADVERTISEMENT).filter(lambda p: p.wpan.dst_pan == PANID_FINAL).must_next()
+        _parent_req_pkt, _, _ = _rpkts.must_next_sequence(
+            _rpkts.filter_fields(mle_cmd=MLE_PARENT_REQUEST, ipv6_dst=LINK_LOCAL_ALL_ROUTERS_MULTICAST_ADDRESS),
+            _rpkts.filter_fields(mle_cmd=MLE_DATA_RESPONSE, wpan_dst_pan=PANID_FINAL),
+            _rpkts.filter_fields(mle_cmd=MLE_ADVERTISEMENT, wpan_dst_pan=PANID_FINAL))
+        _parent_req_pkt.must_verify(lambda p: p.sniff_timestamp - _pkt.sniff_timestamp > 300)
 
         # Step 19: Router MUST reattach to the Leader and the partitions MUST merge
-        pkts.filter_wpan_src64(LEADER).filter_wpan_dst64(ROUTER).filter_mle_cmd(
-            MLE_CHILD_ID_RESPONSE).must_next().must_verify(lambda p: p.mle.tlv.leader_data.partition_id == 0xffffffff)
+        pkts.filter_fields(wpan_src64=LEADER, wpan_dst64=ROUTER,
+                           mle_cmd=MLE_CHILD_ID_RESPONSE).must_next().must_verify(
+                               lambda p: p.mle.tlv.leader_data.partition_id == 0xffffffff)
 
         # Step 20: MED MUST respond with an ICMPv6 Echo Reply
         p = pkts.filter_ping_request().filter_wpan_src64(LEADER).must_next()
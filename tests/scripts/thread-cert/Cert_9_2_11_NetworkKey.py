@@ -34,6 +34,7 @@ import thread_cert
 from pktverify.consts import MLE_PARENT_REQUEST, MLE_DATA_RESPONSE, MLE_DATA_REQUEST, MGMT_PENDING_SET_URI, SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, ACTIVE_OPERATION_DATASET_TLV, ACTIVE_TIMESTAMP_TLV, PENDING_TIMESTAMP_TLV, TLV_REQUEST_TLV, NETWORK_DATA_TLV, NM_BORDER_AGENT_LOCATOR_TLV, NM_COMMISSIONER_SESSION_ID_TLV, NM_DELAY_TIMER_TLV, PENDING_OPERATION_DATASET_TLV, NWD_COMMISSIONING_DATA_TLV
 from pktverify.packet_verifier import PacketVerifier
 from pktverify.null_field import nullField
+from pktverify.utils import tlv_mask
 
 KEY1 = '00112233445566778899aabbccddeeff'
 KEY2 = 'ffeeddccbbaa99887766554433221100'
@@ -47,6 +48,10 @@ ROUTER1 = 3
 ED1 = 4
 SED1 = 5
 
+DATA_RESPONSE_TLVS = tlv_mask(
+    {SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, ACTIVE_TIMESTAMP_TLV, PENDING_TIMESTAMP_TLV, PENDING_OPERATION_DATASET_TLV})
+COMMISSIONER_MESHCOP_TLVS = tlv_mask({NM_COMMISSIONER_SESSION_ID_TLV, NM_BORDER_AGENT_LOCATOR_TLV})
+
 # Test Purpose and Description:
 # -----------------------------
 # The purpose of this test case is to confirm the DUT correctly applies
@@ -246,9 +251,8 @@ class Cert_9_2_11_NetworkKey(thread_cert.TestCase):
                    (p.mle.tlv.leader_data.stable_data_version -
                    _pkt.mle.tlv.leader_data.stable_data_version) % 256 <= 127 and\
                    p.thread_nwd.tlv.stable == [0] and\
-                   NWD_COMMISSIONING_DATA_TLV in p.thread_nwd.tlv.type and\
-                   NM_COMMISSIONER_SESSION_ID_TLV in p.thread_meshcop.tlv.type and\
-                   NM_BORDER_AGENT_LOCATOR_TLV in p.thread_meshcop.tlv.type
+                   NWD_COMMISSIONING_DATA_TLV in p.thread_nwd_tlv_types and\
+                   (p.thread_meshcop_tlv_mask & COMMISSIONER_MESHCOP_TLVS) == COMMISSIONER_MESHCOP_TLVS
                    ).\
             must_next()
 
@@ -269,17 +273,10 @@ class Cert_9_2_11_NetworkKey(thread_cert.TestCase):
         _dr_pkt = pkts.filter_mle_cmd(MLE_DATA_RESPONSE).\
             filter_wpan_src64(LEADER).\
             filter_wpan_dst64(ROUTER).\
-            filter(lambda p: {
-                              SOURCE_ADDRESS_TLV,
-                              LEADER_DATA_TLV,
-                              ACTIVE_TIMESTAMP_TLV,
-                              PENDING_TIMESTAMP_TLV,
-                              PENDING_OPERATION_DATASET_TLV
-                              } <= set(p.mle.tlv.type) and\
+            filter(lambda p: (p.mle_tlv_mask & DATA_RESPONSE_TLVS) == DATA_RESPONSE_TLVS and\
                    p.thread_nwd.tlv.stable == [0] and\
-                   NWD_COMMISSIONING_DATA_TLV in p.thread_nwd.tlv.type and\
-                   NM_COMMISSIONER_SESSION_ID_TLV in p.thread_meshcop.tlv.type and\
-                   NM_BORDER_AGENT_LOCATOR_TLV in p.thread_meshcop.tlv.type and\
+                   NWD_COMMISSIONING_DATA_TLV in p.thread_nwd_tlv_types and\
+                   (p.thread_meshcop_tlv_mask & COMMISSIONER_MESHCOP_TLVS) == COMMISSIONER_MESHCOP_TLVS and\
                    p.thread_meshcop.tlv.delay_timer > 200000 and\
                    p.thread_meshcop.tlv.master_key == KEY2 and\
                    p.thread_meshcop.tlv.active_tstamp == 70
@@ -333,9 +330,8 @@ class Cert_9_2_11_NetworkKey(thread_cert.TestCase):
                    (p.mle.tlv.leader_data.stable_data_version -
                    _dr_pkt.mle.tlv.leader_data.stable_data_version) % 256 <= 127 and\
                    p.thread_nwd.tlv.stable == [0] and\
-                   NWD_COMMISSIONING_DATA_TLV in p.thread_nwd.tlv.type and\
-                   NM_COMMISSIONER_SESSION_ID_TLV in p.thread_meshcop.tlv.type and\
-                   NM_BORDER_AGENT_LOCATOR_TLV in p.thread_meshcop.tlv.type
+                   NWD_COMMISSIONING_DATA_TLV in p.thread_nwd_tlv_types and\
+                   (p.thread_meshcop_tlv_mask & COMMISSIONER_MESHCOP_TLVS) == COMMISSIONER_MESHCOP_TLVS
                    ).\
             must_next()
 
@@ -356,17 +352,10 @@ class Cert_9_2_11_NetworkKey(thread_cert.TestCase):
         pkts.filter_mle_cmd(MLE_DATA_RESPONSE).\
             filter_wpan_src64(LEADER).\
             filter_wpan_dst64(ROUTER).\
-            filter(lambda p: {
-                              SOURCE_ADDRESS_TLV,
-                              LEADER_DATA_TLV,
-                              ACTIVE_TIMESTAMP_TLV,
-                              PENDING_TIMESTAMP_TLV,
-                              PENDING_OPERATION_DATASET_TLV
-                              } <= set(p.mle.tlv.type) and\
+            filter(lambda p: (p.mle_tlv_mask & DATA_RESPONSE_TLVS) == DATA_RESPONSE_TLVS and\
                    p.thread_nwd.tlv.stable == [0] and\
-                   NWD_COMMISSIONING_DATA_TLV in p.thread_nwd.tlv.type and\
-                   NM_COMMISSIONER_SESSION_ID_TLV in p.thread_meshcop.tlv.type and\
-                   NM_BORDER_AGENT_LOCATOR_TLV in p.thread_meshcop.tlv.type and\
+                   NWD_COMMISSIONING_DATA_TLV in p.thread_nwd_tlv_types and\
+                   (p.thread_meshcop_tlv_mask & COMMISSIONER_MESHCOP_TLVS) == COMMISSIONER_MESHCOP_TLVS and\
                    p.mle.tlv.active_tstamp == 70 and\
                    p.mle.tlv.pending_tstamp == 20 and\
                    p.thread_meshcop.tlv.delay_timer > 300000 and\
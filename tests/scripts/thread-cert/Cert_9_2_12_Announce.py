@@ -47,6 +47,8 @@ DATASET2_TIMESTAMP = 10
 DATASET2_CHANNEL = 12
 DATASET2_PANID = 0xafce
 
+ANNOUNCE_TLVS = frozenset({CHANNEL_TLV, PAN_ID_TLV, ACTIVE_TIMESTAMP_TLV})
+
 
 class Cert_9_2_12_Announce(thread_cert.TestCase):
     SUPPORT_NCP = False
@@ -139,32 +141,35 @@ class Cert_9_2_12_Announce(thread_cert.TestCase):
         MED_RLOC = pv.vars['MED_RLOC']
 
         # Step 1: Ensure the topology is formed correctly
-        pkts.filter_wpan_src64(LEADER_1).filter_wpan_dst64(ROUTER_1).filter_mle_cmd(
-            MLE_CHILD_ID_RESPONSE).must_next().must_verify(lambda p: p.wpan.dst_pan == DATASET1_PANID)
-        pkts.copy().filter_wpan_src64(LEADER_2).filter_wpan_dst64(MED).filter_mle_cmd(
-            MLE_CHILD_ID_RESPONSE).must_next().must_verify(lambda p: p.wpan.dst_pan == DATASET2_PANID)
+        pkts.filter_fields(
+            wpan_src64=LEADER_1, wpan_dst64=ROUTER_1,
+            mle_cmd=MLE_CHILD_ID_RESPONSE).must_next().must_verify(lambda p: p.wpan.dst_pan == DATASET1_PANID)
+        pkts.filter_fields(wpan_src64=LEADER_2, wpan_dst64=MED, mle_cmd=MLE_CHILD_ID_RESPONSE,
+                           cascade=False).must_next().must_verify(lambda p: p.wpan.dst_pan == DATASET2_PANID)
 
         # Step 4: Leader_2 MUST send a MLE Child ID Request on its new channel to Router_1
         # LEADER_2 MUST send a MLE Announce Message
         # The Destination PAN ID (0xFFFF) in the IEEE 802.15.4 MAC and MUST be secured using Key ID Mode 2.
-        pkts.filter_wpan_src64(LEADER_2).filter_wpan_dst64(ROUTER_1).filter_mle_cmd(
-            MLE_CHILD_ID_REQUEST).must_next().must_verify(lambda p: p.wpan.dst_pan == DATASET1_PANID)
+        pkts.filter_fields(
+            wpan_src64=LEADER_2, wpan_dst64=ROUTER_1,
+            mle_cmd=MLE_CHILD_ID_REQUEST).must_next().must_verify(lambda p: p.wpan.dst_pan == DATASET1_PANID)
 
         pkts.filter_wpan_src64(LEADER_2).filter_ipv6_dst(LINK_LOCAL_ALL_NODES_MULTICAST_ADDRESS).filter_mle_cmd(
             MLE_ANNOUNCE).must_next().must_verify(
-                lambda p: {CHANNEL_TLV, PAN_ID_TLV, ACTIVE_TIMESTAMP_TLV} == set(p.mle.tlv.type) and p.wpan.dst_pan ==
-                0xffff and p.wpan.aux_sec.key_id_mode == 0x2 and p.wpan.aux_sec.key_source == 0x00000000ffffffff)
+                lambda p: ANNOUNCE_TLVS == p.mle_tlv_types and p.wpan.dst_pan == 0xffff and p.wpan.aux_sec.key_id_mode
+                == 0x2 and p.wpan.aux_sec.key_source == 0x00000000ffffffff)
 
         # Step 5: MED MUST send a MLE Child ID Request on its new channel
         # MED MUST send a MLE Announce Message
         # The Destination PAN ID (0xFFFF) in the IEEE 802.15.4 MAC and MUST be secured using Key ID Mode 2.
-        pkts.filter_wpan_src64(MED).filter_wpan_dst64(LEADER_2).filter_mle_cmd(
-            MLE_CHILD_ID_REQUEST).must_next().must_verify(lambda p: p.wpan.dst_pan == DATASET1_PANID)
+        pkts.filter_fields(
+            wpan_src64=MED, wpan_dst64=LEADER_2,
+            mle_cmd=MLE_CHILD_ID_REQUEST).must_next().must_verify(lambda p: p.wpan.dst_pan == DATASET1_PANID)
 
         pkts.filter_wpan_src64(MED).filter_ipv6_dst(LINK_LOCAL_ALL_NODES_MULTICAST_ADDRESS).filter_mle_cmd(
             MLE_ANNOUNCE).must_next().must_verify(
-                lambda p: {CHANNEL_TLV, PAN_ID_TLV, ACTIVE_TIMESTAMP_TLV} == set(p.mle.tlv.type) and p.wpan.dst_pan ==
-                0xffff and p.wpan.aux_sec.key_id_mode == 0x2 and p.wpan.aux_sec.key_source == 0x00000000ffffffff)
+                lambda p: ANNOUNCE_TLVS == p.mle_tlv_types and p.wpan.dst_pan == 0xffff and p.wpan.aux_sec.key_id_mode
+                == 0x2 and p.wpan.aux_sec.key_source == 0x00000000ffffffff)
 
         # Step 6: MED MUST respond with an ICMPv6 Echo Reply
         pkts.filter_ping_reply().filter_ipv6_src_dst(MED_RLOC, LEADER_1_RLOC).must_next()
@@ -33,6 +33,7 @@ import unittest
 import config
 import thread_cert
 from pktverify.consts import MLE_CHILD_ID_RESPONSE, MGMT_ED_SCAN, MGMT_ED_REPORT, NM_CHANNEL_MASK_TLV, NM_ENERGY_LIST_TLV
+from pktverify.bytes import Bytes
 from pktverify.packet_verifier import PacketVerifier
 
 COMMISSIONER = 1
@@ -40,6 +41,11 @@ LEADER = 2
 ROUTER1 = 3
 ED = 4
 
+ENERGY_SCAN_CHANNEL_MASK = 0x50000
+# The Channel Mask TLV carries the channel mask with the bits in reverse order
+EXPECTED_CHANNEL_MASK = Bytes('%08x' % int('{:032b}'.format(ENERGY_SCAN_CHANNEL_MASK)[::-1], 2))
+ENERGY_REPORT_TLVS = frozenset({NM_CHANNEL_MASK_TLV, NM_ENERGY_LIST_TLV})
+
 
 class Cert_9_2_13_EnergyScan_Base(thread_cert.TestCase):
     SUPPORT_NCP = False
@@ -94,9 +100,9 @@ class Cert_9_2_13_EnergyScan_Base(thread_cert.TestCase):
             if ipaddr[0:4] != 'fe80':
                 break
 
-        self.nodes[COMMISSIONER].energy_scan(0x50000, 0x02, 0x20, 0xc8, ipaddr)
+        self.nodes[COMMISSIONER].energy_scan(ENERGY_SCAN_CHANNEL_MASK, 0x02, 0x20, 0xc8, ipaddr)
         self.simulator.go(3)
-        self.nodes[COMMISSIONER].energy_scan(0x50000, 0x02, 0x20, 0xc8, 'ff33:0040:fd00:db8:0:0:0:1')
+        self.nodes[COMMISSIONER].energy_scan(ENERGY_SCAN_CHANNEL_MASK, 0x02, 0x20, 0xc8, 'ff33:0040:fd00:db8:0:0:0:1')
         self.simulator.go(3)
 
         self.assertTrue(self.nodes[COMMISSIONER].ping(ipaddr))
@@ -109,16 +115,17 @@ class Cert_9_2_13_EnergyScan_Base(thread_cert.TestCase):
         DUT_RLOC = pv.vars['DUT_RLOC']
         COMMISSIONER_RLOC = pv.vars['COMMISSIONER_RLOC']
         _pkts = pkts.filter_wpan_src64(DUT)
+        _ed_report_pkts = _pkts.filter_ipv6_dst(COMMISSIONER_RLOC).filter_coap_request(MGMT_ED_REPORT)
 
         # Step 3: The DUT MUST send MGMT_ED_REPORT.ans to the Commissioner and report energy measurements
-        _pkts.filter_ipv6_dst(COMMISSIONER_RLOC).filter_coap_request(MGMT_ED_REPORT).must_next().must_verify(
-            lambda p: {NM_CHANNEL_MASK_TLV, NM_ENERGY_LIST_TLV} == set(p.thread_meshcop.tlv.type) and p.thread_meshcop.
-            tlv.chan_mask_mask == '0000a000' and len(p.thread_meshcop.tlv.energy_list) == 2)
+        _ed_report_pkts.must_next().must_verify(
+            lambda p: ENERGY_REPORT_TLVS == p.thread_meshcop_tlv_types and p.thread_meshcop.tlv.chan_mask_mask ==
+            EXPECTED_CHANNEL_MASK and len(p.thread_meshcop.tlv.energy_list) == 2)
 
         # Step 5: The DUT MUST send MGMT_ED_REPORT.ans to the Commissioner and report energy measurements
-        _pkts.filter_ipv6_dst(COMMISSIONER_RLOC).filter_coap_request(MGMT_ED_REPORT).must_next().must_verify(
-            lambda p: {NM_CHANNEL_MASK_TLV, NM_ENERGY_LIST_TLV} == set(p.thread_meshcop.tlv.type) and p.thread_meshcop.
-            tlv.chan_mask_mask == '0000a000' and len(p.thread_meshcop.tlv.energy_list) == 2)
+        _ed_report_pkts.must_next().must_verify(
+            lambda p: ENERGY_REPORT_TLVS == p.thread_meshcop_tlv_types and p.thread_meshcop.tlv.chan_mask_mask ==
+            EXPECTED_CHANNEL_MASK and len(p.thread_meshcop.tlv.energy_list) == 2)
 
         # Step 6: The DUT MUST respond with ICMPv6 Echo Reply
         _pkts.filter_ping_reply().filter_ipv6_src_dst(DUT_RLOC, COMMISSIONER_RLOC).must_next()
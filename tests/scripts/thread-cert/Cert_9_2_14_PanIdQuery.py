@@ -33,12 +33,16 @@ import config
 import thread_cert
 from pktverify.consts import MLE_CHILD_ID_REQUEST, MGMT_PANID_QUERY, MGMT_PANID_CONFLICT, MGMT_ED_REPORT, NM_COMMISSIONER_SESSION_ID_TLV, NM_CHANNEL_MASK_TLV, NM_PAN_ID_TLV, REALM_LOCAL_All_THREAD_NODES_MULTICAST_ADDRESS
 from pktverify.packet_verifier import PacketVerifier
+from pktverify.utils import tlv_mask
 
 COMMISSIONER = 1
 LEADER1 = 2
 ROUTER1 = 3
 LEADER2 = 4
 
+PANID_QUERY_TLVS = tlv_mask({NM_COMMISSIONER_SESSION_ID_TLV, NM_CHANNEL_MASK_TLV, NM_PAN_ID_TLV})
+PANID_CONFLICT_TLVS = tlv_mask({NM_CHANNEL_MASK_TLV, NM_PAN_ID_TLV})
+
 
 class Cert_9_2_14_PanIdQuery(thread_cert.TestCase):
     SUPPORT_NCP = False
@@ -107,34 +111,30 @@ class Cert_9_2_14_PanIdQuery(thread_cert.TestCase):
         ROUTER_RLOC = pv.vars['ROUTER_RLOC']
         COMMISSIONER_RLOC = pv.vars['COMMISSIONER_RLOC']
         _rpkts = pkts.filter_wpan_src64(ROUTER)
-        _cpkts = pkts.filter_wpan_src64(COMMISSIONER)
 
         # Step 1: Ensure the topology is formed correctly
         _rpkts.filter_mle_cmd(MLE_CHILD_ID_REQUEST).must_next()
 
-        # Step 2: Commissioner MUST send a unicast MGMT_PANID_QUERY.qry unicast to Router_1
-        _cpkts.filter_ipv6_dst(ROUTER_RLOC).filter_coap_request(MGMT_PANID_QUERY).must_next().must_verify(
-            lambda p: {NM_COMMISSIONER_SESSION_ID_TLV, NM_CHANNEL_MASK_TLV, NM_PAN_ID_TLV} <= set(p.thread_meshcop.tlv.
-                                                                                                  type))
-
-        # Step 3: Router MUST send MGMT_ED_REPORT.ans to the Commissioner
-        _rpkts.range(
-            _cpkts.index).filter_ipv6_dst(COMMISSIONER_RLOC).filter_coap_request(MGMT_PANID_CONFLICT).must_next(
-            ).must_verify(lambda p: {NM_CHANNEL_MASK_TLV, NM_PAN_ID_TLV} <= set(p.thread_meshcop.tlv.type))
+        # The Commissioner's packets are searched from where Step 1 is found
+        _cpkts = pkts.filter_wpan_src64(COMMISSIONER)
 
+        # Step 2: Commissioner MUST send a unicast MGMT_PANID_QUERY.qry unicast to Router_1
+        # Step 3: Router MUST send MGMT_PANID_CONFLICT.ans to the Commissioner
         # Step 4: Commissioner MUST send a multicast MGMT_PANID_QUERY.qry
-        _cpkts.filter_ipv6_dst(REALM_LOCAL_All_THREAD_NODES_MULTICAST_ADDRESS).filter_coap_request(
-            MGMT_PANID_QUERY).must_next().must_verify(
-                lambda p: {NM_COMMISSIONER_SESSION_ID_TLV, NM_CHANNEL_MASK_TLV, NM_PAN_ID_TLV} <= set(p.thread_meshcop.
-                                                                                                      tlv.type))
-
         # Step 5: Router MUST send MGMT_PANID_CONFLICT.ans to the Commissioner
-        _rpkts.range(
-            _cpkts.index).filter_ipv6_dst(COMMISSIONER_RLOC).filter_coap_request(MGMT_PANID_CONFLICT).must_next(
-            ).must_verify(lambda p: {NM_CHANNEL_MASK_TLV, NM_PAN_ID_TLV} <= set(p.thread_meshcop.tlv.type))
+        for _query_dst in (ROUTER_RLOC, REALM_LOCAL_All_THREAD_NODES_MULTICAST_ADDRESS):
+            _pkt = _cpkts.filter_ipv6_dst(_query_dst).filter_coap_request(MGMT_PANID_QUERY).must_next()
+            _pkt.must_verify(lambda p: (p.thread_meshcop_tlv_mask & PANID_QUERY_TLVS) == PANID_QUERY_TLVS)
+
+            _pkt = _rpkts.range(_cpkts.index).\
+                filter_ipv6_dst(COMMISSIONER_RLOC).\
+                filter_coap_request(MGMT_PANID_CONFLICT).\
+                must_next()
+            _pkt.must_verify(lambda p: (p.thread_meshcop_tlv_mask & PANID_CONFLICT_TLVS) == PANID_CONFLICT_TLVS)
 
         # Step 6: Router MUST respond with an ICMPv6 Echo Reply
-        _rpkts.filter_ipv6_dst(COMMISSIONER_RLOC).filter_ping_reply().must_next()
+        _pkt = _cpkts.filter_ping_request().must_next()
+        _rpkts.filter_ipv6_dst(COMMISSIONER_RLOC).filter_ping_reply(identifier=_pkt.icmpv6.echo.identifier).must_next()
 
 
 if __name__ == '__main__':
@@ -45,6 +45,10 @@ LEADER = 2
 ROUTER1 = 3
 ROUTER2 = 4
 
+PARENT_REQUEST_TLVS = frozenset({MODE_TLV, CHALLENGE_TLV, SCAN_MASK_TLV, VERSION_TLV})
+CHILD_ID_REQUEST_TLVS = frozenset(
+    {RESPONSE_TLV, LINK_LAYER_FRAME_COUNTER_TLV, MODE_TLV, TIMEOUT_TLV, VERSION_TLV, TLV_REQUEST_TLV})
+
 
 class Cert_9_2_16_ActivePendingPartition(thread_cert.TestCase):
     SUPPORT_NCP = False
@@ -171,7 +175,6 @@ class Cert_9_2_16_ActivePendingPartition(thread_cert.TestCase):
         COMMISSIONER = pv.vars['COMMISSIONER']
         ROUTER_1 = pv.vars['ROUTER_1']
         ROUTER_2 = pv.vars['ROUTER_2']
-        _router2_pkts = pkts.filter_wpan_src64(ROUTER_2)
 
         # Step 1: Ensure the topology is formed correctly
         # Verify Commissioner, Leader and Router_1 are sending MLE advertisements
@@ -182,26 +185,24 @@ class Cert_9_2_16_ActivePendingPartition(thread_cert.TestCase):
         pkts.copy().filter_wpan_src64(ROUTER_1).filter_mle_cmd(MLE_ADVERTISEMENT).must_next()
 
         # Step 5: Router_2 begins attach process by sending a multicast MLE Parent Request
-        # The first MLE Parent Request sent MUST NOT be sent to all routers and REEDS
-        _router2_pkts.range(pkts.index).filter_mle_cmd(MLE_PARENT_REQUEST).must_next().must_verify(
-            lambda p: {MODE_TLV, CHALLENGE_TLV, SCAN_MASK_TLV, VERSION_TLV} == set(
-                p.mle.tlv.type) and p.mle.tlv.scan_mask.r == 1 and p.mle.tlv.scan_mask.e == 0)
-
         # Step 7: Router_2  MUST send a MLE Child ID Request to Router_1
-        _router2_pkts.filter_mle_cmd(MLE_CHILD_ID_REQUEST).must_next().must_verify(lambda p: {
-            RESPONSE_TLV, LINK_LAYER_FRAME_COUNTER_TLV, MODE_TLV, TIMEOUT_TLV, VERSION_TLV, TLV_REQUEST_TLV
-        } < set(p.mle.tlv.type) and ADDRESS_REGISTRATION_TLV not in p.mle.tlv.type)
-
         # Step 14: Router_2 begins attach process by sending a multicast MLE Parent Request
+        # Step 16: Router_2 MUST send a MLE Child ID Request to Router_1
+        # The four requests are matched in a single forward scan of Router_2's packets
+        _router2_pkts = pkts.range(pkts.index).filter_wpan_src64(ROUTER_2)
+        _parent_req_pkts = _router2_pkts.filter_mle_cmd(MLE_PARENT_REQUEST)
+        _child_id_req_pkts = _router2_pkts.filter_mle_cmd(MLE_CHILD_ID_REQUEST)
+        _step5_pkt, _step7_pkt, _step14_pkt, _step16_pkt = _router2_pkts.must_next_sequence(
+            _parent_req_pkts, _child_id_req_pkts, _parent_req_pkts, _child_id_req_pkts)
+
         # The first MLE Parent Request sent MUST NOT be sent to all routers and REEDS
-        _router2_pkts.filter_mle_cmd(MLE_PARENT_REQUEST).must_next().must_verify(
-            lambda p: {MODE_TLV, CHALLENGE_TLV, SCAN_MASK_TLV, VERSION_TLV} == set(
-                p.mle.tlv.type) and p.mle.tlv.scan_mask.r == 1 and p.mle.tlv.scan_mask.e == 0)
+        for _pkt in (_step5_pkt, _step14_pkt):
+            _pkt.must_verify(lambda p: PARENT_REQUEST_TLVS == p.mle_tlv_types and \
+                             p.mle.tlv.scan_mask.r == 1 and p.mle.tlv.scan_mask.e == 0)
 
-        # Step 16: Router_2 MUST send a MLE Child ID Request to Router_1
-        _router2_pkts.filter_mle_cmd(MLE_CHILD_ID_REQUEST).must_next().must_verify(lambda p: {
-            RESPONSE_TLV, LINK_LAYER_FRAME_COUNTER_TLV, MODE_TLV, TIMEOUT_TLV, VERSION_TLV, TLV_REQUEST_TLV
-        } < set(p.mle.tlv.type) and ADDRESS_REGISTRATION_TLV not in p.mle.tlv.type)
+        for _pkt in (_step7_pkt, _step16_pkt):
+            _pkt.must_verify(
+                lambda p: CHILD_ID_REQUEST_TLVS < p.mle_tlv_types and ADDRESS_REGISTRATION_TLV not in p.mle_tlv_types)
 
 
 if __name__ == '__main__':
@@ -43,6 +43,8 @@ LEADER1 = 1
 LEADER2 = 2
 ED1 = 3
 
+ANNOUNCE_TLVS = frozenset({CHANNEL_TLV, PAN_ID_TLV, ACTIVE_TIMESTAMP_TLV})
+
 
 class Cert_9_2_17_Orphan(thread_cert.TestCase):
     SUPPORT_NCP = False
@@ -113,6 +115,8 @@ class Cert_9_2_17_Orphan(thread_cert.TestCase):
         LEADER_1 = pv.vars['LEADER_1']
         LEADER_2 = pv.vars['LEADER_2']
         ED = pv.vars['ED']
+        ED_MLEID = pv.vars['ED_MLEID']
+        LEADER_2_MLEID = pv.vars['LEADER_2_MLEID']
 
         # Step 1: Ensure the topology is formed correctly
         # Verify that Leader_1 & Leader_2 are sending MLE Advertisements on separate channels.
@@ -128,9 +132,9 @@ class Cert_9_2_17_Orphan(thread_cert.TestCase):
 
         # Step 6: ED MUST send a MLE Announce Message
         # The Destination PAN ID (0xFFFF) in the IEEE 802.15.4 MAC and MUST be secured using Key ID Mode 2.
-        _epkts.filter_mle_cmd(MLE_ANNOUNCE).must_next().must_verify(
-            lambda p: {CHANNEL_TLV, PAN_ID_TLV, ACTIVE_TIMESTAMP_TLV} == set(
-                p.mle.tlv.type) and p.wpan.dst_pan == 0xffff and p.wpan.aux_sec.key_id_mode == 0x2)
+        _pkt = _epkts.filter_mle_cmd(MLE_ANNOUNCE).must_next()
+        _pkt.must_verify(lambda p: ANNOUNCE_TLVS == p.mle_tlv_types and \
+                         p.wpan.dst_pan == 0xffff and p.wpan.aux_sec.key_id_mode == 0x2)
 
         # Step 8: ED MUST attempt to attach on the Secondary channel,
         # with the new PAN ID it received in the MLE Announce message from Leader_2
@@ -139,8 +143,10 @@ class Cert_9_2_17_Orphan(thread_cert.TestCase):
         _epkts.range(pkts.index).filter_mle_cmd(MLE_PARENT_REQUEST).must_next()
 
         # Step 9: ED MUST respond with an ICMPv6 Echo Reply
-        _epkts.filter('ipv6.dst == {LEADER_2_MLEID} and ipv6.src == {ED_MLEID}',
-                      **pv.vars).filter_ping_reply().must_next()
+        # The reply is looked up by the identifier of the Echo Request from where the request is found
+        _pkt = pkts.filter_ping_request().filter_ipv6_src_dst(LEADER_2_MLEID, ED_MLEID).must_next()
+        _epkts.range(pkts.index).filter_ping_reply(identifier=_pkt.icmpv6.echo.identifier).filter_ipv6_src_dst(
+            ED_MLEID, LEADER_2_MLEID).must_next()
 
 
 if __name__ == '__main__':
@@ -34,6 +34,7 @@ import thread_cert
 from pktverify.consts import MLE_CHILD_ID_RESPONSE, MLE_CHILD_UPDATE_REQUEST, MLE_DATA_RESPONSE, MLE_DATA_REQUEST, MGMT_ACTIVE_SET_URI, MGMT_PENDING_SET_URI, LINK_LOCAL_ALL_NODES_MULTICAST_ADDRESS, TLV_REQUEST_TLV, SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV, PENDING_TIMESTAMP_TLV, PENDING_OPERATION_DATASET_TLV, NM_COMMISSIONER_SESSION_ID_TLV, NM_BORDER_AGENT_LOCATOR_TLV, NM_ACTIVE_TIMESTAMP_TLV, NM_NETWORK_NAME_TLV, NM_NETWORK_KEY_TLV, NM_CHANNEL_TLV, NM_CHANNEL_MASK_TLV, NM_EXTENDED_PAN_ID_TLV, NM_NETWORK_MESH_LOCAL_PREFIX_TLV, NM_PAN_ID_TLV, NM_PSKC_TLV, NM_SECURITY_POLICY_TLV, NM_DELAY_TIMER_TLV
 from pktverify.packet_verifier import PacketVerifier
 from pktverify.addrs import Ipv6Addr
+from pktverify.utils import tlv_mask
 
 KEY1 = '00112233445566778899aabbccddeeff'
 KEY2 = 'ffeeddccbbaa99887766554433221100'
@@ -49,6 +50,22 @@ SED1 = 5
 
 MTDS = [ED1, SED1]
 
+DATA_RESPONSE_TLVS = tlv_mask(
+    {SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV, PENDING_TIMESTAMP_TLV})
+ROUTER_DATA_RESPONSE_TLVS = DATA_RESPONSE_TLVS | tlv_mask({PENDING_OPERATION_DATASET_TLV})
+# The Child Update Request of Step 12 has the same MLE TLVs as the Data Responses
+CHILD_UPDATE_REQUEST_TLVS = DATA_RESPONSE_TLVS
+SED_DATA_RESPONSE_TLVS = tlv_mask(
+    {SOURCE_ADDRESS_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV, PENDING_TIMESTAMP_TLV, PENDING_OPERATION_DATASET_TLV})
+DATA_REQUEST_TLVS = tlv_mask({TLV_REQUEST_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV})
+COMMISSIONER_MESHCOP_TLVS = tlv_mask({NM_COMMISSIONER_SESSION_ID_TLV, NM_BORDER_AGENT_LOCATOR_TLV})
+ROUTER_PENDING_DATASET_MESHCOP_TLVS = COMMISSIONER_MESHCOP_TLVS | tlv_mask(
+    {NM_ACTIVE_TIMESTAMP_TLV, NM_NETWORK_NAME_TLV, NM_NETWORK_KEY_TLV})
+SED_PENDING_DATASET_MESHCOP_TLVS = tlv_mask({
+    NM_CHANNEL_TLV, NM_NETWORK_MESH_LOCAL_PREFIX_TLV, NM_PAN_ID_TLV, NM_DELAY_TIMER_TLV, NM_ACTIVE_TIMESTAMP_TLV,
+    NM_NETWORK_NAME_TLV, NM_NETWORK_KEY_TLV
+})
+
 
 class Cert_9_2_18_RollBackActiveTimestamp(thread_cert.TestCase):
     SUPPORT_NCP = False
@@ -194,60 +211,56 @@ class Cert_9_2_18_RollBackActiveTimestamp(thread_cert.TestCase):
         # Step 8: Leader MUST multicast a MLE Data Response to the Link-Local All Nodes multicast address
         _pkt = pkts.filter_wpan_src64(LEADER).filter_ipv6_dst(LINK_LOCAL_ALL_NODES_MULTICAST_ADDRESS).filter_mle_cmd(
             MLE_DATA_RESPONSE).must_next()
-        _pkt.must_verify(lambda p: {
-            SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV, PENDING_TIMESTAMP_TLV
-        } == set(p.mle.tlv.type) and {NM_COMMISSIONER_SESSION_ID_TLV, NM_BORDER_AGENT_LOCATOR_TLV} <= set(
-            p.thread_meshcop.tlv.type) and p.thread_nwd.tlv.stable == [0])
+        _pkt.must_verify(lambda p: p.mle_tlv_mask == DATA_RESPONSE_TLVS and\
+                         (p.thread_meshcop_tlv_mask & COMMISSIONER_MESHCOP_TLVS) == COMMISSIONER_MESHCOP_TLVS and\
+                         p.thread_nwd.tlv.stable == [0])
 
         # Step 9: Router MUST send a unicast MLE Data Request to the Leader
         pkts.filter_wpan_src64(ROUTER_1).filter_wpan_dst64(LEADER).filter_mle_cmd(MLE_DATA_REQUEST).must_next(
-        ).must_verify(lambda p: {TLV_REQUEST_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV} <= set(p.mle.tlv.type))
+        ).must_verify(lambda p: (p.mle_tlv_mask & DATA_REQUEST_TLVS) == DATA_REQUEST_TLVS)
 
         # Step 10: Leader MUST send a unicast MLE Data Response to Router_1
-        pkts.filter_wpan_src64(LEADER).filter_wpan_dst64(ROUTER_1).filter_mle_cmd(
-            MLE_DATA_RESPONSE).must_next().must_verify(
-                lambda p: {
-                    SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV, PENDING_TIMESTAMP_TLV,
-                    PENDING_OPERATION_DATASET_TLV
-                } == set(p.mle.tlv.type) and {
-                    NM_COMMISSIONER_SESSION_ID_TLV, NM_BORDER_AGENT_LOCATOR_TLV, NM_ACTIVE_TIMESTAMP_TLV,
-                    NM_NETWORK_NAME_TLV, NM_NETWORK_KEY_TLV
-                } <= set(p.thread_meshcop.tlv.type) and p.thread_nwd.tlv.stable == [0])
+        _step10_pkt = pkts.filter_wpan_src64(LEADER).filter_wpan_dst64(ROUTER_1).filter_mle_cmd(
+            MLE_DATA_RESPONSE).must_next()
+        _step10_pkt.must_verify(lambda p: p.mle_tlv_mask == ROUTER_DATA_RESPONSE_TLVS and\
+                                (p.thread_meshcop_tlv_mask & ROUTER_PENDING_DATASET_MESHCOP_TLVS) ==\
+                                ROUTER_PENDING_DATASET_MESHCOP_TLVS and\
+                                p.thread_nwd.tlv.stable == [0])
 
         # Copy a pv.pkts here to filter SED related packets for potential sequence packets disorder
         _pkts_sed = pkts.copy()
 
         # Step 11: Router MUST multicast a MLE Data Response with the new information
-        pkts.filter_wpan_src64(ROUTER_1).filter_ipv6_dst(LINK_LOCAL_ALL_NODES_MULTICAST_ADDRESS).filter_mle_cmd(
-            MLE_DATA_RESPONSE).must_next().must_verify(
-                lambda p: {
-                    SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV, PENDING_TIMESTAMP_TLV
-                } == set(p.mle.tlv.type) and p.mle.tlv.leader_data.data_version == _pkt.mle.tlv.leader_data.
-                data_version and p.mle.tlv.leader_data.stable_data_version == _pkt.mle.tlv.leader_data.
-                stable_data_version and {NM_COMMISSIONER_SESSION_ID_TLV, NM_BORDER_AGENT_LOCATOR_TLV} <= set(
-                    p.thread_meshcop.tlv.type) and p.thread_nwd.tlv.stable == [0])
+        _step11_pkt = pkts.filter_wpan_src64(ROUTER_1).\
+            filter_ipv6_dst(LINK_LOCAL_ALL_NODES_MULTICAST_ADDRESS).\
+            filter_mle_cmd(MLE_DATA_RESPONSE).\
+            must_next()
+        _step11_pkt.must_verify(lambda p: p.mle_tlv_mask == DATA_RESPONSE_TLVS and\
+                                p.mle.tlv.leader_data.data_version == _pkt.mle.tlv.leader_data.data_version and\
+                                p.mle.tlv.leader_data.stable_data_version ==\
+                                _pkt.mle.tlv.leader_data.stable_data_version and\
+                                (p.thread_meshcop_tlv_mask & COMMISSIONER_MESHCOP_TLVS) ==\
+                                COMMISSIONER_MESHCOP_TLVS and\
+                                p.thread_nwd.tlv.stable == [0])
 
         # Step 12: Router MUST send MLE Child Update Request to SED_1
-        pkts.filter_wpan_src64(ROUTER_1).filter_wpan_dst64(SED).filter_mle_cmd(
-            MLE_CHILD_UPDATE_REQUEST).must_next().must_verify(lambda p: {
-                SOURCE_ADDRESS_TLV, LEADER_DATA_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV, PENDING_TIMESTAMP_TLV
-            } == set(p.mle.tlv.type) and p.mle.tlv.leader_data.data_version == _pkt.mle.tlv.leader_data.data_version)
+        _step12_pkt = pkts.filter_wpan_src64(ROUTER_1).filter_wpan_dst64(SED).filter_mle_cmd(
+            MLE_CHILD_UPDATE_REQUEST).must_next()
+        _step12_pkt.must_verify(lambda p: p.mle_tlv_mask == CHILD_UPDATE_REQUEST_TLVS and\
+                                p.mle.tlv.leader_data.data_version == _pkt.mle.tlv.leader_data.data_version)
 
         # Step 13: SED MUST send a unicast MLE Data Request to Router_1
         _pkts_sed.filter_wpan_src64(SED).filter_wpan_dst64(ROUTER_1).filter_mle_cmd(MLE_DATA_REQUEST).must_next(
-        ).must_verify(lambda p: {TLV_REQUEST_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV} <= set(p.mle.tlv.type))
+        ).must_verify(lambda p: (p.mle_tlv_mask & DATA_REQUEST_TLVS) == DATA_REQUEST_TLVS)
 
         # Step 14: Router MUST send a unicast MLE Data Response to SED_1
-        _pkts_sed.filter_wpan_src64(ROUTER_1).filter_wpan_dst64(SED).filter_mle_cmd(
-            MLE_DATA_RESPONSE).must_next().must_verify(
-                lambda p: {
-                    SOURCE_ADDRESS_TLV, NETWORK_DATA_TLV, ACTIVE_TIMESTAMP_TLV, PENDING_TIMESTAMP_TLV,
-                    PENDING_OPERATION_DATASET_TLV
-                } <= set(p.mle.tlv.type) and {
-                    NM_CHANNEL_TLV, NM_NETWORK_MESH_LOCAL_PREFIX_TLV, NM_PAN_ID_TLV, NM_DELAY_TIMER_TLV,
-                    NM_ACTIVE_TIMESTAMP_TLV, NM_NETWORK_NAME_TLV, NM_NETWORK_KEY_TLV
-                } <= set(p.thread_meshcop.tlv.type) and p.thread_meshcop.tlv.net_name == ["MyHouse"] and p.
-                thread_meshcop.tlv.master_key == KEY2)
+        _step14_pkt = _pkts_sed.filter_wpan_src64(ROUTER_1).filter_wpan_dst64(SED).filter_mle_cmd(
+            MLE_DATA_RESPONSE).must_next()
+        _step14_pkt.must_verify(lambda p: (p.mle_tlv_mask & SED_DATA_RESPONSE_TLVS) == SED_DATA_RESPONSE_TLVS and\
+                                (p.thread_meshcop_tlv_mask & SED_PENDING_DATASET_MESHCOP_TLVS) ==\
+                                SED_PENDING_DATASET_MESHCOP_TLVS and\
+                                p.thread_meshcop.tlv.net_name == ["MyHouse"] and\
+                                p.thread_meshcop.tlv.master_key == KEY2)
 
         # Step 17: MED and SED MUST respond with an ICMPv6 Echo Reply
         pkts.filter_ipv6_src_dst(ED_RLOC, COMMISSIONER_RLOC).filter_ping_reply().must_next()
@@ -39,6 +39,13 @@ from pktverify.null_field import nullField
 COMMISSIONER = 1
 LEADER = 2
 
+PENDING_DATASET_TLVS = frozenset({
+    NM_ACTIVE_TIMESTAMP_TLV, NM_CHANNEL_TLV, NM_CHANNEL_MASK_TLV, NM_DELAY_TIMER_TLV, NM_EXTENDED_PAN_ID_TLV,
+    NM_NETWORK_MESH_LOCAL_PREFIX_TLV, NM_NETWORK_KEY_TLV, NM_NETWORK_NAME_TLV, NM_PAN_ID_TLV, NM_PENDING_TIMESTAMP_TLV,
+    NM_PSKC_TLV, NM_SECURITY_POLICY_TLV
+})
+PENDING_GET_RSP_TLVS = frozenset({NM_DELAY_TIMER_TLV, NM_PAN_ID_TLV})
+
 # Test Purpose and Description:
 # -----------------------------
 # The purpose of this test case is to verify Leader's and active Commissioner's behavior via
@@ -158,15 +165,15 @@ class Cert_9_2_19_PendingDatasetGet(thread_cert.TestCase):
         _mgmt_pending_set_pkt = pkts.filter_wpan_src64(COMMISSIONER).\
             filter_ipv6_2dsts(LEADER_ALOC, LEADER_RLOC).\
             filter_coap_request(MGMT_PENDING_SET_URI).\
-            filter(lambda p: {
-                              NM_ACTIVE_TIMESTAMP_TLV,
-                              NM_PENDING_TIMESTAMP_TLV,
-                              NM_DELAY_TIMER_TLV,
-                              NM_PAN_ID_TLV
-                             } <= set(p.thread_meshcop.tlv.type) and\
-                   p.thread_meshcop.tlv.active_tstamp == 60 and\
+            filter(lambda p: p.thread_meshcop.tlv.active_tstamp == 60 and\
+                   p.thread_meshcop.tlv.delay_timer == 60000 and\
                    p.thread_meshcop.tlv.pan_id == [0xafce] and\
-                   p.thread_meshcop.tlv.delay_timer == 60000
+                   {
+                       NM_ACTIVE_TIMESTAMP_TLV,
+                       NM_PENDING_TIMESTAMP_TLV,
+                       NM_DELAY_TIMER_TLV,
+                       NM_PAN_ID_TLV
+                   } <= p.thread_meshcop_tlv_types
                    ).\
            must_next()
 
@@ -215,21 +222,7 @@ class Cert_9_2_19_PendingDatasetGet(thread_cert.TestCase):
         #             Security Policy TLV
         pkts.filter_ipv6_src_dst(_mgmt_pending_get_pkt.ipv6.dst, COMMISSIONER_RLOC).\
             filter_coap_ack(MGMT_PENDING_GET_URI).\
-            filter(lambda p: {
-                              NM_ACTIVE_TIMESTAMP_TLV,
-                              NM_CHANNEL_TLV,
-                              NM_CHANNEL_MASK_TLV,
-                              NM_DELAY_TIMER_TLV,
-                              NM_EXTENDED_PAN_ID_TLV,
-                              NM_NETWORK_MESH_LOCAL_PREFIX_TLV,
-                              NM_NETWORK_KEY_TLV,
-                              NM_NETWORK_NAME_TLV,
-                              NM_PAN_ID_TLV,
-                              NM_PENDING_TIMESTAMP_TLV,
-                              NM_PSKC_TLV,
-                              NM_SECURITY_POLICY_TLV
-                             } == set(p.thread_meshcop.tlv.type)
-                   ).\
+            filter(lambda p: PENDING_DATASET_TLVS == p.thread_meshcop_tlv_types).\
            must_next()
 
         # Step 8: Commissioner sends a MGMT_PENDING_GET.req to Leader Anycast
@@ -241,10 +234,7 @@ class Cert_9_2_19_PendingDatasetGet(thread_cert.TestCase):
         _mgmt_pending_get_pkt = pkts.filter_wpan_src64(COMMISSIONER).\
             filter_ipv6_2dsts(LEADER_ALOC, LEADER_RLOC).\
             filter_coap_request(MGMT_PENDING_GET_URI).\
-            filter(lambda p: {
-                              NM_PAN_ID_TLV
-                             } <= set(p.thread_meshcop.tlv.type)
-                   ).\
+            filter(lambda p: NM_PAN_ID_TLV in p.thread_meshcop_tlv_types).\
            must_next()
 
         # Step 9: Leader sends a MGMT_PENDING_GET.rsp to Commissioner with
@@ -256,10 +246,7 @@ class Cert_9_2_19_PendingDatasetGet(thread_cert.TestCase):
         #             Delay Timer TLV
         pkts.filter_ipv6_src_dst(_mgmt_pending_get_pkt.ipv6.dst, COMMISSIONER_RLOC).\
             filter_coap_ack(MGMT_PENDING_GET_URI).\
-            filter(lambda p: {
-                              NM_DELAY_TIMER_TLV,
-                              NM_PAN_ID_TLV
-                             } == set(p.coap.tlv.type) and\
+            filter(lambda p: PENDING_GET_RSP_TLVS == p.coap_tlv_types and\
                    p.thread_meshcop.tlv.pan_id == [0xafce] and\
                    p.thread_meshcop.tlv.delay_timer < 60000
                    ).\
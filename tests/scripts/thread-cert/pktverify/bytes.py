@@ -26,9 +26,13 @@
 #  ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 #  POSSIBILITY OF SUCH DAMAGE.
 #
+import os
 import sys
 from typing import Union, Any
 
+# The same flag as `consts.PKTVERIFY_TRACE`, which can not be imported here because `consts` imports this module
+_PKTVERIFY_TRACE = int(os.getenv('PKTVERIFY_TRACE', 0))
+
 
 class Bytes(bytearray):
     """Bytes represents a byte array which is able to handle strings of flexible formats"""
@@ -74,12 +78,12 @@ class Bytes(bytearray):
 
     @staticmethod
     def _parse_compact(s: str) -> bytearray:
-        try:
-            assert len(s) % 2 == 0
-            return bytearray(int(s[i:i + 2], 16) for i in range(0, len(s), 2))
-        except Exception:
+        # bytearray.fromhex parses all bytes at once, but also skips whitespaces which are not valid here
+        if len(s) % 2 != 0 or ' ' in s:
             raise ValueError(s)
 
+        return bytearray.fromhex(s)
+
     @staticmethod
     def _parse_octets(s: str) -> bytearray:
         try:
@@ -125,7 +129,8 @@ class Bytes(bytearray):
             other = self.__class__(other)
 
         eq = super().__eq__(other)
-        print("[%r %s %r]" % (self, "==" if eq else "!=", other), file=sys.stderr)
+        if _PKTVERIFY_TRACE:
+            print("[%r %s %r]" % (self, "==" if eq else "!=", other), file=sys.stderr)
         return eq
 
 
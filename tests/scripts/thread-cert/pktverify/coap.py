@@ -29,6 +29,7 @@
 from typing import Tuple, List
 
 from pktverify.consts import COAP_CODE_POST, COAP_CODE_ACK
+from pktverify.decorators import cached_property
 from pktverify.layers import Layer
 
 
@@ -62,6 +63,27 @@ class CoapLayer(Layer):
         """
         return self.code == COAP_CODE_ACK
 
+    @cached_property
+    def tlv_types(self) -> Tuple[int, ...]:
+        """
+        Returns the TLV types in the COAP payload.
+
+        The payload is walked directly without adding the TLV fields to the layer, and only once per layer.
+        The walk stops at a truncated TLV, so that only the types of the complete TLVs are returned for a
+        malformed payload.
+        """
+        payload = self.payload
+        if not payload:
+            return ()
+
+        types = []
+        r, n = 0, len(payload)
+        while n - r >= 2 and n - r - 2 >= payload[r + 1]:
+            types.append(payload[r])
+            r += payload[r + 1] + 2
+
+        return tuple(types)
+
     def __getattr__(self, name):
         super_attr = super().__getattr__(name)
         if name == 'tlv':
@@ -70,6 +92,11 @@ class CoapLayer(Layer):
         return super_attr
 
     def _parse_coap_payload(self):
+        # the TLVs are already added if the raw packet is shared with another packet (see `Packet.copy`)
+        layer = self._layer
+        if layer is not None and 'coap.tlv.type' in layer._all_fields:
+            return
+
         payload = self.payload
 
         r = 0
@@ -27,6 +27,8 @@
 #  POSSIBILITY OF SUCH DAMAGE.
 #
 
+import os
+
 from pktverify.addrs import Ipv6Addr
 from pktverify.bytes import Bytes
 
@@ -436,6 +438,10 @@ LINK_METRICS_ENH_ACK_PROBING_REGISTER = 1
 # THREAD_COMPANY_ID
 THREAD_IEEE_802154_COMPANY_ID = 0xEAB89B
 
+# Packet filters, layer fields and byte comparisons print each filter, scanned packet, parsed field and compared
+# value only if PKTVERIFY_TRACE is set, because writing them to stderr costs more than checking most packets
+PKTVERIFY_TRACE = int(os.getenv('PKTVERIFY_TRACE', 0))
+
 if __name__ == '__main__':
     from pktverify.addrs import Ipv6Addr
 
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+#
+#  Copyright (c) 2026, The OpenThread Authors.
+#  All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are met:
+#  1. Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in the
+#     documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the
+#     names of its contributors may be used to endorse or promote products
+#     derived from this software without specific prior written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#  AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+#  IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+#  ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+#  LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+#  CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+#  SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+#  INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+#  CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+#  ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+#  POSSIBILITY OF SUCH DAMAGE.
+#
+import itertools
+import logging
+import os
+import pickle
+import shutil
+import subprocess
+import sys
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from pktverify.addrs import ExtAddr, Ipv6Addr
+from pktverify.utils import tlv_mask
+
+
+def _int(v: Union[str, int]) -> int:
+    """parse the field value as an integer"""
+    if isinstance(v, int):
+        return v
+
+    return int(v, 16) if v.startswith('0x') else int(v)
+
+
+def _tlv_mask(values: List[str]) -> int:
+    """parse the TLV type values as a bitmask of TLV types"""
+    return tlv_mask(_int(v) for v in values)
+
+
+def _ext_addr(v: Union[str, bytearray]) -> bytes:
+    """parse the field value as the bytes of an extended address"""
+    return bytes(ExtAddr(v))
+
+
+def _ipv6_addr(v: Union[str, bytearray]) -> bytes:
+    """parse the field value as the bytes of an IPv6 address"""
+    return bytes(Ipv6Addr(v))
+
+
+# Fields that are extracted into the field table, and how to parse their values.
+# The parse functions also normalize the values to match so that columns can be
+# compared using builtin types. Only fields that `tshark` prints in a parsable form
+# can be added (e.g. not the MLE timestamps, which are printed as absolute times).
+_TABLE_FIELDS = {
+    'wpan.src16': _int,
+    'wpan.dst16': _int,
+    'wpan.src64': _ext_addr,
+    'wpan.dst64': _ext_addr,
+    'wpan.dst_pan': _int,
+    'ipv6.src': _ipv6_addr,
+    'ipv6.dst': _ipv6_addr,
+    'mle.cmd': _int,
+    'udp.dstport': _int,
+    'coap.type': _int,
+    'coap.code': _int,
+    'coap.opt.uri_path_recon': sys.intern,
+    'icmpv6.type': _int,
+    'icmpv6.echo.identifier': _int,
+    'thread_address.tlv.target_eid': _ipv6_addr,
+}
+
+# TLV type fields that are extracted into the field table as bitmasks of all TLV types in the packet.
+# The value is 0 if the packet does not have any TLV.
+_TLV_MASK_FIELDS = (
+    'mle.tlv.type',
+    'thread_meshcop.tlv.type',
+)
+
+# The suffix of the file which caches the field table of a pcap file
+_CACHE_SUFFIX = '.fcache'
+
+# The format version of the field table cache, which must be increased when the columns or their values change
+_CACHE_VERSION = 2
+
+
+class FieldTable(object):
+    """
+    Represents a table of packet fields extracted by a single `tshark` pass.
+
+    Each field is stored as a column, i.e. a list indexed by the packet index, so that
+    packets can be matched against field values without walking the dissected packets.
+    The table is loaded lazily when a column is accessed for the first time, unless it is
+    prefetched by `prefetch`.
+    """
+
+    def __init__(self, filename: str, *, tshark_path: str, override_prefs: dict, decode_as: dict):
+        self._filename = filename
+        self._num_packets = None
+        self._tshark_path = tshark_path
+        self._override_prefs = override_prefs
+        self._decode_as = decode_as
+        self._columns = None
+        self._value_indexes = {}
+        self._match_cache = {}
+        self._dfilter_cache = {}
+        self._prefetch_thread = None
+        self._prefetch_columns = None
+
+    def __len__(self):
+        self._ensure_loaded()
+        return self._num_packets
+
+    def prefetch(self):
+        """
+        Starts the `tshark` pass of the table in the background unless the table is cached.
+
+        `tshark` runs as a separate process, so it can extract the fields on another core
+        while the packets are being dissected.
+        """
+        if self._columns is not None or self._prefetch_thread is not None:
+            return
+
+        args = self._fields_args()
+        columns = self._load_cache(self._cache_key(args))
+        if columns is not None:
+            self._set_columns(columns)
+            return
+
+        self._prefetch_thread = threading.Thread(target=self._prefetch_tshark, args=(args,), daemon=True)
+        self._prefetch_thread.start()
+
+    def _prefetch_tshark(self, args: List[str]):
+        try:
+            self._prefetch_columns = self._read_tshark(args)
+        except subprocess.CalledProcessError as ex:
+            # the failure is raised again when the table is loaded without the prefetched columns
+            logging.warning("can not prefetch field table: %s", ex)
+
+    def column(self, field: str) -> List[Any]:
+        """
+        Returns the column of a given field.
+
+        :param field: The field name (e.g. `mle.cmd`).
+        :return: A list of field values indexed by the packet index. The value is a tuple of all occurrences
+                 of the field in the packet, which is empty if the packet does not have the field
+                 (or the bitmask of all TLV types for TLV type fields).
+        """
+        self._ensure_loaded()
+        return self._columns[field]
+
+    def match(self, **conds) -> List[int]:
+        """
+        Returns the indexes of packets whose fields equal to all given values.
+
+        A field which occurs more than once in a packet (e.g. `ipv6.dst` of IPv6-in-IPv6) matches if any
+        occurrence equals to the value.
+
+        :param conds: The field values to match. Field names use `_` instead of `.`
+                      (e.g. `mle_cmd=MLE_DATA_RESPONSE`).
+        :return: The sorted list of matching packet indexes.
+        """
+        conds = tuple(sorted((self.field_name(name), value) for name, value in conds.items()))
+        indexes = self._match_cache.get(conds)
+        if indexes is None:
+            matches = sorted(
+                (self.value_indexes(field).get(_TABLE_FIELDS[field](value), ()) for field, value in conds), key=len)
+            if not matches:
+                indexes = list(range(len(self)))
+            elif len(matches) == 1:
+                indexes = list(matches[0])
+            else:
+                indexes = sorted(set(matches[0]).intersection(*matches[1:]))
+
+            self._match_cache[conds] = indexes
+
+        return indexes
+
+    def match_any(self, name: str, values: Iterable[Any]) -> List[int]:
+        """
+        Returns the indexes of packets whose field equals to any of the given values.
+
+        :param name: The keyword name of the field (e.g. `ipv6_dst`).
+        :param values: The field values to match.
+        :return: The sorted list of matching packet indexes.
+        """
+        field = self.field_name(name)
+        key = (field, 'any', frozenset(_TABLE_FIELDS[field](v) for v in values))
+        indexes = self._match_cache.get(key)
+        if indexes is None:
+            value_indexes = self.value_indexes(field)
+            indexes = sorted(set(itertools.chain.from_iterable(value_indexes.get(v, ()) for v in key[2])))
+            self._match_cache[key] = indexes
+
+        return indexes
+
+    def match_tlvs(self, field: str, mask: int) -> List[int]:
+        """
+        Returns the indexes of packets which have all TLV types in a given bitmask.
+
+        :param field: The TLV type field name (e.g. `mle.tlv.type`).
+        :param mask: The bitmask of required TLV types (see `utils.tlv_mask`).
+        :return: The sorted list of matching packet indexes.
+        """
+        assert field in _TLV_MASK_FIELDS, field
+        key = (field, 'tlvs', mask)
+        indexes = self._match_cache.get(key)
+        if indexes is None:
+            indexes = [i for i, m in enumerate(self.column(field)) if (m & mask) == mask]
+            self._match_cache[key] = indexes
+
+        return indexes
+
+    def value_indexes(self, field: str) -> Dict[Any, List[int]]:
+        """
+        Returns the indexes of packets grouped by the values of a given field.
+
+        The groups are built by a single pass over the column when the field is used for the first time.
+
+        :param field: The field name (e.g. `mle.cmd`).
+        :return: A dict which maps each field value to the sorted list of packet indexes having the value
+                 in any occurrence of the field.
+        """
+        value_indexes = self._value_indexes.get(field)
+        if value_indexes is None:
+            value_indexes = {}
+            for i, values in enumerate(self.column(field)):
+                for v in values:
+                    indexes = value_indexes.setdefault(v, [])
+                    # the same value may occur more than once in a packet
+                    if not indexes or indexes[-1] != i:
+                        indexes.append(i)
+
+            self._value_indexes[field] = value_indexes
+
+        return value_indexes
+
+    def dfilter_match(self, dfilter: str) -> List[int]:
+        """
+        Returns the indexes of packets which match a display filter.
+
+        The display filter is applied by `tshark -Y`, and the result is cached by the filter string
+        so that filtering with the same display filter again does not spawn `tshark`.
+
+        :param dfilter: The display filter (e.g. `mle.cmd == 8 && wpan.dst_pan == 0xafce`).
+        :return: The sorted list of matching packet indexes.
+        """
+        indexes = self._dfilter_cache.get(dfilter)
+        if indexes is None:
+            args = self._tshark_args() + ['-Y', dfilter, '-T', 'fields', '-e', 'frame.number']
+            logging.info("matching display filter: %s", dfilter)
+            output = subprocess.check_output(args)
+            indexes = [int(line) - 1 for line in output.split()]
+            self._dfilter_cache[dfilter] = indexes
+
+        return indexes
+
+    @staticmethod
+    def field_name(name: str) -> str:
+        """
+        Converts a keyword name (e.g. `coap_opt_uri_path_recon`) to the field name.
+
+        :param name: The keyword name.
+        :return: The field name.
+        """
+        for field in itertools.chain(_TABLE_FIELDS, _TLV_MASK_FIELDS):
+            if field.replace('.', '_') == name:
+                return field
+
+        raise KeyError('Field %s is not in the field table, please add it to `_TABLE_FIELDS`' % name)
+
+    def _tshark_args(self) -> List[str]:
+        args = [self._tshark_path, '-n', '-r', self._filename]
+        for k, v in self._override_prefs.items():
+            args += ['-o', f'{k}:{v}']
+        for k, v in self._decode_as.items():
+            args += ['-d', f'{k},{v}']
+
+        return args
+
+    def _fields_args(self) -> List[str]:
+        # print all occurrences of each field joined by `,` so that each packet is a single line
+        args = self._tshark_args() + [
+            '-T', 'fields', '-E', 'header=n', '-E', 'separator=/t', '-E', 'occurrence=a', '-E', 'aggregator=,', '-e',
+            'frame.number'
+        ]
+        for field in itertools.chain(_TABLE_FIELDS, _TLV_MASK_FIELDS):
+            args += ['-e', field]
+
+        return args
+
+    def _ensure_loaded(self):
+        if self._columns is None:
+            self._set_columns(self._load())
+
+    def _set_columns(self, columns: Dict[str, List[Any]]):
+        self._columns = columns
+        self._num_packets = len(next(iter(columns.values())))
+
+    def _load(self) -> Dict[str, List[Any]]:
+        args = self._fields_args()
+        cache_key = self._cache_key(args)
+        columns = self._load_cache(cache_key)
+        if columns is None:
+            columns = self._load_tshark(args)
+            self._save_cache(cache_key, columns)
+
+        return columns
+
+    def _cache_key(self, args: List[str]) -> Tuple:
+        # the cache is valid only for the same pcap file extracted by the same `tshark` with the same arguments
+        st = os.stat(self._filename)
+        return _CACHE_VERSION, st.st_size, st.st_mtime_ns, self._tshark_stat(args[0]), tuple(args)
+
+    @staticmethod
+    def _tshark_stat(tshark_path: str) -> Optional[Tuple[int, int]]:
+        # `tshark` upgraded in place at the same path is detected by the size and mtime of the binary
+        try:
+            st = os.stat(shutil.which(tshark_path) or tshark_path)
+        except OSError:
+            return None
+
+        return st.st_size, st.st_mtime_ns
+
+    def _load_cache(self, cache_key: Tuple) -> Optional[Dict[str, List[Any]]]:
+        try:
+            with open(self._filename + _CACHE_SUFFIX, 'rb') as f:
+                key, columns = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError, ImportError, TypeError):
+            return None
+
+        if key != cache_key:
+            return None
+
+        logging.info("loaded field table from cache: %s", self._filename + _CACHE_SUFFIX)
+        return columns
+
+    def _save_cache(self, cache_key: Tuple, columns: Dict[str, List[Any]]):
+        try:
+            with open(self._filename + _CACHE_SUFFIX, 'wb') as f:
+                pickle.dump((cache_key, columns), f, pickle.HIGHEST_PROTOCOL)
+        except OSError as ex:
+            logging.warning("can not save field table cache: %s", ex)
+
+    def _load_tshark(self, args: List[str]) -> Dict[str, List[Any]]:
+        if self._prefetch_thread is not None:
+            self._prefetch_thread.join()
+            self._prefetch_thread = None
+
+        columns, self._prefetch_columns = self._prefetch_columns, None
+        if columns is None:
+            columns = self._read_tshark(args)
+
+        return columns
+
+    def _read_tshark(self, args: List[str]) -> Dict[str, List[Any]]:
+        logging.info("loading field table: %s", ' '.join(args[:4]))
+        # Each packet is a single line in the order of the packets. The lines are parsed while `tshark` is still
+        # dissecting the following packets, instead of after the whole output is collected.
+        with subprocess.Popen(args, stdout=subprocess.PIPE, universal_newlines=True) as proc:
+            columns = self._read_columns(proc.stdout)
+
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, args)
+
+        return columns
+
+    @classmethod
+    def _read_columns(cls, lines: Iterable[str]) -> Dict[str, List[Any]]:
+        # Each line has the frame number and then the values of `_TABLE_FIELDS` and `_TLV_MASK_FIELDS`
+        # separated by tabs, where all occurrences of each field are joined by `,`
+        columns = {field: [] for field in itertools.chain(_TABLE_FIELDS, _TLV_MASK_FIELDS)}
+        # Each distinct value of a field is parsed once, so that the packets of the same device share the same
+        # address object instead of parsing the address of each packet again
+        table_columns = [(columns[field], parse, {}) for field, parse in _TABLE_FIELDS.items()]
+        tlv_mask_columns = [columns[field] for field in _TLV_MASK_FIELDS]
+        num_values = len(table_columns) + len(tlv_mask_columns)
+
+        for line in lines:
+            values = line.rstrip('\n').split('\t')[1:]
+            values += [''] * (num_values - len(values))
+
+            for (column, parse, parsed), value in zip(table_columns, values):
+                try:
+                    column.append(parsed[value])
+                except KeyError:
+                    column.append(parsed.setdefault(value, cls._parse_occurrences(parse, value)))
+
+            for column, value in zip(tlv_mask_columns, values[len(table_columns):]):
+                column.append((cls._parse(_tlv_mask, value.split(',')) or 0) if value else 0)
+
+        return columns
+
+    @classmethod
+    def _parse_occurrences(cls, parse: Callable, value: str) -> Tuple[Any, ...]:
+        if not value:
+            return ()
+
+        values = (cls._parse(parse, v) for v in value.split(','))
+        return tuple(v for v in values if v is not None)
+
+    @staticmethod
+    def _parse(parse: Callable, value: str) -> Any:
+        try:
+            return parse(value)
+        except ValueError:
+            logging.warning("can not parse field value: %r", value)
+            return None
@@ -36,7 +36,7 @@ from pyshark.packet.packet import Packet as RawPacket
 
 from pktverify.addrs import EthAddr, ExtAddr, Ipv6Addr
 from pktverify.bytes import Bytes
-from pktverify.consts import VALID_LAYER_NAMES
+from pktverify.consts import PKTVERIFY_TRACE, VALID_LAYER_NAMES
 from pktverify.null_field import nullField
 
 
@@ -162,9 +162,9 @@ def _float(v: Union[LayerFieldsContainer, LayerField]) -> float:
 
 
 def _str(v: Union[LayerFieldsContainer, LayerField]) -> str:
-    """parse the layer field as a string"""
+    """parse the layer field as an interned string, so that comparing with string constants is mostly identity check"""
     assert not isinstance(v, LayerFieldsContainer) or len(v.fields) == 1
-    return str(v.get_default_value())
+    return sys.intern(str(v.get_default_value()))
 
 
 def _bytes(v: Union[LayerFieldsContainer, LayerField]) -> Bytes:
@@ -698,13 +698,15 @@ def get_layer_field(packet: RawPacket, field_uri: str) -> Any:
             if v is not None:
                 try:
                     v = _LAYER_FIELDS[field_uri](v)
-                    print("[%s = %r] " % (field_uri, v), file=sys.stderr)
+                    if PKTVERIFY_TRACE:
+                        print("[%s = %r] " % (field_uri, v), file=sys.stderr)
                     return v
                 except Exception as ex:
                     raise ValueError('can not parse field %s = %r' % (field_uri,
                                                                       (v.get_default_value(), v.raw_value))) from ex
 
-        print("[%s = %s] " % (field_uri, "null"), file=sys.stderr)
+        if PKTVERIFY_TRACE:
+            print("[%s = %s] " % (field_uri, "null"), file=sys.stderr)
         return nullField
 
     elif is_layer_field_container(field_uri):
@@ -740,6 +742,17 @@ def check_layer_field_exists(packet, field_uri):
 
 
 def _get_candidate_layers(packet, layer_name):
+    # The candidate layers of each layer name are looked up once per packet, since every newly accessed field
+    # would otherwise scan all the layers of the packet again
+    cache = packet.__dict__.setdefault('_pktverify_candidate_layers', {})
+    layers = cache.get(layer_name)
+    if layers is None:
+        layers = cache[layer_name] = _find_candidate_layers(packet, layer_name)
+
+    return layers
+
+
+def _find_candidate_layers(packet, layer_name):
     if layer_name == 'thread_meshcop':
         candidate_layer_names = ['thread_meshcop', 'mle', 'coap', 'thread_bl', 'thread_nm']
     elif layer_name == 'thread_nwd':
@@ -28,7 +28,7 @@
 #
 import logging
 import sys
-from typing import Iterable, List, Union, Callable
+from typing import Iterable, FrozenSet, List, Union, Callable
 
 from pyshark.packet.layer import Layer as RawLayer
 from pyshark.packet.packet import Packet as RawPacket
@@ -36,18 +36,33 @@ from pyshark.packet.packet import Packet as RawPacket
 from pktverify import errors
 from pktverify.addrs import EthAddr
 from pktverify.coap import CoapLayer
-from pktverify.consts import VALID_LAYER_NAMES
+from pktverify.consts import PKTVERIFY_TRACE, VALID_LAYER_NAMES
 from pktverify.decorators import cached_property
 from pktverify.layers import Layer, ThreadMeshcopLayer, Icmpv6Layer, WpanLayer, ThreadNetworkDataLayer, DnsLayer
-from pktverify.utils import make_filter_func
+from pktverify.utils import make_filter_func, tlv_mask
+
+
+def _tlv_type_set(types) -> FrozenSet[int]:
+    # `types` is nullField if the packet does not have any TLV
+    return frozenset(types) if types else frozenset()
 
 
 class Packet(object):
 
     def __init__(self, packet: RawPacket):
         self._packet = packet
+        self._eth_wrappers = []
         self._strip_wpan_eth_wrapper(packet)
 
+    def copy(self) -> 'Packet':
+        """
+        Returns a new packet of the same raw packet, which does not share the layers and cached values of this packet.
+        """
+        p = Packet.__new__(Packet)
+        p._packet = self._packet
+        p._eth_wrappers = self._eth_wrappers
+        return p
+
     def __str__(self) -> str:
         return str(self._packet)
 
@@ -64,14 +79,19 @@ class Packet(object):
         for layer in packet.layers:
             if layer.layer_name == 'eth':
                 packet.layers.remove(layer)
-                eth_src = EthAddr(layer.get_field('eth.src'))
-                eth_dst = EthAddr(layer.get_field('eth.dst'))
-                logging.debug("stripping eth: src=%s, dst=%s", eth_src, eth_dst)
-                channel = eth_src[5]
-                self.wpan._add_field('wpan.channel', hex(channel))
+                # the channel is decoded from the eth wrapper when the wpan layer is accessed
+                self._eth_wrappers.append(layer)
 
         return
 
+    @staticmethod
+    def _add_wpan_channel(wpan: WpanLayer, eth_layer: RawLayer):
+        eth_src = EthAddr(eth_layer.get_field('eth.src'))
+        eth_dst = EthAddr(eth_layer.get_field('eth.dst'))
+        logging.debug("stripping eth: src=%s, dst=%s", eth_src, eth_dst)
+        channel = eth_src[5]
+        wpan._add_field('wpan.channel', hex(channel))
+
     @property
     def layers(self) -> Iterable[RawLayer]:
         for l in self._packet.layers:
@@ -84,7 +104,12 @@ class Packet(object):
 
     @cached_property
     def wpan(self) -> WpanLayer:
-        return WpanLayer(self._packet, 'wpan')
+        wpan = WpanLayer(self._packet, 'wpan')
+        # the channel is already added if the raw packet is shared with another packet (see `copy`)
+        if self._eth_wrappers and 'wpan.channel' not in wpan._layer._all_fields:
+            for eth_layer in self._eth_wrappers:
+                self._add_wpan_channel(wpan, eth_layer)
+        return wpan
 
     @cached_property
     def coap(self) -> CoapLayer:
@@ -106,6 +131,41 @@ class Packet(object):
     def dns(self) -> DnsLayer:
         return DnsLayer(self._packet, 'dns')
 
+    @cached_property
+    def mle_tlv_types(self) -> FrozenSet[int]:
+        """The set of MLE TLV types in the packet"""
+        return _tlv_type_set(self.mle.tlv.type)
+
+    @cached_property
+    def coap_tlv_types(self) -> FrozenSet[int]:
+        """The set of CoAP TLV types in the packet"""
+        return _tlv_type_set(self.coap.tlv_types)
+
+    @cached_property
+    def thread_meshcop_tlv_types(self) -> FrozenSet[int]:
+        """The set of MeshCoP TLV types in the packet"""
+        return _tlv_type_set(self.thread_meshcop.tlv.type)
+
+    @cached_property
+    def thread_nwd_tlv_types(self) -> FrozenSet[int]:
+        """The set of Network Data TLV types in the packet"""
+        return _tlv_type_set(self.thread_nwd.tlv.type)
+
+    @cached_property
+    def mle_tlv_mask(self) -> int:
+        """The bitmask of MLE TLV types in the packet"""
+        return tlv_mask(self.mle_tlv_types)
+
+    @cached_property
+    def coap_tlv_mask(self) -> int:
+        """The bitmask of CoAP TLV types in the packet"""
+        return tlv_mask(self.coap_tlv_types)
+
+    @cached_property
+    def thread_meshcop_tlv_mask(self) -> int:
+        """The bitmask of MeshCoP TLV types in the packet"""
+        return tlv_mask(self.thread_meshcop_tlv_types)
+
     def __getattr__(self, layer_name: str) -> Layer:
 
         real_layer_name = layer_name
@@ -124,10 +184,12 @@ class Packet(object):
         return layer
 
     def verify(self, func: Union[str, Callable], **vars) -> bool:
-        print("\n>>> verifying packet:", file=sys.stderr, flush=False)
+        if PKTVERIFY_TRACE:
+            print("\n>>> verifying packet:", file=sys.stderr, flush=False)
         func = make_filter_func(func, **vars)
         ok = func(self)
-        print("\t=> %s" % ok, file=sys.stderr)
+        if PKTVERIFY_TRACE:
+            print("\t=> %s" % ok, file=sys.stderr)
         return ok
 
     def must_verify(self, func: Union[str, Callable], **vars):
@@ -26,17 +26,19 @@
 #  POSSIBILITY OF SUCH DAMAGE.
 #
 
+import bisect
 import logging
 import sys
 from operator import attrgetter
-from typing import Optional, Callable, Tuple, Union
+from typing import Any, Optional, Callable, List, Sequence, Tuple, Union
 
 from pktverify import consts, errors
 from pktverify.addrs import EthAddr, ExtAddr, Ipv6Addr
 from pktverify.bytes import Bytes
 from pktverify.consts import THREAD_ALLOWED_ICMPV6_TYPES
+from pktverify.field_table import FieldTable
 from pktverify.packet import Packet
-from pktverify.utils import make_filter_func
+from pktverify.utils import make_filter_func, tlv_mask
 
 WPAN, ETH = 0, 1
 
@@ -55,10 +57,49 @@ class _SavedIndex(object):
         self._pkts.index = self._saved_index
 
 
+class _PacketColumns(object):
+    """
+    Represents the per-packet fields used for index bookkeeping, extracted once for all filters of a capture
+    """
+    __slots__ = ('sniff_timestamps', 'is_wpan', 'is_eth')
+
+    def __init__(self, pkts):
+        self.sniff_timestamps = tuple(p.sniff_timestamp for p in pkts)
+        # check the layer names so that the layers are not created and decoded for every packet
+        layer_names = [p.layer_names for p in pkts]
+        self.is_wpan = tuple('wpan' in names for names in layer_names)
+        self.is_eth = tuple('eth' in names for names in layer_names)
+
+
 def _always_true(p):
     return True
 
 
+def _fuse_filter_funcs(funcs: Tuple[Callable, ...]) -> Callable:
+    """
+    Fuse filter funcs into a single filter func which evaluates them in order with short circuit.
+    """
+    if not funcs:
+        return _always_true
+    elif len(funcs) == 1:
+        return funcs[0]
+    elif len(funcs) == 2:
+        # most filters chain a few funcs, which are called directly without looping over them
+        func1, func2 = funcs
+        return lambda p: bool(func1(p) and func2(p))
+    elif len(funcs) == 3:
+        func1, func2, func3 = funcs
+        return lambda p: bool(func1(p) and func2(p) and func3(p))
+
+    def fused_filter_func(p):
+        for func in funcs:
+            if not func(p):
+                return False
+        return True
+
+    return fused_filter_func
+
+
 class PacketFilter(object):
     """
     Represents a range of packets that are filtered by given filter
@@ -70,8 +111,12 @@ class PacketFilter(object):
                  stop=None,
                  *,
                  index=None,
-                 filter_func: Optional[Callable] = None,
-                 parent: Optional['PacketFilter'] = None):
+                 filter_funcs: Tuple[Callable, ...] = (),
+                 parent: Optional['PacketFilter'] = None,
+                 field_table: Optional[FieldTable] = None,
+                 candidates: Optional[Sequence[int]] = None,
+                 field_conds: Tuple[Tuple[str, Any], ...] = (),
+                 columns: Optional[_PacketColumns] = None):
         if stop is None:
             stop = (len(pkts), len(pkts))
 
@@ -80,8 +125,14 @@ class PacketFilter(object):
         self._stop_index = stop
         self._index = index if index is not None else self._start_index
         self._last_index = -1
-        self._filter_func = filter_func or _always_true
+        self._filter_funcs = filter_funcs
+        self._filter_func = _fuse_filter_funcs(filter_funcs)
         self._parent = parent
+        self._field_table = field_table
+        self._candidates = candidates
+        # The field conds that `candidates` were matched by, if they were matched by field conds only
+        self._field_conds = field_conds
+        self._columns = columns or _PacketColumns(pkts)
         self._check_type_ok()
 
     def _check_type_ok(self):
@@ -154,17 +205,120 @@ class PacketFilter(object):
         :param vars: variables for filter string
         :return: a new PacketFilter
         """
-        print('\n>>> filtering in range %s~%s%s:' %
-              (self._index, self._stop_index, "<end>" if self._stop_index == len(self._pkts) else "<stop>"),
-              file=sys.stderr)
+        if consts.PKTVERIFY_TRACE:
+            print('\n>>> filtering in range %s~%s%s:' %
+                  (self._index, self._stop_index, "<end>" if self._stop_index == len(self._pkts) else "<stop>"),
+                  file=sys.stderr)
 
         func = make_filter_func(func, **vars)
         self._check_type_ok()
         return PacketFilter(self._pkts,
                             self._index,
                             self._stop_index,
-                            filter_func=lambda p: self._filter_func(p) and func(p),
-                            parent=self if cascade else None)
+                            filter_funcs=self._filter_funcs + (func,),
+                            parent=self if cascade else None,
+                            field_table=self._field_table,
+                            candidates=self._candidates,
+                            field_conds=self._field_conds,
+                            columns=self._columns)
+
+    def filter_fields(self, cascade=True, **conds) -> 'PacketFilter':
+        """
+        Create a new PacketFilter based on this packet filter that only matches packets with given field values.
+
+        The field values are matched against the field table extracted by `tshark`, so packets which do not match
+        are skipped without being checked by the filter func. A field which occurs more than once in a packet
+        (e.x. `ipv6.dst` of IPv6-in-IPv6) matches if any occurrence equals to the value.
+
+        :param cascade: True if calling next in the new filter will also set index for this filter, False otherwise
+        :param conds: the field values to match (e.x. mle_cmd=MLE_DATA_RESPONSE, wpan_src64=ROUTER)
+        :return: a new PacketFilter
+        """
+        assert self._field_table is not None, 'field table is not available'
+        if consts.PKTVERIFY_TRACE:
+            print('\n>>> filtering fields in range %s~%s: %s' % (self._index, self._stop_index, conds),
+                  file=sys.stderr)
+        return self._filter_table_fields(cascade, **conds)
+
+    def filter_tlvs(self, cascade=True, **masks) -> 'PacketFilter':
+        """
+        Create a new PacketFilter based on this packet filter that only matches packets with all given TLV types.
+
+        The TLV types are matched against the TLV type bitmasks in the field table.
+
+        :param cascade: True if calling next in the new filter will also set index for this filter, False otherwise
+        :param masks: the bitmasks of required TLV types (e.x. mle_tlv_type=tlv_mask({LEADER_DATA_TLV}))
+        :return: a new PacketFilter
+        """
+        assert self._field_table is not None, 'field table is not available'
+        if consts.PKTVERIFY_TRACE:
+            print('\n>>> filtering TLVs in range %s~%s: %s' % (self._index, self._stop_index, masks), file=sys.stderr)
+
+        pkts = self
+        for name, mask in masks.items():
+            field = self._field_table.field_name(name)
+            pkts = pkts._filter_candidates(self._field_table.match_tlvs(field, mask), cascade)
+
+        return pkts
+
+    def filter_dfilter(self, dfilter: str, cascade=True) -> 'PacketFilter':
+        """
+        Create a new PacketFilter based on this packet filter that only matches packets matching a display filter.
+
+        The display filter is evaluated by `tshark` in a single pass over the pcap file.
+
+        :param dfilter: The Wireshark display filter (e.x. `mle.cmd == 8 && wpan.dst_pan == 0xafce`)
+        :param cascade: True if calling next in the new filter will also set index for this filter, False otherwise
+        :return: a new PacketFilter
+        """
+        assert self._field_table is not None, 'field table is not available'
+        if consts.PKTVERIFY_TRACE:
+            print('\n>>> filtering display filter in range %s~%s: %s' % (self._index, self._stop_index, dfilter),
+                  file=sys.stderr)
+        return self._filter_candidates(self._field_table.dfilter_match(dfilter), cascade)
+
+    def _filter_candidates(self,
+                           candidates: Sequence[int],
+                           cascade: bool,
+                           field_conds: Tuple[Tuple[str, Any], ...] = ()) -> 'PacketFilter':
+        if self._candidates is not None and not field_conds:
+            candidates = sorted(set(candidates).intersection(self._candidates))
+
+        self._check_type_ok()
+        return PacketFilter(self._pkts,
+                            self._index,
+                            self._stop_index,
+                            filter_funcs=self._filter_funcs,
+                            parent=self if cascade else None,
+                            field_table=self._field_table,
+                            candidates=candidates,
+                            field_conds=field_conds,
+                            columns=self._columns)
+
+    def _filter_table_fields(self, cascade: bool, **conds) -> 'PacketFilter':
+        # The matching packets of the field values are looked up in the field table once and cached, so that
+        # filtering the same values again does not scan all packets. The filter funcs still check the packets.
+        if self._field_table is None:
+            return self
+
+        # Chained field filters (e.x. wpan_src64 and mle_cmd) are combined into a single match, so that the
+        # packets of each combination are also looked up once and cached instead of intersected every time
+        if self._candidates is None or self._field_conds:
+            field_conds = dict(self._field_conds)
+            if field_conds.keys().isdisjoint(conds):
+                field_conds.update(conds)
+                return self._filter_candidates(self._field_table.match(**field_conds), cascade,
+                                               tuple(field_conds.items()))
+
+        return self._filter_candidates(self._field_table.match(**conds), cascade)
+
+    def _filter_table_any(self, name: str, values: Sequence[Any], cascade: bool) -> 'PacketFilter':
+        # The packets whose field equals to any of the values are looked up in the field table once and cached.
+        # The filter funcs still check the packets.
+        if self._field_table is None:
+            return self
+
+        return self._filter_candidates(self._field_table.match_any(name, values), cascade)
 
     def filter_if(self, cond: bool, *args, **kwargs) -> 'PacketFilter':
         """
@@ -203,24 +357,144 @@ class PacketFilter(object):
         idx = min(self._index)
         stop_idx = max(self._stop_index)
 
-        while idx < stop_idx:
+        is_wpan, is_eth = self._columns.is_wpan, self._columns.is_eth
+
+        for idx in self._iter_indexes(idx, stop_idx):
             p = self._pkts[idx]
 
-            sys.stderr.write('#%d %s' % (idx + 1, '\n' if idx % 40 == 39 else ''))
+            if consts.PKTVERIFY_TRACE:
+                sys.stderr.write('#%d %s' % (idx + 1, '\n' if idx % 40 == 39 else ''))
+
             if self._filter_func(p):
-                if p.wpan and not (self._index[0] <= idx < self._stop_index[0]):  # wpan matched but not in range
+                if is_wpan[idx] and not (self._index[0] <= idx < self._stop_index[0]):  # wpan matched but not in range
                     pass
-                elif p.eth and not (self._index[1] <= idx < self._stop_index[1]):  # eth matched but not in range
+                elif is_eth[idx] and not (self._index[1] <= idx < self._stop_index[1]):  # eth matched but not in range
                     pass
                 else:
                     self._on_found_next(idx, p)
-                    print("\n>>> found packet at #%d!" % (idx + 1,), file=sys.stderr)
+                    if consts.PKTVERIFY_TRACE:
+                        print("\n>>> found packet at #%d!" % (idx + 1,), file=sys.stderr)
                     return p
 
-            idx += 1
-
         return None
 
+    def find(self, *funcs, cascade=True) -> Optional[Packet]:
+        """
+        Find the next packet that matches the current filter and all given filter funcs in a single scan.
+
+        :param funcs: callables that return a bool (e.x. lambda p: xxx) or filter strings
+        :param cascade: True if the found packet will also set index for this filter, False otherwise
+        :return: the next matching packet, or None if packet not found
+        """
+        funcs = tuple(make_filter_func(func) for func in funcs)
+        self._check_type_ok()
+        return PacketFilter(self._pkts,
+                            self._index,
+                            self._stop_index,
+                            filter_funcs=self._filter_funcs + funcs,
+                            parent=self if cascade else None,
+                            field_table=self._field_table,
+                            candidates=self._candidates,
+                            field_conds=self._field_conds,
+                            columns=self._columns).next()
+
+    def must_find(self, *funcs, cascade=True) -> Packet:
+        """
+        Call .find(), raise error if packet is not found.
+
+        :param funcs: callables that return a bool (e.x. lambda p: xxx) or filter strings
+        :param cascade: True if the found packet will also set index for this filter, False otherwise
+        :return: the next matching packet
+        """
+        p = self.find(*funcs, cascade=cascade)
+        if p is not None:
+            return p
+        else:
+            raise errors.PacketNotFound(self.index, self._stop_index)
+
+    def find_pair(self, req_func, rsp_func) -> Optional[Tuple[Packet, Packet]]:
+        """
+        Find the next request packet and then its response packet after it.
+
+        The response is searched from where the request is found, so both packets are found in a single forward scan.
+
+        :param req_func: a callable that returns a bool (e.x. lambda p: xxx), a filter string, or a PacketFilter
+                         created from this filter for the request
+        :param rsp_func: a callable that returns a bool (e.x. lambda p: xxx), a filter string, or a PacketFilter
+                         created from this filter for the response
+        :return: the request and response packets, or None if either is not found
+        """
+        req = self._find_from_index(req_func)
+        if req is None:
+            return None
+
+        rsp = self._find_from_index(rsp_func)
+        if rsp is None:
+            return None
+
+        return req, rsp
+
+    def must_find_pair(self, req_func, rsp_func) -> Tuple[Packet, Packet]:
+        """
+        Call .find_pair(), raise error if either packet is not found.
+
+        :param req_func: a callable that returns a bool (e.x. lambda p: xxx), a filter string, or a PacketFilter
+                         created from this filter for the request
+        :param rsp_func: a callable that returns a bool (e.x. lambda p: xxx), a filter string, or a PacketFilter
+                         created from this filter for the response
+        :return: the request and response packets
+        """
+        pair = self.find_pair(req_func, rsp_func)
+        if pair is not None:
+            return pair
+        else:
+            raise errors.PacketNotFound(self.index, self._stop_index)
+
+    def must_next_sequence(self, *funcs) -> List[Packet]:
+        """
+        Find the packets that match the given filter funcs one after another.
+
+        Each packet is searched from where the previous one is found, so the whole sequence is matched in a single
+        forward scan, and the index is set after the last packet. Sub filters with field table candidates only check
+        their candidate packets, so the scan jumps from one candidate to the next instead of checking every packet.
+
+        :param funcs: callables that return a bool (e.x. lambda p: xxx), filter strings, or PacketFilters
+                      created from this filter (e.x. pkts.filter_fields(...)), in the expected order
+        :return: the matching packets, in the same order as `funcs`
+        """
+        pkts = []
+        for func in funcs:
+            p = self._find_from_index(func)
+            if p is None:
+                raise errors.PacketNotFound(self.index, self._stop_index)
+            pkts.append(p)
+
+        return pkts
+
+    def _find_from_index(self, func) -> Optional[Packet]:
+        if isinstance(func, PacketFilter):
+            assert func._is_cascaded_to(self), 'the sub filter must be created from this filter with cascade'
+            # search the sub filter from where the previous packet is found
+            func.index = self.index
+            return func.next()
+        else:
+            return self.find(func)
+
+    def _is_cascaded_to(self, pkts: 'PacketFilter') -> bool:
+        f = self
+        while f is not None and f is not pkts:
+            f = f._parent
+
+        return f is pkts
+
+    def _iter_indexes(self, start: int, stop: int):
+        if self._candidates is None:
+            return range(start, stop)
+
+        lo = bisect.bisect_left(self._candidates, start)
+        hi = bisect.bisect_left(self._candidates, stop, lo)
+        return self._candidates[lo:hi]
+
     def must_next(self) -> Packet:
         """
         Call .next(), raise error if packet is not found.
@@ -249,35 +523,36 @@ class PacketFilter(object):
     def _on_found_next(self, idx: int, p: Packet):
         assert self._pkts[idx] is p
         assert idx >= min(self._index)
-        assert not p.wpan or idx >= self._index[0]
-        assert not p.eth or idx >= self._index[1], (self._index, idx)
+        is_wpan = self._columns.is_wpan[idx]
+        assert not is_wpan or idx >= self._index[0]
+        assert not self._columns.is_eth[idx] or idx >= self._index[1], (self._index, idx)
 
-        if p.wpan:
+        min_sniff_timestamp = self._columns.sniff_timestamps[idx] - consts.AUTO_SEEK_BACK_MAX_DURATION
+        if is_wpan:
             wpan_idx = idx + 1
-            eth_idx = max(self._index[1],
-                          self._find_prev_packet(idx + 1, p.sniff_timestamp - consts.AUTO_SEEK_BACK_MAX_DURATION, ETH))
+            eth_idx = max(self._index[1], self._find_prev_packet(idx + 1, min_sniff_timestamp, ETH))
         else:
             eth_idx = idx + 1
-            wpan_idx = max(
-                self._index[0],
-                self._find_prev_packet(idx + 1, p.sniff_timestamp - consts.AUTO_SEEK_BACK_MAX_DURATION, WPAN))
+            wpan_idx = max(self._index[0], self._find_prev_packet(idx + 1, min_sniff_timestamp, WPAN))
 
         # make sure index never go back
         assert wpan_idx >= self._index[0]
         assert eth_idx >= self._index[1]
 
-        print('\n>>>_on_found_next %d %s => %s' % (idx, self._index, (wpan_idx, eth_idx)), file=sys.stderr)
+        if consts.PKTVERIFY_TRACE:
+            print('\n>>>_on_found_next %d %s => %s' % (idx, self._index, (wpan_idx, eth_idx)), file=sys.stderr)
         self._set_found_index(idx, (wpan_idx, eth_idx))
 
     def _find_prev_packet(self, idx, min_sniff_timestamp, pkttype):
         assert pkttype in (WPAN, ETH)
 
+        sniff_timestamps = self._columns.sniff_timestamps
+        is_pkttype = self._columns.is_wpan if pkttype == WPAN else self._columns.is_eth
+
         prev_idx = idx
-        while idx > 0 and self._pkts[idx - 1].sniff_timestamp >= min_sniff_timestamp:
+        while idx > 0 and sniff_timestamps[idx - 1] >= min_sniff_timestamp:
             idx -= 1
-            if pkttype == WPAN and self._pkts[idx].wpan:
-                prev_idx = idx
-            elif pkttype == ETH and self._pkts[idx].eth:
+            if is_pkttype[idx]:
                 prev_idx = idx
 
         return prev_idx
@@ -301,13 +576,29 @@ class PacketFilter(object):
 
         assert self._start_index <= start <= self._stop_index
         assert self._start_index <= stop <= self._stop_index
-        return PacketFilter(self._pkts, start, stop, filter_func=self._filter_func, parent=self if cascade else None)
+        return PacketFilter(self._pkts,
+                            start,
+                            stop,
+                            filter_funcs=self._filter_funcs,
+                            parent=self if cascade else None,
+                            field_table=self._field_table,
+                            candidates=self._candidates,
+                            field_conds=self._field_conds,
+                            columns=self._columns)
 
     def copy(self) -> 'PacketFilter':
         """
         :return: a copy of the current PacketFilter
         """
-        return PacketFilter(self._pkts, self._index, self._stop_index, filter_func=self._filter_func, parent=None)
+        return PacketFilter(self._pkts,
+                            self._index,
+                            self._stop_index,
+                            filter_funcs=self._filter_funcs,
+                            parent=None,
+                            field_table=self._field_table,
+                            candidates=self._candidates,
+                            field_conds=self._field_conds,
+                            columns=self._columns)
 
     def __getitem__(self, index: int) -> Packet:
         """
@@ -330,17 +621,18 @@ class PacketFilter(object):
 
         wpan_idx = self._index[0]
         if wpan and wpan_idx < len(self._pkts):
-            wpan_idx = self._find_prev_packet(wpan_idx, self._pkts[wpan_idx].sniff_timestamp - max_duration, WPAN)
+            wpan_idx = self._find_prev_packet(wpan_idx, self._columns.sniff_timestamps[wpan_idx] - max_duration, WPAN)
             wpan_idx = max(self._start_index[0], wpan_idx)
 
         eth_idx = self._index[1]
         if eth and eth_idx < len(self._pkts):
-            eth_idx = self._find_prev_packet(eth_idx, self._pkts[eth_idx].sniff_timestamp - max_duration, ETH)
+            eth_idx = self._find_prev_packet(eth_idx, self._columns.sniff_timestamps[eth_idx] - max_duration, ETH)
             eth_idx = max(self._start_index[1], eth_idx)
 
-        print("\n>>> back %s wpan=%s, eth=%s: index %s => %s" % (max_duration, wpan, eth, self._index,
-                                                                 (wpan_idx, eth_idx)),
-              file=sys.stderr)
+        if consts.PKTVERIFY_TRACE:
+            print("\n>>> back %s wpan=%s, eth=%s: index %s => %s" % (max_duration, wpan, eth, self._index,
+                                                                     (wpan_idx, eth_idx)),
+                  file=sys.stderr)
         self._index = (wpan_idx, eth_idx)
         self._check_type_ok()
         return self
@@ -364,7 +656,7 @@ class PacketFilter(object):
         return self.filter_LLANMA(). \
             filter_mle_cmd(consts.MLE_ADVERTISEMENT). \
             filter(lambda p: tlv_set ==
-                             set(p.mle.tlv.type) and \
+                             p.mle_tlv_types and \
                              p.ipv6.hlim == 255, **kwargs
                    )
 
@@ -388,7 +680,13 @@ class PacketFilter(object):
         """
         assert isinstance(uri_path, str), uri_path
         assert port is None or isinstance(port, int), port
-        return self.filter(
+        conds = {}
+        if confirmable is not None:
+            conds['coap_type'] = 0 if confirmable else 1
+        if port is not None:
+            conds['udp_dstport'] = port
+        pkts = self._filter_coap_code_uri_path(consts.COAP_CODE_POST, uri_path, kwargs.get('cascade', True), **conds)
+        return pkts.filter(
             lambda p: (p.coap.is_post and p.coap.opt.uri_path_recon == uri_path and
                        (confirmable is None or p.coap.type ==
                         (0 if confirmable else 1)) and (port is None or p.udp.dstport == port)), **kwargs)
@@ -404,10 +702,17 @@ class PacketFilter(object):
         """
         assert isinstance(uri_path, str), uri_path
         assert port is None or isinstance(port, int), port
-        return self.filter(
+        conds = {} if port is None else {'udp_dstport': port}
+        pkts = self._filter_coap_code_uri_path(consts.COAP_CODE_ACK, uri_path, kwargs.get('cascade', True), **conds)
+        return pkts.filter(
             lambda p: (p.coap.is_ack and p.coap.opt.uri_path_recon == uri_path and
                        (port is None or p.udp.dstport == port)), **kwargs)
 
+    def _filter_coap_code_uri_path(self, code: int, uri_path: str, cascade: bool, **conds) -> 'PacketFilter':
+        # The matching packets of each code and URI path (and the CoAP type and UDP port if given) are looked up
+        # in the field table once and cached. The candidates are still checked by the filter func of the caller.
+        return self._filter_table_fields(cascade, coap_code=code, coap_opt_uri_path_recon=uri_path, **conds)
+
     def filter_backbone_answer(self,
                                target: str,
                                *,
@@ -495,21 +800,28 @@ class PacketFilter(object):
         return self.filter(lambda p: p.wpan.channel == channel, **kwargs)
 
     def filter_wpan_src16(self, addr, **kwargs):
-        return self.filter(lambda p: p.wpan.src16 == addr, **kwargs)
+        pkts = self._filter_table_fields(kwargs.get('cascade', True), wpan_src16=addr)
+        return pkts.filter(lambda p: p.wpan.src16 == addr, **kwargs)
 
     def filter_wpan_dst16(self, addr, **kwargs):
-        return self.filter(lambda p: p.wpan.dst16 == addr, **kwargs)
+        pkts = self._filter_table_fields(kwargs.get('cascade', True), wpan_dst16=addr)
+        return pkts.filter(lambda p: p.wpan.dst16 == addr, **kwargs)
 
     def filter_wpan_src16_dst16(self, src_addr, dst_addr, **kwargs):
-        return self.filter(lambda p: p.wpan.src16 == src_addr and p.wpan.dst16 == dst_addr, **kwargs)
+        pkts = self._filter_table_fields(kwargs.get('cascade', True), wpan_src16=src_addr, wpan_dst16=dst_addr)
+        return pkts.filter(lambda p: p.wpan.src16 == src_addr and p.wpan.dst16 == dst_addr, **kwargs)
 
     def filter_wpan_src64(self, addr, **kwargs):
         assert isinstance(addr, (str, ExtAddr)), addr
-        return self.filter(lambda p: p.wpan.src64 == addr, **kwargs)
+        addr = ExtAddr(addr)
+        pkts = self._filter_table_fields(kwargs.get('cascade', True), wpan_src64=addr)
+        return pkts.filter(lambda p: p.wpan.src64 == addr, **kwargs)
 
     def filter_wpan_dst64(self, addr, **kwargs):
         assert isinstance(addr, (str, ExtAddr)), addr
-        return self.filter(lambda p: p.wpan.dst64 == addr, **kwargs)
+        addr = ExtAddr(addr)
+        pkts = self._filter_table_fields(kwargs.get('cascade', True), wpan_dst64=addr)
+        return pkts.filter(lambda p: p.wpan.dst64 == addr, **kwargs)
 
     def filter_dst16(self, rloc16: int, **kwargs):
         return self.filter(lambda p: p.lowpan.mesh.dest16 == rloc16 or p.wpan.dst16 == rloc16, **kwargs)
@@ -521,60 +833,79 @@ class PacketFilter(object):
         return self.filter(lambda p: p.wpan.ie_present == 0)
 
     def filter_ping_request(self, identifier=None, **kwargs):
-        return self.filter(
+        pkts = self._filter_icmpv6_echo(consts.ICMPV6_TYPE_ECHO_REQUEST, identifier, kwargs.get('cascade', True))
+        return pkts.filter(
             lambda p: p.icmpv6.is_ping_request and (identifier is None or p.icmpv6.echo.identifier == identifier),
             **kwargs)
 
     def filter_ping_reply(self, **kwargs):
         identifier = kwargs.pop('identifier', None)
-        return self.filter(
+        pkts = self._filter_icmpv6_echo(consts.ICMPV6_TYPE_ECHO_REPLY, identifier, kwargs.get('cascade', True))
+        return pkts.filter(
             lambda p: (p.icmpv6.is_ping_reply and (identifier is None or p.icmpv6.echo.identifier == identifier)),
             **kwargs)
 
+    def _filter_icmpv6_echo(self, icmpv6_type: int, identifier: Optional[int], cascade: bool) -> 'PacketFilter':
+        # Ping packets are looked up in the field table by the ICMPv6 type (and the echo identifier if given).
+        # The candidates are still checked by the filter func of the caller.
+        if identifier is None:
+            return self._filter_table_fields(cascade, icmpv6_type=icmpv6_type)
+        else:
+            return self._filter_table_fields(cascade, icmpv6_type=icmpv6_type, icmpv6_echo_identifier=identifier)
+
     def filter_eth(self, **kwargs):
         return self.filter(attrgetter('eth'), **kwargs)
 
     def filter_eth_src(self, addr, **kwargs):
         assert isinstance(addr, (str, EthAddr))
+        addr = EthAddr(addr)
         return self.filter(lambda p: p.eth.src == addr, **kwargs)
 
     def filter_ipv6_dst(self, addr, **kwargs):
         assert isinstance(addr, (str, Ipv6Addr))
-        return self.filter(lambda p: p.ipv6.dst == addr, **kwargs)
+        addr = Ipv6Addr(addr)
+        pkts = self._filter_table_fields(kwargs.get('cascade', True), ipv6_dst=addr)
+        return pkts.filter(lambda p: p.ipv6.dst == addr, **kwargs)
 
     def filter_ipv6_2dsts(self, addr1, addr2, **kwargs):
         assert isinstance(addr1, (str, Ipv6Addr))
         assert isinstance(addr2, (str, Ipv6Addr))
-        return self.filter(lambda p: p.ipv6.dst == addr1 or p.ipv6.dst == addr2, **kwargs)
+        addr1 = Ipv6Addr(addr1)
+        addr2 = Ipv6Addr(addr2)
+        pkts = self._filter_table_any('ipv6_dst', (addr1, addr2), kwargs.get('cascade', True))
+        return pkts.filter(lambda p: p.ipv6.dst == addr1 or p.ipv6.dst == addr2, **kwargs)
 
     def filter_ipv6_src_dst(self, src_addr, dst_addr, **kwargs):
         assert isinstance(src_addr, (str, Ipv6Addr))
         assert isinstance(dst_addr, (str, Ipv6Addr))
-        return self.filter(lambda p: p.ipv6.src == src_addr and p.ipv6.dst == dst_addr, **kwargs)
+        src_addr = Ipv6Addr(src_addr)
+        dst_addr = Ipv6Addr(dst_addr)
+        pkts = self._filter_table_fields(kwargs.get('cascade', True), ipv6_src=src_addr, ipv6_dst=dst_addr)
+        return pkts.filter(lambda p: p.ipv6.src == src_addr and p.ipv6.dst == dst_addr, **kwargs)
 
     def filter_LLATNMA(self, **kwargs):
-        return self.filter(lambda p: p.ipv6.dst == consts.LINK_LOCAL_All_THREAD_NODES_MULTICAST_ADDRESS, **kwargs)
+        return self.filter_ipv6_dst(consts.LINK_LOCAL_All_THREAD_NODES_MULTICAST_ADDRESS, **kwargs)
 
     def filter_RLANMA(self, **kwargs):
-        return self.filter(lambda p: p.ipv6.dst == consts.REALM_LOCAL_ALL_NODES_ADDRESS, **kwargs)
+        return self.filter_ipv6_dst(consts.REALM_LOCAL_ALL_NODES_ADDRESS, **kwargs)
 
     def filter_RLARMA(self, **kwargs):
-        return self.filter(lambda p: p.ipv6.dst == consts.REALM_LOCAL_ALL_ROUTERS_ADDRESS, **kwargs)
+        return self.filter_ipv6_dst(consts.REALM_LOCAL_ALL_ROUTERS_ADDRESS, **kwargs)
 
     def filter_RLATNMA(self, **kwargs):
-        return self.filter(lambda p: p.ipv6.dst == consts.REALM_LOCAL_All_THREAD_NODES_MULTICAST_ADDRESS, **kwargs)
+        return self.filter_ipv6_dst(consts.REALM_LOCAL_All_THREAD_NODES_MULTICAST_ADDRESS, **kwargs)
 
     def filter_LLANMA(self, **kwargs):
-        return self.filter(lambda p: p.ipv6.dst == consts.LINK_LOCAL_ALL_NODES_MULTICAST_ADDRESS, **kwargs)
+        return self.filter_ipv6_dst(consts.LINK_LOCAL_ALL_NODES_MULTICAST_ADDRESS, **kwargs)
 
     def filter_LLABMA(self, **kwargs):
-        return self.filter(lambda p: p.ipv6.dst == consts.LINK_LOCAL_ALL_BBRS_MULTICAST_ADDRESS, **kwargs)
+        return self.filter_ipv6_dst(consts.LINK_LOCAL_ALL_BBRS_MULTICAST_ADDRESS, **kwargs)
 
     def filter_LLARMA(self, **kwargs):
-        return self.filter(lambda p: p.ipv6.dst == consts.LINK_LOCAL_ALL_ROUTERS_MULTICAST_ADDRESS, **kwargs)
+        return self.filter_ipv6_dst(consts.LINK_LOCAL_ALL_ROUTERS_MULTICAST_ADDRESS, **kwargs)
 
     def filter_AMPLFMA(self, mpl_seed_id: Union[int, Ipv6Addr] = None, **kwargs):
-        f = self.filter(lambda p: p.ipv6.dst == consts.ALL_MPL_FORWARDERS_MA, **kwargs)
+        f = self.filter_ipv6_dst(consts.ALL_MPL_FORWARDERS_MA, **kwargs)
         if mpl_seed_id is not None:
             if isinstance(mpl_seed_id, int):
                 mpl_seed_id = Bytes([mpl_seed_id >> 8, mpl_seed_id & 0xFF])
@@ -595,15 +926,23 @@ class PacketFilter(object):
 
     def filter_mle_cmd(self, cmd, **kwargs):
         assert isinstance(cmd, int), cmd
-        return self.filter(lambda p: p.mle.cmd == cmd, **kwargs)
+        pkts = self._filter_table_fields(kwargs.get('cascade', True), mle_cmd=cmd)
+        return pkts.filter(lambda p: p.mle.cmd == cmd, **kwargs)
 
     def filter_mle_cmd2(self, cmd1, cmd2, **kwargs):
         assert isinstance(cmd1, int), cmd1
         assert isinstance(cmd2, int), cmd2
-        return self.filter(lambda p: p.mle.cmd == cmd1 or p.mle.cmd == cmd2, **kwargs)
+        pkts = self._filter_table_any('mle_cmd', (cmd1, cmd2), kwargs.get('cascade', True))
+        return pkts.filter(lambda p: p.mle.cmd == cmd1 or p.mle.cmd == cmd2, **kwargs)
 
     def filter_mle_has_tlv(self, *tlv_types, **kwargs):
-        return self.filter(lambda p: set(tlv_types) <= set(p.mle.tlv.type), **kwargs)
+        tlv_set = frozenset(tlv_types)
+        pkts = self
+        if self._field_table is not None:
+            pkts = self._filter_candidates(self._field_table.match_tlvs('mle.tlv.type', tlv_mask(tlv_set)),
+                                           kwargs.get('cascade', True))
+
+        return pkts.filter(lambda p: tlv_set <= p.mle_tlv_types, **kwargs)
 
     def filter_icmpv6(self, **kwargs):
         return self.filter(attrgetter('icmpv6'), **kwargs)
@@ -31,7 +31,6 @@ from typing import Tuple
 
 from pktverify import consts
 from pktverify.consts import MLE_CHILD_ID_REQUEST, MLE_ADVERTISEMENT, MLE_CHILD_ID_RESPONSE
-from pktverify.pcap_reader import PcapReader
 from pktverify.summary import Summary
 from pktverify.test_info import TestInfo
 from pktverify.verify_result import VerifyResult
@@ -57,6 +56,9 @@ class PacketVerifier(object):
                             format='File "%(pathname)s", line %(lineno)d, in %(funcName)s\n'
                             '%(asctime)s - %(levelname)s - %(message)s')
 
+        # pyshark is imported only when the packets are read, so that importing the test scripts stays cheap
+        from pktverify.pcap_reader import PcapReader
+
         ti = TestInfo(test_info_path)
         if wireshark_prefs is not None:
             pkts = PcapReader.read(ti.pcap_path, wireshark_prefs)
@@ -34,6 +34,7 @@ from typing import Optional
 import pyshark
 
 from pktverify import consts, utils
+from pktverify.field_table import FieldTable
 from pktverify.packet import Packet
 from pktverify.packet_filter import PacketFilter
 
@@ -43,6 +44,11 @@ class PcapReader(object):
     Implements Pcap reading utilities.
     """
 
+    # The packets and field table of the last Pcap file read, so that reading the same
+    # Pcap file again does not dissect the file again. Each read gets new packets of the
+    # same raw packets, so that the values cached by the packets of a read are not shared.
+    _read_cache = {}
+
     @classmethod
     def read(cls,
              filename: str,
@@ -61,15 +67,34 @@ class PcapReader(object):
         if tshark_path is None:
             tshark_path = utils.which_tshark()
 
+        st = os.stat(filename)
+        cache_key = (os.path.abspath(filename), st.st_size, st.st_mtime_ns, tshark_path,
+                     tuple(sorted(override_prefs.items())))
+        if cache_key in cls._read_cache:
+            logging.info("Using packets already read from %s", filename)
+            pkts, field_table = cls._read_cache[cache_key]
+            return PacketFilter(tuple(p.copy() for p in pkts), field_table=field_table)
+
         logging.info("Using tshark path: %s", tshark_path)
-        subprocess.check_call(f"{tshark_path} -v", shell=True)
-        os.system(f"ls -l {filename}")
+        if consts.PKTVERIFY_TRACE:
+            # show the tshark version and the Pcap file only when tracing, since each spawns a process
+            subprocess.check_call(f"{tshark_path} -v", shell=True)
+            os.system(f"ls -l {filename}")
+        # extract the field table in parallel with dissecting the packets
+        field_table = FieldTable(filename,
+                                 tshark_path=tshark_path,
+                                 override_prefs=override_prefs,
+                                 decode_as=consts.WIRESHARK_DECODE_AS_ENTRIES)
+        field_table.prefetch()
         filecap = pyshark.FileCapture(filename,
                                       tshark_path=tshark_path,
                                       override_prefs=override_prefs,
                                       decode_as=consts.WIRESHARK_DECODE_AS_ENTRIES)
         filecap.load_packets()
-        return PacketFilter(tuple(map(Packet, filecap._packets)))
+        pkts = tuple(map(Packet, filecap._packets))
+        cls._read_cache.clear()
+        cls._read_cache[cache_key] = (tuple(p.copy() for p in pkts), field_table)
+        return PacketFilter(pkts, field_table=field_table)
 
 
 if __name__ == '__main__':
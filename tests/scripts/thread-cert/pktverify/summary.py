@@ -29,11 +29,16 @@
 
 import logging
 import operator
+import os
 import sys
 
 from pktverify import consts
 from pktverify.test_info import TestInfo
 
+# Summary.show() prints the summary only if PKTVERIFY_SUMMARY is set, because printing
+# requires analyzing all packets before verification starts
+PKTVERIFY_SUMMARY = int(os.getenv('PKTVERIFY_SUMMARY', 0))
+
 
 class NodeSummary(object):
     """
@@ -95,13 +100,19 @@ class Summary(object):
         self._pkts = pkts
         self._test_info = test_info
         self._leader_id = None
-        self._analyze()
+        self._analyzed = False
+        self._analyze_test_info()
 
     def iterroles(self):
+        self._analyze()
         return self._role_to_node.items()
 
     def _analyze(self):
-        self._analyze_test_info()
+        # packets are analyzed lazily when the summary is used for the first time
+        if self._analyzed:
+            return
+
+        self._analyzed = True
 
         with self._pkts.save_index():
             for f in [
@@ -124,21 +135,23 @@ class Summary(object):
             self._extaddr_to_node[extaddr] = node
 
     def _analyze_leader(self):
-        for p in self._pkts:
+        # only MLE Data Responses and Advertisements are checked, which are looked up in the field table
+        pkts = self._pkts.filter_mle_cmd2(consts.MLE_DATA_RESPONSE, consts.MLE_ADVERTISEMENT, cascade=False)
+        p = pkts.next()
+        while p is not None:
+            p.mle.__getattr__('tlv')
+            p.mle.__getattr__('tlv.leader_data')
+            p.mle.__getattr__('tlv.leader_data.router_id')
 
-            if p.mle.cmd in [consts.MLE_DATA_RESPONSE, consts.MLE_ADVERTISEMENT]:
+            tlv = p.mle.tlv
+            if tlv.leader_data:
+                self._leader_id = tlv.leader_data.router_id
+                logging.info("leader found in pcap: %d", self._leader_id)
+                return
 
-                p.mle.__getattr__('tlv')
-                p.mle.__getattr__('tlv.leader_data')
-                p.mle.__getattr__('tlv.leader_data.router_id')
+            p = pkts.next()
 
-                tlv = p.mle.tlv
-                if tlv.leader_data:
-                    self._leader_id = tlv.leader_data.router_id
-                    logging.info("leader found in pcap: %d", self._leader_id)
-                    break
-        else:
-            logging.warning("leader not found in pcap")
+        logging.warning("leader not found in pcap")
 
     def _analyze_packets(self):
         for i, p in enumerate(self._pkts):
@@ -161,6 +174,10 @@ class Summary(object):
                     logging.warn("Extaddr %s is not in the testbed", extaddr)
 
     def show(self):
+        if not PKTVERIFY_SUMMARY:
+            return
+
+        self._analyze()
         show_roles = "\n\t\t".join(map(str, self._role_to_node.values()))
         sys.stderr.write("""{header}
     Pcap Summary:
@@ -177,12 +194,15 @@ class Summary(object):
         ))
 
     def ipaddr_mleid_by_role(self, role):
+        self._analyze()
         node = self._role_to_node[role]
         return node.ipaddr_mleid
 
     def ipaddr_link_local_by_role(self, role):
+        self._analyze()
         node = self._role_to_node[role]
         return node.ipaddr_link_local
 
     def role(self, r):
+        self._analyze()
         return self._role_to_node[r]
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+#
+#  Copyright (c) 2026, The OpenThread Authors.
+#  All rights reserved.
+#
+#  Redistribution and use in source and binary forms, with or without
+#  modification, are permitted provided that the following conditions are met:
+#  1. Redistributions of source code must retain the above copyright
+#     notice, this list of conditions and the following disclaimer.
+#  2. Redistributions in binary form must reproduce the above copyright
+#     notice, this list of conditions and the following disclaimer in the
+#     documentation and/or other materials provided with the distribution.
+#  3. Neither the name of the copyright holder nor the
+#     names of its contributors may be used to endorse or promote products
+#     derived from this software without specific prior written permission.
+#
+#  THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+#  AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+#  IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+#  ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+#  LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+#  CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+#  SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+#  INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+#  CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+#  ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+#  POSSIBILITY OF SUCH DAMAGE.
+#
+import itertools
+# This is a test script for checking the field table and the packet filter cursor against canned tshark output.
+#
+
+import sys
+import types
+import unittest
+
+from pktverify import errors
+from pktverify.addrs import ExtAddr, Ipv6Addr
+from pktverify.consts import MLE_CHILD_ID_REQUEST, MLE_CHILD_ID_RESPONSE, MLE_PARENT_REQUEST, MLE_PARENT_RESPONSE
+from pktverify.field_table import FieldTable, _TABLE_FIELDS, _TLV_MASK_FIELDS
+from pktverify.packet_filter import PacketFilter
+from pktverify.utils import tlv_mask
+
+ROUTER = '00:11:22:33:44:55:66:77'
+CHILD = '00:11:22:33:44:55:66:78'
+
+# the MLE timestamps are printed as absolute times which contain the aggregator `,`
+TIMESTAMP = 'Jan  1, 1970 00:00:10.000000000 UTC'
+
+
+def tshark_line(frame_number: int, **values) -> str:
+    """make a line printed by `tshark -T fields` for the field table, using `_` instead of `.` in field names"""
+    fields = [field.replace('.', '_') for field in list(_TABLE_FIELDS) + list(_TLV_MASK_FIELDS)]
+    return '\t'.join([str(frame_number)] + [values.get(field, '') for field in fields]) + '\n'
+
+
+def make_field_table(lines) -> FieldTable:
+    """make a field table from canned tshark lines"""
+    table = FieldTable('test.pcap', tshark_path='tshark', override_prefs={}, decode_as={})
+    table._set_columns(FieldTable._read_columns(lines))
+    return table
+
+
+# The MLE commands sent by the router and the child in order
+MLE_CMDS = (
+    (CHILD, MLE_PARENT_REQUEST),
+    (ROUTER, MLE_PARENT_RESPONSE),
+    (CHILD, MLE_PARENT_REQUEST),
+    (ROUTER, MLE_PARENT_RESPONSE),
+    (CHILD, MLE_CHILD_ID_REQUEST),
+    (ROUTER, MLE_CHILD_ID_RESPONSE),
+)
+
+
+def make_mle_packets():
+    """make fake MLE packets and their field table"""
+    pkts = tuple(
+        types.SimpleNamespace(index=i,
+                              sniff_timestamp=float(i),
+                              layer_names=['wpan', 'mle'],
+                              wpan=types.SimpleNamespace(src64=ExtAddr(src64)),
+                              mle=types.SimpleNamespace(cmd=cmd)) for i, (src64, cmd) in enumerate(MLE_CMDS))
+    table = make_field_table(
+        tshark_line(i + 1, wpan_src64=src64, mle_cmd=str(cmd)) for i, (src64, cmd) in enumerate(MLE_CMDS))
+    return pkts, table
+
+
+class TestFieldTable(unittest.TestCase):
+
+    def test_read_tshark(self):
+        table = FieldTable('test.pcap', tshark_path='tshark', override_prefs={}, decode_as={})
+        lines = tshark_line(1, wpan_src64=ROUTER, mle_cmd='11') + tshark_line(2, wpan_src16='0x0400')
+        columns = table._read_tshark([sys.executable, '-c', 'import sys; sys.stdout.write(%r)' % lines])
+
+        self.assertEqual(columns['wpan.src64'], [(bytes(ExtAddr(ROUTER)),), ()])
+        self.assertEqual(columns['mle.cmd'], [(11,), ()])
+        self.assertEqual(columns['wpan.src16'], [(), (0x400,)])
+
+    def test_multiple_occurrences(self):
+        # IPv6-in-IPv6 packets have both the outer and the inner IPv6 header
+        table = make_field_table([
+            tshark_line(1, ipv6_dst='ff03::1,fd00::1'),
+            tshark_line(2, ipv6_dst='fd00::1'),
+            tshark_line(3, ipv6_dst='ff02::1'),
+            tshark_line(4),
+        ])
+
+        self.assertEqual(table.column('ipv6.dst')[0], (bytes(Ipv6Addr('ff03::1')), bytes(Ipv6Addr('fd00::1'))))
+        self.assertEqual(table.column('ipv6.dst')[3], ())
+        self.assertEqual(table.match(ipv6_dst='fd00::1'), [0, 1])
+        self.assertEqual(table.match(ipv6_dst='ff03::1'), [0])
+        self.assertEqual(table.match_any('ipv6_dst', ['ff03::1', 'ff02::1']), [0, 2])
+
+    def test_same_value_occurs_more_than_once(self):
+        table = make_field_table([tshark_line(1, udp_dstport='19788,19788'), tshark_line(2, udp_dstport='19788')])
+
+        self.assertEqual(table.value_indexes('udp.dstport'), {19788: [0, 1]})
+
+    def test_timestamp_values(self):
+        self.assertNotIn('mle.tlv.active_tstamp', _TABLE_FIELDS)
+        self.assertNotIn('mle.tlv.pending_tstamp', _TABLE_FIELDS)
+
+        # values which can not be parsed are dropped instead of failing the whole table
+        with self.assertLogs(level='WARNING'):
+            table = make_field_table([tshark_line(1, mle_cmd=TIMESTAMP), tshark_line(2, mle_cmd='11')])
+
+        self.assertEqual(table.column('mle.cmd'), [(), (11,)])
+        self.assertEqual(table.match(mle_cmd=11), [1])
+
+    def test_match_fields(self):
+        table = make_field_table([
+            tshark_line(1, wpan_src64=ROUTER, mle_cmd='11'),
+            tshark_line(2, wpan_src64=CHILD, mle_cmd='11'),
+            tshark_line(3, wpan_src64=ROUTER, coap_code='2'),
+        ])
+
+        self.assertEqual(table.match(wpan_src64=ROUTER), [0, 2])
+        self.assertEqual(table.match(wpan_src64=ExtAddr(ROUTER), mle_cmd=11), [0])
+        self.assertEqual(table.match(mle_cmd=12), [])
+        self.assertEqual(table.match(), [0, 1, 2])
+
+    def test_field_name(self):
+        self.assertEqual(FieldTable.field_name('coap_opt_uri_path_recon'), 'coap.opt.uri_path_recon')
+        self.assertEqual(FieldTable.field_name('mle_tlv_type'), 'mle.tlv.type')
+        with self.assertRaises(KeyError):
+            FieldTable.field_name('mle_tlv_active_tstamp')
+
+    def test_tlv_masks(self):
+        self.assertEqual(tlv_mask([]), 0)
+        self.assertEqual(tlv_mask([0, 1, 11]), 0b100000000011)
+        self.assertEqual(tlv_mask({1, 1, 1}), 0b10)
+
+        table = make_field_table([
+            tshark_line(1, mle_tlv_type='0,1,11'),
+            tshark_line(2, mle_tlv_type='0,1', thread_meshcop_tlv_type='53,12'),
+            tshark_line(3),
+        ])
+
+        self.assertEqual(table.column('mle.tlv.type'), [tlv_mask([0, 1, 11]), tlv_mask([0, 1]), 0])
+        self.assertEqual(table.column('thread_meshcop.tlv.type'), [0, tlv_mask([12, 53]), 0])
+        self.assertEqual(table.match_tlvs('mle.tlv.type', tlv_mask([0, 1])), [0, 1])
+        self.assertEqual(table.match_tlvs('mle.tlv.type', tlv_mask([11])), [0])
+        self.assertEqual(table.match_tlvs('mle.tlv.type', 0), [0, 1, 2])
+
+
+class TestPacketFilterCursor(unittest.TestCase):
+
+    def setUp(self):
+        pkts, table = make_mle_packets()
+        self.pkts = PacketFilter(pkts, field_table=table)
+
+    def test_must_next_sequence(self):
+        pkts = self.pkts
+        seq = pkts.must_next_sequence(
+            pkts.filter_mle_cmd(MLE_PARENT_RESPONSE),
+            lambda p: p.mle.cmd == MLE_CHILD_ID_REQUEST,
+            pkts.filter_fields(wpan_src64=ROUTER),
+        )
+
+        # each packet is searched from where the previous one is found
+        self.assertEqual([p.index for p in seq], [1, 4, 5])
+        self.assertEqual(pkts.index[0], 6)
+
+    def test_must_next_sequence_starts_from_index(self):
+        pkts = self.pkts
+        pkts.filter_mle_cmd(MLE_PARENT_RESPONSE).must_next()
+
+        seq = pkts.must_next_sequence(pkts.filter_mle_cmd(MLE_PARENT_REQUEST),
+                                      pkts.filter_mle_cmd(MLE_PARENT_RESPONSE))
+
+        self.assertEqual([p.index for p in seq], [2, 3])
+        self.assertEqual(pkts.index[0], 4)
+
+    def test_must_next_sequence_not_found(self):
+        pkts = self.pkts
+        with self.assertRaises(errors.PacketNotFound):
+            pkts.must_next_sequence(pkts.filter_mle_cmd(MLE_CHILD_ID_RESPONSE),
+                                    pkts.filter_mle_cmd(MLE_PARENT_REQUEST))
+
+    def test_must_next_sequence_not_cascaded(self):
+        pkts = self.pkts
+        with self.assertRaises(AssertionError):
+            pkts.must_next_sequence(pkts.filter_mle_cmd(MLE_PARENT_REQUEST, cascade=False))
+
+    def test_find_pair(self):
+        pkts = self.pkts
+        pkts.filter_mle_cmd(MLE_PARENT_REQUEST).must_next()
+
+        # the response is searched from where the request is found
+        req, rsp = pkts.must_find_pair(pkts.filter_mle_cmd(MLE_PARENT_REQUEST),
+                                       lambda p: p.wpan.src64 == ExtAddr(ROUTER))
+        self.assertEqual((req.index, rsp.index), (2, 3))
+        self.assertEqual(pkts.index[0], 4)
+
+    def test_find_pair_not_found(self):
+        pkts = self.pkts
+        self.assertIsNone(
+            pkts.find_pair(pkts.filter_mle_cmd(MLE_CHILD_ID_RESPONSE), pkts.filter_mle_cmd(MLE_CHILD_ID_REQUEST)))
+        with self.assertRaises(errors.PacketNotFound):
+            pkts.must_find_pair(pkts.filter_mle_cmd(MLE_CHILD_ID_RESPONSE), pkts.filter_mle_cmd(MLE_CHILD_ID_REQUEST))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -26,15 +26,57 @@
 #  ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 #  POSSIBILITY OF SUCH DAMAGE.
 #
+import functools
 import logging
 import os
 import sys
-from typing import Callable, Union
+from typing import Callable, Iterable, Union
 
 from pktverify.addrs import EthAddr, ExtAddr, Ipv6Addr
 from pktverify.bytes import Bytes
+from pktverify.consts import PKTVERIFY_TRACE
 from pktverify.null_field import nullField
 
+# The names other than the packet layers that can be used in filter strings
+_FILTER_NAMES = {
+    'Bytes': Bytes,
+    'ExtAddr': ExtAddr,
+    'Ipv6Addr': Ipv6Addr,
+    'EthAddr': EthAddr,
+    'null': nullField,
+}
+
+# The packet layers that can be used in filter strings
+_FILTER_LAYERS = frozenset({
+    'coap', 'wpan', 'mle', 'ipv6', 'lowpan', 'eth', 'icmpv6', 'udp', 'thread_bl', 'thread_meshcop', 'thread_nm',
+    'thread_nwd', 'thread_address', 'thread_bcn', 'dns'
+})
+
+
+class _FilterLocals(dict):
+    """
+    Represents the local names of a filter string evaluated on a packet.
+
+    The packet layers are looked up only when the filter string uses them, so that evaluating a filter string does
+    not create all the layers of every packet.
+    """
+
+    def __init__(self, p):
+        super().__init__(p=p)
+        self._p = p
+
+    def __missing__(self, name):
+        if name in _FILTER_LAYERS:
+            return getattr(self._p, name)
+
+        return _FILTER_NAMES[name]
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_filter(func: str):
+    """compile the filter string once for all filters using it"""
+    return compile('(\n' + func + '\n)', func, "eval")
+
 
 def make_filter_func(func: Union[str, Callable], **vars) -> Callable:
     """
@@ -47,34 +89,12 @@ def make_filter_func(func: Union[str, Callable], **vars) -> Callable:
     if isinstance(func, str):
         # if func is a string, compile it to a function
         func = func.format_map({k: repr(v) for k, v in vars.items()}).strip()
-        print("\t%s" % func, file=sys.stderr)
-        code = compile('(\n' + func + '\n)', func, "eval")
+        if PKTVERIFY_TRACE:
+            print("\t%s" % func, file=sys.stderr)
+        code = _compile_filter(func)
 
         def func(p):
-            return eval(
-                code, None, {
-                    'p': p,
-                    'coap': p.coap,
-                    'wpan': p.wpan,
-                    'mle': p.mle,
-                    'ipv6': p.ipv6,
-                    'lowpan': p.lowpan,
-                    'eth': p.eth,
-                    'icmpv6': p.icmpv6,
-                    'udp': p.udp,
-                    'thread_bl': p.thread_bl,
-                    'thread_meshcop': p.thread_meshcop,
-                    'Bytes': Bytes,
-                    'ExtAddr': ExtAddr,
-                    'Ipv6Addr': Ipv6Addr,
-                    'EthAddr': EthAddr,
-                    'thread_nm': p.thread_nm,
-                    'thread_nwd': p.thread_nwd,
-                    'thread_address': p.thread_address,
-                    'thread_bcn': p.thread_bcn,
-                    'dns': p.dns,
-                    'null': nullField,
-                })
+            return eval(code, None, _FilterLocals(p))
     else:
         assert not vars, 'can not provide vars for non-str filter: %r %r' % (func, vars)
 
@@ -158,3 +178,15 @@ def is_sublist(lst1: list, lst2: list) -> bool:
     :return: Whether lst1 is a slice of lst2.
     """
     return lst1 in [lst2[i:len(lst1) + i] for i in range(len(lst1))]
+
+
+def tlv_mask(tlv_types: Iterable[int]) -> int:
+    """ Convert TLV types to an integer bitmask which has the bit of each TLV type set
+
+    :param tlv_types: The TLV types.
+    :return: The TLV bitmask.
+    """
+    mask = 0
+    for t in tlv_types:
+        mask |= 1 << t
+    return mask
@@ -27,26 +27,38 @@
 #  POSSIBILITY OF SUCH DAMAGE.
 #
 
+import glob
 import importlib.util
 import inspect
 import json
 import logging
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 
-THREAD_CERT_DIR = './tests/scripts/thread-cert'
-sys.path.append(THREAD_CERT_DIR)
+# The directory of the test scripts, which is resolved from this file so that the scripts can be imported
+# regardless of the current working directory
+THREAD_CERT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if THREAD_CERT_DIR not in sys.path:
+    sys.path.append(THREAD_CERT_DIR)
 
 import thread_cert
 from pktverify.packet_verifier import PacketVerifier
 
+# The max number of processes which verify test cases in parallel
+MAX_JOBS = int(os.getenv('MAX_JOBS', os.cpu_count() or 1))
+
 logging.basicConfig(level=logging.INFO,
                     format='File "%(pathname)s", line %(lineno)d, in %(funcName)s\n'
                     '%(asctime)s - %(levelname)s - %(message)s')
 
 
-def main():
-    json_file = sys.argv[1]
+def verify(json_file: str):
+    """
+    Verify the packets of a test case.
+
+    :param json_file: The test info JSON file of the test case.
+    """
     with open(json_file, 'rt') as fp:
         test_info = json.load(fp)
 
@@ -57,9 +69,15 @@ def main():
     module_name = os.path.splitext(script)[0].replace('/', '.')
     logging.info("Loading %s as module %s ...", script, module_name)
 
-    spec = importlib.util.spec_from_file_location(module_name, os.path.join(THREAD_CERT_DIR, script))
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
+    # The test script is loaded by its file path because not all directories of test scripts are packages
+    # (e.g. backbone/). The loaded module is kept in sys.modules, so that it is loaded only once per process
+    # even if multiple test cases of the same script are verified.
+    mod = sys.modules.get(module_name)
+    if mod is None:
+        spec = importlib.util.spec_from_file_location(module_name, os.path.join(THREAD_CERT_DIR, script))
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        sys.modules[module_name] = mod
 
     test_class = None
 
@@ -79,5 +97,57 @@ def main():
     print("Packet verification passed: %s" % json_file, file=sys.stderr)
 
 
+def _is_test_info(json_file: str) -> bool:
+    try:
+        with open(json_file, 'rt') as fp:
+            test_info = json.load(fp)
+    except (OSError, ValueError):
+        return False
+
+    return isinstance(test_info, dict) and 'script' in test_info and 'pcap' in test_info
+
+
+def _find_json_files(paths):
+    """
+    Find the test info JSON files of the given paths.
+
+    :param paths: The test info JSON files, or directories (e.g. the run directory of the test suite) whose test
+                  info JSON files are all verified.
+    :return: The list of test info JSON files.
+    """
+    json_files = []
+    for path in paths:
+        if os.path.isdir(path):
+            json_files += filter(_is_test_info, sorted(glob.glob(os.path.join(path, '*.json'))))
+        else:
+            json_files.append(path)
+
+    return json_files
+
+
+def main():
+    json_files = _find_json_files(sys.argv[1:])
+    if not json_files:
+        sys.exit("no test info JSON files found: %s" % ' '.join(sys.argv[1:]))
+
+    if len(json_files) == 1:
+        verify(json_files[0])
+        return
+
+    # test cases are independent, so verify them in parallel processes
+    failed = []
+    with ProcessPoolExecutor(max_workers=max(1, min(MAX_JOBS, len(json_files)))) as executor:
+        futures = [(json_file, executor.submit(verify, json_file)) for json_file in json_files]
+        for json_file, future in futures:
+            try:
+                future.result()
+            except Exception:
+                logging.exception("Packet verification failed: %s", json_file)
+                failed.append(json_file)
+
+    if failed:
+        sys.exit("Packet verification failed: %s" % ', '.join(failed))
+
+
 if __name__ == '__main__':
     main()
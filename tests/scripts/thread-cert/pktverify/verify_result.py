@@ -27,8 +27,11 @@
 #  POSSIBILITY OF SUCH DAMAGE.
 #
 
-from pktverify.packet import Packet
-from pktverify.packet_filter import PacketFilter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pktverify.packet import Packet
+    from pktverify.packet_filter import PacketFilter
 
 
 class VerifyResult(object):
@@ -42,7 +45,7 @@ class VerifyResult(object):
         self._packet_indexes = {}
         self._seek_indexes = {}
 
-    def record_last(self, name: str, pkts: PacketFilter) -> None:
+    def record_last(self, name: str, pkts: 'PacketFilter') -> None:
         """
         Record the information of the last found packet.
 
@@ -63,7 +66,7 @@ class VerifyResult(object):
         """
         return self._packet_indexes[name]
 
-    def packet(self, name: str) -> Packet:
+    def packet(self, name: str) -> 'Packet':
         """
         Returns the recorded packet.
 
@@ -40,6 +40,8 @@ import config
 THREAD_VERSION = os.getenv('THREAD_VERSION')
 VIRTUAL_TIME = int(os.getenv('VIRTUAL_TIME', '1'))
 MAX_JOBS = int(os.getenv('MAX_JOBS', (multiprocessing.cpu_count() * 2 if VIRTUAL_TIME else 10)))
+# The interpreter to run the test scripts with (e.g. `pypy3`), instead of the one in their shebang lines
+CERT_PYTHON = os.getenv('CERT_PYTHON')
 
 _BACKBONE_TESTS_DIR = 'tests/scripts/thread-cert/backbone'
 
@@ -73,7 +75,7 @@ def run_cert(job_id: int, port_offset: int, script: str, run_directory: str):
             print(f'Running {test_name}')
             with open(logfile, 'wt') as output:
                 abs_script = os.path.abspath(script)
-                subprocess.check_call(abs_script,
+                subprocess.check_call([CERT_PYTHON, abs_script] if CERT_PYTHON else abs_script,
                                       stdout=output,
                                       stderr=output,
                                       stdin=subprocess.DEVNULL,
@@ -119,6 +121,7 @@ def parse_args():
 
     args = parser.parse_args()
     logging.info("Max jobs: %d", MAX_JOBS)
+    logging.info("Python: %s", CERT_PYTHON or "shebang")
     logging.info("Run directory: %s", args.run_directory or '.')
     logging.info("Multiply: %d", args.multiply)
     logging.info("Test scripts: %d", len(args.scripts))
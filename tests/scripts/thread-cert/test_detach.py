@@ -172,10 +172,10 @@ class TestDetach(thread_cert.TestCase):
         leader_rloc16 = pv.vars['Leader_RLOC16']
 
         pkts.filter_wpan_src64(child1).filter_mle_cmd(MLE_CHILD_UPDATE_REQUEST).filter_wpan_dst64(
-            router1).must_next().must_verify(lambda p: TIMEOUT_TLV in set(p.mle.tlv.type) and p.mle.tlv.timeout == 0)
+            router1).must_next().must_verify(lambda p: TIMEOUT_TLV in p.mle_tlv_types and p.mle.tlv.timeout == 0)
         pkts.filter_wpan_src64(router1).filter_coap_request(ADDR_REL_URI).filter_wpan_dst16(leader_rloc16).must_next()
         pkts.filter_wpan_src64(child1).filter_mle_cmd(MLE_CHILD_UPDATE_REQUEST).filter_wpan_dst64(
-            router1).must_next().must_verify(lambda p: TIMEOUT_TLV in set(p.mle.tlv.type) and p.mle.tlv.timeout == 0)
+            router1).must_next().must_verify(lambda p: TIMEOUT_TLV in p.mle_tlv_types and p.mle.tlv.timeout == 0)
         pkts.filter_wpan_src64(leader).filter_coap_request(ADDR_REL_URI).must_not_next()
         pkts.filter_wpan_src64(router1).filter_coap_request(ADDR_REL_URI).filter_wpan_dst16(leader_rloc16).must_next()
 
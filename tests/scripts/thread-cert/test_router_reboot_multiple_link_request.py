@@ -165,7 +165,7 @@ class Test_LeaderRebootMultipleLinkRequest(thread_cert.TestCase):
                                 TLV_REQUEST_TLV,
                                 ADDRESS16_TLV,
                                 ROUTE64_TLV
-                                } <= set(p.mle.tlv.type) and\
+                                } <= p.mle_tlv_types and\
                     p.mle.tlv.addr16 is nullField and\
                     p.mle.tlv.route64.id_mask is nullField
                     ).\